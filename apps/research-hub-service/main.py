@@ -12,7 +12,7 @@ from contextlib import asynccontextmanager
 
 from fastapi import FastAPI, HTTPException, Query, BackgroundTasks
 from fastapi.middleware.cors import CORSMiddleware
-from fastapi.responses import JSONResponse
+from fastapi.responses import JSONResponse, ORJSONResponse
 
 # Add project root to path for package imports
 root = Path(__file__).parent.parent.parent
@@ -69,6 +69,7 @@ app = FastAPI(
     description="Unified research platform for branding and marketing intelligence",
     version="1.0.0",
     lifespan=lifespan,
+    default_response_class=ORJSONResponse,
 )
 
 # CORS
@@ -85,10 +86,15 @@ app.add_middleware(
 # DEPENDENCIES
 # =============================================================================
 
+_orchestrator: Optional[ResearchOrchestrator] = None
+
+
 def get_orchestrator() -> ResearchOrchestrator:
-    """Get research orchestrator with repository."""
-    repository = ResearchRepository()
-    return ResearchOrchestrator(repository=repository)
+    """Get the shared research orchestrator with repository."""
+    global _orchestrator
+    if _orchestrator is None:
+        _orchestrator = ResearchOrchestrator(repository=ResearchRepository())
+    return _orchestrator
 
 
 def get_repository() -> ResearchRepository:
@@ -152,7 +158,7 @@ async def get_agent_info(agent_type: str):
         )
 
     orchestrator = get_orchestrator()
-    agent = orchestrator.agents.get(research_type)
+    agent = orchestrator.get_agent(research_type)
 
     if not agent:
         raise HTTPException(status_code=404, detail="Agent not found")
@@ -221,6 +227,7 @@ async def list_research(
     status: Optional[str] = Query(None),
     limit: int = Query(50, le=100),
     offset: int = Query(0),
+    cursor: Optional[str] = Query(None, description="next_cursor from the previous page"),
 ):
     """List research entries with optional filters."""
     repo = get_repository()
@@ -238,18 +245,20 @@ async def list_research(
         if status:
             status_filter = ResearchStatus(status)
 
-        entries = await repo.list_by_project(
+        entries, next_cursor = await repo.list_page(
             project_id=project_id or "default",
             research_types=research_types,
             status=status_filter,
             limit=limit,
             offset=offset,
+            cursor=cursor,
         )
 
         return {
             "success": True,
             "count": len(entries),
             "research": [e.to_dict() for e in entries],
+            "next_cursor": next_cursor,
         }
 
     except Exception as e:
@@ -337,6 +346,7 @@ async def list_project_research(
     research_type: Optional[str] = Query(None),
     limit: int = Query(50, le=100),
     offset: int = Query(0),
+    cursor: Optional[str] = Query(None, description="next_cursor from the previous page"),
 ):
     """List all research for a specific project."""
     repo = get_repository()
@@ -348,11 +358,12 @@ async def list_project_research(
     if research_type:
         research_types = [ResearchType(research_type)]
 
-    entries = await repo.list_by_project(
+    entries, next_cursor = await repo.list_page(
         project_id=project_id,
         research_types=research_types,
         limit=limit,
         offset=offset,
+        cursor=cursor,
     )
 
     return {
@@ -360,6 +371,7 @@ async def list_project_research(
         "project_id": project_id,
         "count": len(entries),
         "research": [e.to_dict() for e in entries],
+        "next_cursor": next_cursor,
     }
 
 
@@ -0,0 +1,87 @@
+#!/usr/bin/env python3
+"""
+Backfill the `_tokens` search field on stored ads or research entries.
+
+Whole-word searches (search_stored_ads and FirestoreClient.search with
+whole_words=True) narrow on `_tokens`, so documents stored before it
+existed never match them; this writes the field onto them.
+
+Usage:
+    python backfill_search_tokens.py
+    python backfill_search_tokens.py --research
+    python backfill_search_tokens.py --dry-run
+"""
+
+import argparse
+import sys
+import os
+
+# Add src (and packages, for the research_hub package) to path
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', 'src'))
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', '..'))
+
+from services.ad_library_service import AdLibraryService, _search_tokens
+
+# Firestore caps a write batch at 500 operations
+BATCH_SIZE = 500
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Backfill _tokens on stored documents")
+    parser.add_argument("--research", action="store_true",
+                        help="Backfill research entries instead of ads")
+    parser.add_argument("--dry-run", action="store_true", help="Count documents without writing")
+
+    args = parser.parse_args()
+
+    service = AdLibraryService()
+    if not service.firestore:
+        print("❌ Error: Firestore is not available")
+        return
+
+    if args.research:
+        from research_hub.src.storage.firestore_client import (
+            FirestoreClient, _SEARCH_FIELDS, _search_tokens as research_tokens,
+        )
+        collection = service.firestore.collection(FirestoreClient.COLLECTION_NAME)
+        fields = list(_SEARCH_FIELDS)
+        tokens_for = research_tokens
+        label = "research entries"
+    else:
+        collection = service.firestore.collection("ad_library")
+        fields = ["page_name", "body"]
+        tokens_for = lambda data: _search_tokens(data.get("page_name"), data.get("body"))
+        label = "ads"
+
+    batch = service.firestore.batch()
+    pending = 0
+    updated = 0
+
+    for doc in collection.select([*fields, "_tokens"]).stream():
+        data = doc.to_dict()
+        if "_tokens" in data:
+            continue
+
+        updated += 1
+        if args.dry_run:
+            continue
+
+        batch.update(
+            collection.document(doc.id),
+            {"_tokens": tokens_for(data)},
+        )
+        pending += 1
+        if pending == BATCH_SIZE:
+            batch.commit()
+            batch = service.firestore.batch()
+            pending = 0
+
+    if pending:
+        batch.commit()
+
+    action = "Would update" if args.dry_run else "Updated"
+    print(f"✅ {action} {updated} {label}")
+
+
+if __name__ == "__main__":
+    main()
@@ -8,7 +8,12 @@ from typing import Dict, Any, List
 
 from .base_agent import BaseResearchAgent
 from ..models import ResearchType, ResearchInput, ResearchResult, ResearchStatus, ResearchSource
-from ..tools import MetaAdsLibraryTool
+from ..tools import (
+    MetaAdsLibraryTool,
+    AsyncMetaAdsLibraryTool,
+    competitor_analysis,
+    creative_analysis,
+)
 import time
 
 
@@ -36,6 +41,11 @@ class AdsResearchAgent(BaseResearchAgent):
         "targeting_insights",
         "recommendations",
     ]
+    context_keys = (
+        ("platforms", "Platforms", ", ".join),
+        ("countries", "Countries", ", ".join),
+        ("industry", "Industry", str),
+    )
 
     def __init__(self, *args, **kwargs):
         super().__init__(*args, **kwargs)
@@ -43,14 +53,7 @@ class AdsResearchAgent(BaseResearchAgent):
 
     def get_research_prompt(self, input: ResearchInput) -> str:
         """Generate the ads research prompt."""
-        context_str = ""
-        if input.context:
-            if "platforms" in input.context:
-                context_str += f"Platforms: {', '.join(input.context['platforms'])}\n"
-            if "countries" in input.context:
-                context_str += f"Countries: {', '.join(input.context['countries'])}\n"
-            if "industry" in input.context:
-                context_str += f"Industry: {input.context['industry']}\n"
+        context_str = self._render_context(input)
 
         # Get Meta Ads data if available
         meta_ads_context = ""
@@ -165,17 +168,26 @@ Focus on patterns and strategies that can inform ad creative development.
         # Fetch data from Meta Ad Library
         meta_data = {}
         if self.meta_ads_tool.is_configured:
-            # Get competitor ads
-            competitor_data = self.meta_ads_tool.search_competitor_ads(
-                competitor_name=input.query,
-                countries=countries,
-            )
-
-            # Get creative analysis
-            creative_data = self.meta_ads_tool.analyze_ad_creative(
-                search_terms=input.query,
-                countries=countries,
-            )
+            # Competitor and creative analysis run the same Graph query, so
+            # fetch the ads once and analyze them both ways
+            tool = self.meta_ads_tool
+            async with AsyncMetaAdsLibraryTool(
+                access_token=tool.access_token,
+                app_id=tool.app_id,
+                app_secret=tool.app_secret,
+            ) as async_tool:
+                ads_result = await async_tool.search_ads_all(
+                    search_terms=input.query,
+                    countries=countries,
+                    max_ads=100,
+                )
+
+            if "error" in ads_result:
+                competitor_data = creative_data = ads_result
+            else:
+                ads = ads_result.get("ads", [])
+                competitor_data = competitor_analysis(input.query, ads)
+                creative_data = creative_analysis(input.query, ads)
 
             if "error" not in competitor_data:
                 meta_data["competitor"] = competitor_data
@@ -33,17 +33,15 @@ class AudienceAgent(BaseResearchAgent):
         "pain_points",
         "personas",
     ]
+    context_keys = (
+        ("product_category", "Product Category", str),
+        ("region", "Geographic Focus", str),
+        ("existing_customers", "Existing Customer Info", str),
+    )
 
     def get_research_prompt(self, input: ResearchInput) -> str:
         """Generate the audience research prompt."""
-        context_str = ""
-        if input.context:
-            if "product_category" in input.context:
-                context_str += f"Product Category: {input.context['product_category']}\n"
-            if "region" in input.context:
-                context_str += f"Geographic Focus: {input.context['region']}\n"
-            if "existing_customers" in input.context:
-                context_str += f"Existing Customer Info: {input.context['existing_customers']}\n"
+        context_str = self._render_context(input)
 
         return f"""
 You are a consumer insights researcher specializing in audience analysis and persona development.
@@ -8,7 +8,7 @@ import os
 import json
 import time
 from abc import ABC, abstractmethod
-from typing import Dict, Any, Optional, List
+from typing import Dict, Any, Optional, List, Tuple, Callable
 from datetime import datetime
 
 import vertexai
@@ -37,6 +37,7 @@ class BaseResearchAgent(ABC):
 
     Each specialized agent inherits from this and implements:
     - get_research_prompt(): Returns the research prompt template
+      (agents that fetch data for it override build_research_prompt())
     - get_output_schema(): Returns the expected output schema
     - parse_analysis(): Parses the model response into structured data
     """
@@ -47,6 +48,8 @@ class BaseResearchAgent(ABC):
     agent_description: str
     required_tools: List[str] = ["google_search"]
     output_fields: List[str] = []
+    # (context key, prompt label, value formatter) rendered by _render_context
+    context_keys: Tuple[Tuple[str, str, Callable[[Any], str]], ...] = ()
 
     def __init__(
         self,
@@ -113,6 +116,23 @@ class BaseResearchAgent(ABC):
         """
         pass
 
+    def _render_context(self, input: ResearchInput) -> str:
+        """
+        Render the agent's context_keys from input.context as prompt lines.
+
+        Returns an empty string when no declared key is present.
+        """
+        ctx = input.context
+        if not ctx:
+            return ""
+
+        parts = [
+            f"{label}: {fmt(ctx[key])}"
+            for key, label, fmt in self.context_keys
+            if key in ctx
+        ]
+        return "\n".join(parts) + "\n" if parts else ""
+
     @abstractmethod
     def get_output_schema(self) -> Dict[str, Any]:
         """
@@ -123,6 +143,29 @@ class BaseResearchAgent(ABC):
         """
         pass
 
+    def get_output_schema_json(self) -> str:
+        """
+        Return the output schema serialized for embedding in prompts.
+
+        Schemas are static per agent class, so the JSON is built on first
+        use and cached on the class.
+        """
+        return self._cached_schema()[0]
+
+    def _output_schema_keys(self) -> Tuple[str, ...]:
+        """Top-level output schema keys, cached on the class."""
+        return self._cached_schema()[1]
+
+    def _cached_schema(self) -> Tuple[str, Tuple[str, ...]]:
+        """Build (schema_json, top_level_keys) once per agent class."""
+        cls = type(self)
+        cached = cls.__dict__.get("_schema_cache")
+        if cached is None:
+            schema = self.get_output_schema()
+            cached = (json.dumps(schema, indent=2), tuple(schema))
+            cls._schema_cache = cached
+        return cached
+
     def parse_analysis(self, response_text: str) -> Dict[str, Any]:
         """
         Parse the model response into structured data.
@@ -139,23 +182,21 @@ class BaseResearchAgent(ABC):
 
     def _parse_json_response(self, response_text: str) -> Dict[str, Any]:
         """Parse JSON from model response, handling markdown code blocks."""
-        try:
-            return json.loads(response_text)
-        except json.JSONDecodeError:
-            text = response_text.strip()
-
-            # Remove markdown code blocks
-            if text.startswith("```json"):
-                text = text[7:]
-            elif text.startswith("```"):
-                text = text[3:]
-            if text.endswith("```"):
-                text = text[:-3]
-
+        text = response_text.strip()
+        if text[:1] == "{":
+            # Common case: bare JSON, nothing to strip
             try:
-                return json.loads(text.strip())
+                return json.loads(text)
             except json.JSONDecodeError:
-                return {"raw_response": response_text, "parse_error": True}
+                pass
+
+        # Remove markdown code blocks (also a stray closing fence after {...})
+        text = text.removeprefix("```json").removeprefix("```").removesuffix("```").strip()
+
+        try:
+            return json.loads(text)
+        except json.JSONDecodeError:
+            return {"raw_response": response_text, "parse_error": True}
 
     def _extract_sources(self, response) -> List[ResearchSource]:
         """Extract sources from grounding metadata."""
@@ -179,11 +220,20 @@ class BaseResearchAgent(ABC):
 
         return sources
 
-    def _build_full_prompt(self, input: ResearchInput) -> str:
+    async def build_research_prompt(self, input: ResearchInput) -> str:
+        """
+        Build the research prompt, awaiting any data it needs.
+
+        Defaults to get_research_prompt(); agents that call external APIs
+        for prompt data fetch it here so the event loop is never blocked.
+        """
+        return self.get_research_prompt(input)
+
+    def _build_full_prompt(self, input: ResearchInput, base_prompt: Optional[str] = None) -> str:
         """Build the complete prompt with schema and RAG context."""
-        base_prompt = self.get_research_prompt(input)
-        schema = self.get_output_schema()
-        schema_str = json.dumps(schema, indent=2)
+        if base_prompt is None:
+            base_prompt = self.get_research_prompt(input)
+        schema_str = self.get_output_schema_json()
 
         # Add RAG context if available
         rag_context = ""
@@ -225,14 +275,14 @@ Requirements:
         if "parse_error" in analysis_data:
             return 0.0
 
-        schema = self.get_output_schema()
-        if not schema:
+        schema_keys = self._output_schema_keys()
+        if not schema_keys:
             return 0.5
 
-        total_fields = len(schema)
+        total_fields = len(schema_keys)
         filled_fields = 0
 
-        for key in schema:
+        for key in schema_keys:
             value = analysis_data.get(key)
             if value is not None:
                 if isinstance(value, (list, dict)):
@@ -274,7 +324,7 @@ Requirements:
 
         try:
             # Build prompt
-            prompt = self._build_full_prompt(input)
+            prompt = self._build_full_prompt(input, await self.build_research_prompt(input))
 
             if agent_trace:
                 agent_trace["steps"].append({
@@ -374,6 +424,21 @@ Requirements:
 
         return "; ".join(summary_parts) if summary_parts else "Analysis completed"
 
+    @staticmethod
+    def _safe_get(data: Any, *keys: str, default: Any = None) -> Any:
+        """
+        Walk nested dicts by key without allocating intermediate defaults.
+
+        Returns `default` as soon as a level is missing or not a dict.
+        """
+        for key in keys:
+            if not isinstance(data, dict):
+                return default
+            data = data.get(key)
+            if data is None:
+                return default
+        return data
+
     def get_agent_info(self) -> Dict[str, Any]:
         """Get information about this agent."""
         return {
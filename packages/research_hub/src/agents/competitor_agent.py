@@ -34,17 +34,15 @@ class CompetitorAgent(BaseResearchAgent):
         "marketing_channels",
         "key_differentiators",
     ]
+    context_keys = (
+        ("industry", "Industry", str),
+        ("region", "Region", str),
+        ("target_audience", "Target Audience", str),
+    )
 
     def get_research_prompt(self, input: ResearchInput) -> str:
         """Generate the competitor research prompt."""
-        context_str = ""
-        if input.context:
-            if "industry" in input.context:
-                context_str += f"Industry: {input.context['industry']}\n"
-            if "region" in input.context:
-                context_str += f"Region: {input.context['region']}\n"
-            if "target_audience" in input.context:
-                context_str += f"Target Audience: {input.context['target_audience']}\n"
+        context_str = self._render_context(input)
 
         return f"""
 You are a competitive intelligence analyst specializing in market research.
@@ -34,17 +34,15 @@ class MarketAgent(BaseResearchAgent):
         "entry_barriers",
         "opportunities",
     ]
+    context_keys = (
+        ("region", "Geographic Focus", str),
+        ("timeframe", "Timeframe", str),
+        ("segment", "Market Segment", str),
+    )
 
     def get_research_prompt(self, input: ResearchInput) -> str:
         """Generate the market analysis prompt."""
-        context_str = ""
-        if input.context:
-            if "region" in input.context:
-                context_str += f"Geographic Focus: {input.context['region']}\n"
-            if "timeframe" in input.context:
-                context_str += f"Timeframe: {input.context['timeframe']}\n"
-            if "segment" in input.context:
-                context_str += f"Market Segment: {input.context['segment']}\n"
+        context_str = self._render_context(input)
 
         return f"""
 You are a market research analyst specializing in industry analysis and market sizing.
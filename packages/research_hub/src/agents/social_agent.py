@@ -33,17 +33,15 @@ class SocialMediaAgent(BaseResearchAgent):
         "content_performance",
         "sentiment_analysis",
     ]
+    context_keys = (
+        ("platforms", "Platforms to Focus", ", ".join),
+        ("competitors", "Competitors to Include", ", ".join),
+        ("timeframe", "Timeframe", str),
+    )
 
     def get_research_prompt(self, input: ResearchInput) -> str:
         """Generate the social media intelligence prompt."""
-        context_str = ""
-        if input.context:
-            if "platforms" in input.context:
-                context_str += f"Platforms to Focus: {', '.join(input.context['platforms'])}\n"
-            if "competitors" in input.context:
-                context_str += f"Competitors to Include: {', '.join(input.context['competitors'])}\n"
-            if "timeframe" in input.context:
-                context_str += f"Timeframe: {input.context['timeframe']}\n"
+        context_str = self._render_context(input)
 
         return f"""
 You are a social media analyst specializing in brand intelligence and digital presence analysis.
@@ -142,20 +140,21 @@ Include specific metrics and examples where possible.
     def _generate_summary(self, analysis_data: Dict[str, Any]) -> str:
         """Generate a summary from social analysis."""
         summary_parts = []
+        get = self._safe_get
 
-        presence = analysis_data.get("brand_presence", {})
-        platforms = presence.get("platforms", [])
+        platforms = get(analysis_data, "brand_presence", "platforms")
         if platforms:
             summary_parts.append(f"Presence on {len(platforms)} platforms")
 
-        sentiment = analysis_data.get("sentiment_analysis", {})
-        if sentiment.get("overall_sentiment"):
-            summary_parts.append(f"Overall sentiment: {sentiment['overall_sentiment']}")
+        overall_sentiment = get(analysis_data, "sentiment_analysis", "overall_sentiment")
+        if overall_sentiment:
+            summary_parts.append(f"Overall sentiment: {overall_sentiment}")
 
-        influencers = analysis_data.get("influencer_landscape", {})
-        macro = influencers.get("macro_influencers", [])
-        micro = influencers.get("micro_influencers", [])
-        total_influencers = len(macro) + len(micro)
+        influencers = get(analysis_data, "influencer_landscape", default={})
+        total_influencers = (
+            len(influencers.get("macro_influencers") or ())
+            + len(influencers.get("micro_influencers") or ())
+        )
         if total_influencers > 0:
             summary_parts.append(f"{total_influencers} relevant influencers identified")
 
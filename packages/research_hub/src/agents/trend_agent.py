@@ -4,7 +4,7 @@ Trend Analysis Agent.
 Analyzes industry trends, viral content patterns, and emerging topics.
 """
 
-from typing import Dict, Any
+from typing import Dict, Any, Optional
 
 from .base_agent import BaseResearchAgent
 from ..models import ResearchType, ResearchInput
@@ -34,28 +34,31 @@ class TrendAgent(BaseResearchAgent):
         "seasonal_patterns",
         "technology_trends",
     ]
+    context_keys = (
+        ("industry", "Industry", str),
+        ("timeframe", "Timeframe", str),
+        ("region", "Region", str),
+    )
 
     def __init__(self, *args, **kwargs):
         super().__init__(*args, **kwargs)
         self.youtube_tool = YouTubeTool()
 
-    def get_research_prompt(self, input: ResearchInput) -> str:
+    async def build_research_prompt(self, input: ResearchInput) -> str:
+        """Fetch YouTube trend data off the event loop, then build the prompt."""
+        trends = None
+        if self.youtube_tool.is_configured:
+            trends = await self.youtube_tool.analyze_video_trends_async(input.query, max_videos=15)
+        return self.get_research_prompt(input, trends)
+
+    def get_research_prompt(self, input: ResearchInput, trends: Optional[Dict[str, Any]] = None) -> str:
         """Generate the trend analysis prompt."""
-        context_str = ""
-        if input.context:
-            if "industry" in input.context:
-                context_str += f"Industry: {input.context['industry']}\n"
-            if "timeframe" in input.context:
-                context_str += f"Timeframe: {input.context['timeframe']}\n"
-            if "region" in input.context:
-                context_str += f"Region: {input.context['region']}\n"
-
-        # Get YouTube trend data if available
+        context_str = self._render_context(input)
+
+        # YouTube data fetched by build_research_prompt, if any
         youtube_context = ""
-        if self.youtube_tool.is_configured:
-            trends = self.youtube_tool.analyze_video_trends(input.query, max_videos=15)
-            if "error" not in trends:
-                youtube_context = f"""
+        if trends and "error" not in trends:
+            youtube_context = f"""
 YouTube Trend Data:
 - Videos Analyzed: {trends.get('videos_analyzed', 0)}
 - Total Views: {trends.get('total_views', 0):,}
@@ -161,19 +164,20 @@ Focus on actionable insights and specific examples.
     def _generate_summary(self, analysis_data: Dict[str, Any]) -> str:
         """Generate a summary from trend analysis."""
         summary_parts = []
+        get = self._safe_get
 
-        industry = analysis_data.get("industry_trends", {})
-        macro = industry.get("macro_trends", [])
+        macro = get(analysis_data, "industry_trends", "macro_trends")
         if macro:
             summary_parts.append(f"{len(macro)} macro trends identified")
 
-        emerging = analysis_data.get("emerging_topics", [])
+        emerging = analysis_data.get("emerging_topics")
         if emerging:
-            high_opp = [e for e in emerging if e.get("opportunity_level") == "High"]
-            summary_parts.append(f"{len(high_opp)} high-opportunity emerging topics")
+            high_opp_count = sum(
+                1 for e in emerging if get(e, "opportunity_level") == "High"
+            )
+            summary_parts.append(f"{high_opp_count} high-opportunity emerging topics")
 
-        viral = analysis_data.get("viral_patterns", {})
-        formats = viral.get("content_formats", [])
+        formats = get(analysis_data, "viral_patterns", "content_formats")
         if formats:
             summary_parts.append(f"{len(formats)} viral content formats analyzed")
 
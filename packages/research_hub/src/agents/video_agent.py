@@ -4,7 +4,7 @@ Video/Ad Analysis Agent.
 Analyzes competitor videos, ad styles, messaging, and creative patterns.
 """
 
-from typing import Dict, Any
+from typing import Dict, Any, Optional
 
 from .base_agent import BaseResearchAgent
 from ..models import ResearchType, ResearchInput
@@ -34,28 +34,31 @@ class VideoAdAgent(BaseResearchAgent):
         "engagement_patterns",
         "creative_recommendations",
     ]
+    context_keys = (
+        ("platform", "Platform Focus", str),
+        ("ad_type", "Ad Type", str),
+        ("industry", "Industry", str),
+    )
 
     def __init__(self, *args, **kwargs):
         super().__init__(*args, **kwargs)
         self.youtube_tool = YouTubeTool()
 
-    def get_research_prompt(self, input: ResearchInput) -> str:
+    async def build_research_prompt(self, input: ResearchInput) -> str:
+        """Fetch YouTube trend data off the event loop, then build the prompt."""
+        trends = None
+        if self.youtube_tool.is_configured:
+            trends = await self.youtube_tool.analyze_video_trends_async(input.query, max_videos=10)
+        return self.get_research_prompt(input, trends)
+
+    def get_research_prompt(self, input: ResearchInput, trends: Optional[Dict[str, Any]] = None) -> str:
         """Generate the video/ad analysis prompt."""
-        context_str = ""
-        if input.context:
-            if "platform" in input.context:
-                context_str += f"Platform Focus: {input.context['platform']}\n"
-            if "ad_type" in input.context:
-                context_str += f"Ad Type: {input.context['ad_type']}\n"
-            if "industry" in input.context:
-                context_str += f"Industry: {input.context['industry']}\n"
-
-        # Get YouTube data if available
+        context_str = self._render_context(input)
+
+        # YouTube data fetched by build_research_prompt, if any
         youtube_context = ""
-        if self.youtube_tool.is_configured:
-            trends = self.youtube_tool.analyze_video_trends(input.query, max_videos=10)
-            if "error" not in trends:
-                youtube_context = f"""
+        if trends and "error" not in trends:
+            youtube_context = f"""
 YouTube Research Data:
 - Videos Analyzed: {trends.get('videos_analyzed', 0)}
 - Average Views: {trends.get('average_views', 0):,}
@@ -146,17 +149,17 @@ Focus on patterns that drive engagement and conversion.
     def _generate_summary(self, analysis_data: Dict[str, Any]) -> str:
         """Generate a summary from video analysis."""
         summary_parts = []
+        get = self._safe_get
 
-        styles = analysis_data.get("video_styles", {})
-        if styles.get("formats"):
-            summary_parts.append(f"{len(styles['formats'])} video formats analyzed")
+        formats = get(analysis_data, "video_styles", "formats")
+        if formats:
+            summary_parts.append(f"{len(formats)} video formats analyzed")
 
-        messaging = analysis_data.get("messaging_themes", {})
-        if messaging.get("emotional_hooks"):
-            summary_parts.append(f"{len(messaging['emotional_hooks'])} emotional hooks identified")
+        hooks = get(analysis_data, "messaging_themes", "emotional_hooks")
+        if hooks:
+            summary_parts.append(f"{len(hooks)} emotional hooks identified")
 
-        recs = analysis_data.get("creative_recommendations", {})
-        quick_wins = recs.get("quick_wins", [])
+        quick_wins = get(analysis_data, "creative_recommendations", "quick_wins")
         if quick_wins:
             summary_parts.append(f"{len(quick_wins)} quick wins recommended")
 
@@ -5,30 +5,39 @@ Run:
     uvicorn src.api.main:app --reload --port 8000
 """
 
-from fastapi import FastAPI, HTTPException, BackgroundTasks
+from fastapi import FastAPI, HTTPException, BackgroundTasks, Depends
 from fastapi.middleware.cors import CORSMiddleware
+from fastapi.responses import ORJSONResponse, StreamingResponse
 from pydantic import BaseModel
+from functools import cache
 from typing import List, Optional
 import os
 import sys
+import threading
+
+import orjson
+from cachetools import TTLCache
 
 sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..'))
 
+from config import CORS_ORIGINS
 from services.ad_library_service import AdLibraryScraper
-from services.video_downloader import VideoDownloader, VideoCollectionService
+from services.video_downloader import VideoDownloader, VideoCollectionService, _delete_local_file
 from services.search_service import AdSearchService
 
 app = FastAPI(
     title="Research Hub API",
     description="Search and download video ads from Meta Ad Library",
     version="1.0.0",
+    default_response_class=ORJSONResponse,
 )
 
-# CORS for UI
+# CORS for UI - origins come from CORS_ORIGINS; credentials are only allowed
+# for an explicit origin list since browsers reject them with a wildcard.
 app.add_middleware(
     CORSMiddleware,
-    allow_origins=["*"],
-    allow_credentials=True,
+    allow_origins=CORS_ORIGINS,
+    allow_credentials="*" not in CORS_ORIGINS,
     allow_methods=["*"],
     allow_headers=["*"],
 )
@@ -37,13 +46,18 @@ app.add_middleware(
 scraper = AdLibraryScraper()
 downloader = VideoDownloader()
 search_service = AdSearchService()
-collection_service = None
 
-def get_collection_service():
-    global collection_service
-    if collection_service is None:
-        collection_service = VideoCollectionService()
-    return collection_service
+# Short-lived cache for GET /api/videos/{video_id} - absorbs UI polling.
+# Entries are dropped on delete; other writers may be up to 30s stale.
+# TTLCache is not thread-safe and the sync endpoints run on the threadpool,
+# so every access goes through _video_cache_lock.
+_video_cache: TTLCache = TTLCache(maxsize=4096, ttl=30)
+_video_cache_lock = threading.Lock()
+
+@cache
+def get_collection_service() -> VideoCollectionService:
+    """Lazily build the shared collection service (endpoint dependency)."""
+    return VideoCollectionService()
 
 
 # Request/Response models
@@ -61,6 +75,9 @@ class SearchRequest(BaseModel):
 
     sort_by: str = "newest"  # newest, oldest
 
+    # Stream ads as NDJSON (one JSON object per line) - use for large limits
+    stream: bool = False
+
 
 class DownloadRequest(BaseModel):
     video_url: str
@@ -94,7 +111,30 @@ def search_ads_endpoint(req: SearchRequest):
     - media_type: "video", "image", "meme" or null for all
     - active_status: "active", "inactive", "all"
     - sort_by: "newest" or "oldest"
+
+    Set stream=true to receive ads as application/x-ndjson, one ad per line.
     """
+    if req.stream:
+        try:
+            ads = search_service.search_iter(
+                query=req.query,
+                country=req.country,
+                limit=req.limit,
+                language=req.language,
+                advertiser=req.advertiser,
+                platform=req.platform,
+                media_type=req.media_type,
+                active_status=req.active_status,
+                sort_by=req.sort_by,
+            )
+        except RuntimeError as e:
+            raise HTTPException(status_code=500, detail=str(e))
+
+        return StreamingResponse(
+            (orjson.dumps(ad) + b"\n" for ad in ads),
+            media_type="application/x-ndjson",
+        )
+
     result = search_service.search(
         query=req.query,
         country=req.country,
@@ -133,14 +173,16 @@ def download_video(req: DownloadRequest):
 
 
 @app.post("/api/collect")
-def collect_videos(req: CollectRequest, background_tasks: BackgroundTasks):
+def collect_videos(
+    req: CollectRequest,
+    background_tasks: BackgroundTasks,
+    service: VideoCollectionService = Depends(get_collection_service),
+):
     """
     Collect and download videos for keywords.
 
     Runs in background, returns job ID.
     """
-    service = get_collection_service()
-
     # Run in background for large collections
     if len(req.keywords) > 1 or req.max_per_keyword > 20:
         # For now, run synchronously (can add background later)
@@ -164,12 +206,14 @@ def collect_videos(req: CollectRequest, background_tasks: BackgroundTasks):
 
 
 @app.get("/api/videos")
-def list_videos(project_id: str = "default", limit: int = 50):
+def list_videos(
+    project_id: str = "default",
+    limit: int = 50,
+    service: VideoCollectionService = Depends(get_collection_service),
+):
     """
     List downloaded videos from Firestore.
     """
-    service = get_collection_service()
-
     if service.firestore:
         docs = service.firestore.collection("videos").where(
             "project_id", "==", project_id
@@ -185,7 +229,7 @@ def list_videos(project_id: str = "default", limit: int = 50):
                 "status": d.get("status"),
                 "file_path": d.get("local_path") or d.get("stored_url"),
                 "file_size": d.get("file_size"),
-                "created_at": str(d.get("created_at")),
+                "created_at": d.get("created_at"),
             })
 
         return {"total": len(videos), "videos": videos}
@@ -194,39 +238,49 @@ def list_videos(project_id: str = "default", limit: int = 50):
 
 
 @app.get("/api/videos/{video_id}")
-def get_video(video_id: str):
+def get_video(
+    video_id: str,
+    service: VideoCollectionService = Depends(get_collection_service),
+):
     """
     Get video details by ID.
     """
-    service = get_collection_service()
+    with _video_cache_lock:
+        cached = _video_cache.get(video_id)
+    if cached is not None:
+        return cached
 
     if service.firestore:
         doc = service.firestore.collection("videos").document(video_id).get()
         if doc.exists:
-            return doc.to_dict()
+            data = doc.to_dict()
+            with _video_cache_lock:
+                _video_cache[video_id] = data
+            return data
 
     raise HTTPException(status_code=404, detail="Video not found")
 
 
 @app.delete("/api/videos/{video_id}")
-def delete_video(video_id: str):
+def delete_video(
+    video_id: str,
+    service: VideoCollectionService = Depends(get_collection_service),
+):
     """
     Delete a video (from Firestore and disk).
     """
-    service = get_collection_service()
-
     if service.firestore:
-        doc = service.firestore.collection("videos").document(video_id).get()
+        doc_ref = service.firestore.collection("videos").document(video_id)
+        doc = doc_ref.get(field_paths=["local_path"])
         if doc.exists:
-            data = doc.to_dict()
-
-            # Delete file
-            local_path = data.get("local_path")
-            if local_path and os.path.exists(local_path.replace("file://", "")):
-                os.remove(local_path.replace("file://", ""))
+            # Delete file, unless a reused download still points at it
+            local_path = (doc.to_dict() or {}).get("local_path")
+            _delete_local_file(service.firestore, video_id, local_path)
 
             # Delete from Firestore
-            service.firestore.collection("videos").document(video_id).delete()
+            doc_ref.delete()
+            with _video_cache_lock:
+                _video_cache.pop(video_id, None)
 
             return {"status": "deleted", "video_id": video_id}
 
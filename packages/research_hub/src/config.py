@@ -6,86 +6,143 @@ cloud-native configuration pattern.
 """
 
 import os
+from functools import lru_cache
+from dataclasses import dataclass, field
 from typing import Dict, List
 
 
-# =============================================================================
-# GOOGLE CLOUD CONFIGURATION
-# =============================================================================
-
-GOOGLE_CLOUD_PROJECT = os.environ.get('GOOGLE_CLOUD_PROJECT', '')
-VERTEX_AI_LOCATION = os.environ.get('VERTEX_AI_LOCATION', 'us-central1')
-
-# =============================================================================
-# FIRESTORE CONFIGURATION
-# =============================================================================
-
-# Firestore uses the same GOOGLE_CLOUD_PROJECT
-# Collection name for research entries
-FIRESTORE_COLLECTION = os.environ.get('FIRESTORE_COLLECTION', 'research_hub_entries')
-
-# =============================================================================
-# MODEL CONFIGURATION
-# =============================================================================
-
-# Default model for research agents
-DEFAULT_MODEL = os.environ.get('RESEARCH_HUB_MODEL', 'gemini-2.0-flash-001')
-
-# Advanced model for complex analysis (optional upgrade)
-ADVANCED_MODEL = os.environ.get('RESEARCH_HUB_ADVANCED_MODEL', 'gemini-1.5-pro-002')
-
-# =============================================================================
-# YOUTUBE API CONFIGURATION
-# =============================================================================
-
-YOUTUBE_API_KEY = os.environ.get('YOUTUBE_API_KEY', '')
-
-# =============================================================================
-# META (FACEBOOK/INSTAGRAM) ADS API CONFIGURATION
-# =============================================================================
-
-# Option 1: Use a long-lived access token (recommended for production)
-META_ACCESS_TOKEN = os.environ.get('META_ACCESS_TOKEN', '')
+def _env(name: str, default: str = '') -> str:
+    """Read a string environment variable."""
+    return os.environ.get(name, default)
 
-# Option 2: Use app credentials to generate tokens
-META_APP_ID = os.environ.get('META_APP_ID', '')
-META_APP_SECRET = os.environ.get('META_APP_SECRET', '')
 
-# =============================================================================
-# RAG CONFIGURATION
-# =============================================================================
-
-VERTEX_AI_DATASTORE_ID = os.environ.get('VERTEX_AI_DATASTORE_ID', '')
-RAG_ENABLED = os.environ.get('RAG_ENABLED', 'true').lower() == 'true'
-RAG_TOP_K = int(os.environ.get('RAG_TOP_K', '5'))
-
-# =============================================================================
-# RESEARCH HUB SETTINGS
-# =============================================================================
+def _env_int(name: str, default: int) -> int:
+    """Read an integer environment variable."""
+    return int(os.environ.get(name, str(default)))
 
-# Timeout for individual research operations (seconds)
-RESEARCH_TIMEOUT_SECONDS = int(os.environ.get('RESEARCH_TIMEOUT_SECONDS', '60'))
 
-# Maximum concurrent agents for parallel research
-MAX_CONCURRENT_AGENTS = int(os.environ.get('MAX_CONCURRENT_AGENTS', '3'))
+def _env_bool(name: str, default: bool) -> bool:
+    """Read a 'true'/'false' environment variable."""
+    return os.environ.get(name, 'true' if default else 'false').lower() == 'true'
 
-# Enable agent execution tracing for debugging
-ENABLE_AGENT_TRACING = os.environ.get('ENABLE_AGENT_TRACING', 'false').lower() == 'true'
 
-# Cache TTL for research results (hours)
-CACHE_TTL_HOURS = int(os.environ.get('RESEARCH_CACHE_TTL_HOURS', '24'))
-
-# =============================================================================
-# CORS CONFIGURATION
-# =============================================================================
-
-CORS_ORIGINS = os.environ.get('CORS_ORIGINS', '*').split(',')
+@dataclass(frozen=True, slots=True)
+class Settings:
+    """
+    Research Hub settings, parsed once from the environment.
 
+    Fields are read when the instance is created; use the module-level
+    `settings` singleton rather than constructing new instances.
+    """
 
+    # =========================================================================
+    # GOOGLE CLOUD CONFIGURATION
+    # =========================================================================
+    google_cloud_project: str = field(default_factory=lambda: _env('GOOGLE_CLOUD_PROJECT'))
+    vertex_ai_location: str = field(default_factory=lambda: _env('VERTEX_AI_LOCATION', 'us-central1'))
+
+    # =========================================================================
+    # FIRESTORE CONFIGURATION
+    # =========================================================================
+    # Firestore uses the same GOOGLE_CLOUD_PROJECT
+    # Collection name for research entries
+    firestore_collection: str = field(
+        default_factory=lambda: _env('FIRESTORE_COLLECTION', 'research_hub_entries')
+    )
+
+    # =========================================================================
+    # MODEL CONFIGURATION
+    # =========================================================================
+    # Default model for research agents
+    default_model: str = field(default_factory=lambda: _env('RESEARCH_HUB_MODEL', 'gemini-2.0-flash-001'))
+    # Advanced model for complex analysis (optional upgrade)
+    advanced_model: str = field(
+        default_factory=lambda: _env('RESEARCH_HUB_ADVANCED_MODEL', 'gemini-1.5-pro-002')
+    )
+
+    # =========================================================================
+    # YOUTUBE API CONFIGURATION
+    # =========================================================================
+    youtube_api_key: str = field(default_factory=lambda: _env('YOUTUBE_API_KEY'))
+    # Max seconds an agent waits on YouTube trend data before skipping it
+    youtube_timeout_seconds: float = field(
+        default_factory=lambda: float(_env('YOUTUBE_TIMEOUT_SECONDS', '3'))
+    )
+
+    # =========================================================================
+    # META (FACEBOOK/INSTAGRAM) ADS API CONFIGURATION
+    # =========================================================================
+    # Option 1: Use a long-lived access token (recommended for production)
+    meta_access_token: str = field(default_factory=lambda: _env('META_ACCESS_TOKEN'))
+    # Option 2: Use app credentials to generate tokens
+    meta_app_id: str = field(default_factory=lambda: _env('META_APP_ID'))
+    meta_app_secret: str = field(default_factory=lambda: _env('META_APP_SECRET'))
+
+    # =========================================================================
+    # RAG CONFIGURATION
+    # =========================================================================
+    vertex_ai_datastore_id: str = field(default_factory=lambda: _env('VERTEX_AI_DATASTORE_ID'))
+    rag_enabled: bool = field(default_factory=lambda: _env_bool('RAG_ENABLED', True))
+    rag_top_k: int = field(default_factory=lambda: _env_int('RAG_TOP_K', 5))
+
+    # =========================================================================
+    # RESEARCH HUB SETTINGS
+    # =========================================================================
+    # Timeout for individual research operations (seconds)
+    research_timeout_seconds: int = field(default_factory=lambda: _env_int('RESEARCH_TIMEOUT_SECONDS', 60))
+    # Maximum concurrent agents for parallel research
+    max_concurrent_agents: int = field(default_factory=lambda: _env_int('MAX_CONCURRENT_AGENTS', 3))
+    # Enable agent execution tracing for debugging
+    enable_agent_tracing: bool = field(default_factory=lambda: _env_bool('ENABLE_AGENT_TRACING', False))
+    # Cache TTL for research results (hours)
+    cache_ttl_hours: int = field(default_factory=lambda: _env_int('RESEARCH_CACHE_TTL_HOURS', 24))
+
+    # =========================================================================
+    # CORS CONFIGURATION
+    # =========================================================================
+    cors_origins: List[str] = field(default_factory=lambda: _env('CORS_ORIGINS', '*').split(','))
+
+
+settings = Settings()
+
+
+# =============================================================================
+# LEGACY MODULE-LEVEL NAMES
+# =============================================================================
+# Existing imports (`from ..config import GOOGLE_CLOUD_PROJECT`) keep working.
+
+GOOGLE_CLOUD_PROJECT = settings.google_cloud_project
+VERTEX_AI_LOCATION = settings.vertex_ai_location
+FIRESTORE_COLLECTION = settings.firestore_collection
+DEFAULT_MODEL = settings.default_model
+ADVANCED_MODEL = settings.advanced_model
+YOUTUBE_API_KEY = settings.youtube_api_key
+YOUTUBE_TIMEOUT_SECONDS = settings.youtube_timeout_seconds
+META_ACCESS_TOKEN = settings.meta_access_token
+META_APP_ID = settings.meta_app_id
+META_APP_SECRET = settings.meta_app_secret
+VERTEX_AI_DATASTORE_ID = settings.vertex_ai_datastore_id
+RAG_ENABLED = settings.rag_enabled
+RAG_TOP_K = settings.rag_top_k
+RESEARCH_TIMEOUT_SECONDS = settings.research_timeout_seconds
+MAX_CONCURRENT_AGENTS = settings.max_concurrent_agents
+ENABLE_AGENT_TRACING = settings.enable_agent_tracing
+CACHE_TTL_HOURS = settings.cache_ttl_hours
+CORS_ORIGINS = settings.cors_origins
+
+# Truncated project ID for logs and health output (never the full ID)
+_PROJECT_DISPLAY = GOOGLE_CLOUD_PROJECT[:10] + "..." if GOOGLE_CLOUD_PROJECT else None
+
+
+@lru_cache(maxsize=1)
 def validate_research_hub_config() -> Dict[str, any]:
     """
     Validate Research Hub configuration.
 
+    Settings are read once at import, so the result is cached for the
+    process; treat it as read-only. Call .cache_clear() after patching
+    settings in tests.
+
     Returns:
         Dict with configuration status and any missing required variables.
     """
@@ -121,15 +178,18 @@ def validate_research_hub_config() -> Dict[str, any]:
     }
 
 
+@lru_cache(maxsize=1)
 def get_config_summary() -> Dict[str, any]:
     """
     Get a safe summary of configuration for logging.
 
+    Cached like validate_research_hub_config(); treat as read-only.
+
     Returns:
         Dict with configuration summary (no secrets).
     """
     return {
-        "project": GOOGLE_CLOUD_PROJECT[:10] + "..." if GOOGLE_CLOUD_PROJECT else None,
+        "project": _PROJECT_DISPLAY,
         "location": VERTEX_AI_LOCATION,
         "model": DEFAULT_MODEL,
         "storage": "firestore",
@@ -39,7 +39,14 @@ class InputType(str, Enum):
     VIDEO_URL = "video_url"
 
 
-@dataclass
+# Enum -> value maps for the serializers; a dict hit is cheaper than the
+# Enum.value descriptor on the to_dict hot path
+_RT_VALUE: Dict[ResearchType, str] = {rt: rt.value for rt in ResearchType}
+_STATUS_VALUE: Dict[ResearchStatus, str] = {st: st.value for st in ResearchStatus}
+_INPUT_TYPE_VALUE: Dict[InputType, str] = {it: it.value for it in InputType}
+
+
+@dataclass(slots=True)
 class ResearchSource:
     """A source used in research."""
     url: str
@@ -61,23 +68,28 @@ class ResearchSource:
         }
 
 
-@dataclass
+@dataclass(slots=True)
 class ResearchInput:
     """Input for a research request."""
     query: str
     input_type: InputType
     context: Optional[Dict[str, Any]] = None
 
+    def __post_init__(self):
+        # Coerce once so serializers can read .value without re-checking
+        if not isinstance(self.input_type, InputType):
+            self.input_type = InputType(self.input_type)
+
     def to_dict(self) -> Dict[str, Any]:
         """Convert to dictionary."""
         return {
             "query": self.query,
-            "input_type": self.input_type.value if isinstance(self.input_type, InputType) else self.input_type,
+            "input_type": _INPUT_TYPE_VALUE[self.input_type],
             "context": self.context,
         }
 
 
-@dataclass
+@dataclass(slots=True)
 class ResearchResult:
     """Result from a research agent."""
     research_type: ResearchType
@@ -94,20 +106,20 @@ class ResearchResult:
     def to_dict(self) -> Dict[str, Any]:
         """Convert to dictionary."""
         return {
-            "research_type": self.research_type.value,
+            "research_type": _RT_VALUE[self.research_type],
             "analysis_data": self.analysis_data,
             "summary": self.summary,
-            "sources": [s.to_dict() for s in self.sources],
+            "sources": list(map(ResearchSource.to_dict, self.sources)),
             "confidence_score": self.confidence_score,
             "tools_used": self.tools_used,
             "processing_time_ms": self.processing_time_ms,
-            "status": self.status.value,
+            "status": _STATUS_VALUE[self.status],
             "agent_trace": self.agent_trace,
             "error_message": self.error_message,
         }
 
 
-@dataclass
+@dataclass(slots=True)
 class ResearchEntry:
     """A complete research entry for storage."""
     id: str
@@ -135,6 +147,7 @@ class ResearchEntry:
         tags: List[str] = None,
     ) -> "ResearchEntry":
         """Factory method to create a new research entry."""
+        now = datetime.utcnow()
         return cls(
             id=str(uuid.uuid4()),
             project_id=project_id,
@@ -145,32 +158,35 @@ class ResearchEntry:
             title=title,
             status=result.status,
             tags=tags or [],
-            created_at=datetime.utcnow(),
-            updated_at=datetime.utcnow(),
+            created_at=now,
+            updated_at=now,
         )
 
     def to_dict(self) -> Dict[str, Any]:
         """Convert to dictionary for Supabase storage."""
+        input = self.input
+        result = self.result
+        sources = result.sources
         return {
             "id": self.id,
             "project_id": self.project_id,
             "user_id": self.user_id,
-            "research_type": self.research_type.value,
-            "input_query": self.input.query,
-            "input_type": self.input.input_type.value if isinstance(self.input.input_type, InputType) else self.input.input_type,
-            "input_context": self.input.context,
-            "analysis_data": self.result.analysis_data,
-            "summary": self.result.summary,
-            "confidence_score": self.result.confidence_score,
-            "sources": [s.to_dict() for s in self.result.sources],
-            "tools_used": self.result.tools_used,
-            "agent_trace": self.result.agent_trace,
-            "processing_time_ms": self.result.processing_time_ms,
+            "research_type": _RT_VALUE[self.research_type],
+            "input_query": input.query,
+            "input_type": _INPUT_TYPE_VALUE[input.input_type],
+            "input_context": input.context,
+            "analysis_data": result.analysis_data,
+            "summary": result.summary,
+            "confidence_score": result.confidence_score,
+            "sources": list(map(ResearchSource.to_dict, sources)) if sources else [],
+            "tools_used": result.tools_used,
+            "agent_trace": result.agent_trace,
+            "processing_time_ms": result.processing_time_ms,
             "title": self.title,
             "tags": self.tags,
             "is_pinned": self.is_pinned,
-            "status": self.status.value,
-            "error_message": self.result.error_message,
+            "status": _STATUS_VALUE[self.status],
+            "error_message": result.error_message,
             "created_at": self.created_at.isoformat(),
             "updated_at": self.updated_at.isoformat(),
         }
@@ -178,12 +194,20 @@ class ResearchEntry:
     @classmethod
     def from_dict(cls, data: Dict[str, Any]) -> "ResearchEntry":
         """Create a ResearchEntry from a dictionary."""
+        from_iso = datetime.fromisoformat
+        now = datetime.utcnow()
+
+        research_type = ResearchType(data["research_type"])
+        status = ResearchStatus(data.get("status", "completed"))
+        created_at = data.get("created_at")
+        updated_at = data.get("updated_at")
+
         sources = [
             ResearchSource(
                 url=s["url"],
                 title=s["title"],
                 source_type=s["source_type"],
-                retrieved_at=datetime.fromisoformat(s["retrieved_at"]) if s.get("retrieved_at") else datetime.utcnow(),
+                retrieved_at=from_iso(s["retrieved_at"]) if s.get("retrieved_at") else now,
                 relevance_score=s.get("relevance_score"),
                 snippet=s.get("snippet"),
             )
@@ -191,14 +215,14 @@ class ResearchEntry:
         ]
 
         result = ResearchResult(
-            research_type=ResearchType(data["research_type"]),
+            research_type=research_type,
             analysis_data=data.get("analysis_data", {}),
             summary=data.get("summary", ""),
             sources=sources,
             confidence_score=data.get("confidence_score", 0.0),
             tools_used=data.get("tools_used", []),
             processing_time_ms=data.get("processing_time_ms", 0),
-            status=ResearchStatus(data.get("status", "completed")),
+            status=status,
             agent_trace=data.get("agent_trace"),
             error_message=data.get("error_message"),
         )
@@ -213,15 +237,15 @@ class ResearchEntry:
             id=data["id"],
             project_id=data["project_id"],
             user_id=data["user_id"],
-            research_type=ResearchType(data["research_type"]),
+            research_type=research_type,
             input=input_data,
             result=result,
             title=data.get("title", ""),
-            status=ResearchStatus(data.get("status", "completed")),
+            status=status,
             tags=data.get("tags", []),
             is_pinned=data.get("is_pinned", False),
-            created_at=datetime.fromisoformat(data["created_at"]) if data.get("created_at") else datetime.utcnow(),
-            updated_at=datetime.fromisoformat(data["updated_at"]) if data.get("updated_at") else datetime.utcnow(),
+            created_at=from_iso(created_at) if created_at else now,
+            updated_at=from_iso(updated_at) if updated_at else now,
         )
 
 
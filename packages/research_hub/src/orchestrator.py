@@ -5,8 +5,10 @@ Coordinates parallel execution of specialized research agents.
 """
 
 import asyncio
+import logging
+import re
 import time
-from typing import Dict, Any, Optional, List
+from typing import Dict, Any, Optional, List, Type
 from datetime import datetime
 
 from .config import (
@@ -33,6 +35,42 @@ from .agents import (
 )
 from .storage import ResearchRepository
 
+logger = logging.getLogger(__name__)
+
+
+# Input-type detection patterns (applied to the stripped, lowercased query)
+_URL_RE = re.compile(r"https?://|www\.")
+_YOUTUBE_RE = re.compile(r"youtube\.com|youtu\.be")
+_TOPIC_RE = re.compile(r"trend|market for|industry")  # substring match, as before
+
+
+# Title prefixes for saved entries
+_TYPE_LABELS: Dict[ResearchType, str] = {
+    ResearchType.COMPETITOR: "Competitor Analysis",
+    ResearchType.MARKET: "Market Analysis",
+    ResearchType.VIDEO_AD: "Video/Ad Analysis",
+    ResearchType.SOCIAL_MEDIA: "Social Media Intel",
+    ResearchType.AUDIENCE: "Audience Research",
+    ResearchType.TREND: "Trend Analysis",
+}
+
+
+def _extract_entity_name(analysis: Dict[str, Any]) -> Optional[str]:
+    """Pick a display name from analysis data (first competitor or market definition)."""
+    competitors = analysis.get("competitors")
+    if competitors:
+        first_comp = competitors[0]
+        if isinstance(first_comp, dict):
+            name = first_comp.get("name")
+            if name:
+                return name
+
+    overview = analysis.get("market_overview")
+    if isinstance(overview, dict):
+        return overview.get("definition", "")[:50]
+
+    return None
+
 
 class ResearchOrchestrator:
     """
@@ -55,15 +93,39 @@ class ResearchOrchestrator:
         """
         self.repository = repository
 
-        # Initialize all agents
-        self.agents: Dict[ResearchType, BaseResearchAgent] = {
-            ResearchType.COMPETITOR: CompetitorAgent(),
-            ResearchType.MARKET: MarketAgent(),
-            ResearchType.VIDEO_AD: VideoAdAgent(),
-            ResearchType.SOCIAL_MEDIA: SocialMediaAgent(),
-            ResearchType.AUDIENCE: AudienceAgent(),
-            ResearchType.TREND: TrendAgent(),
+        # Agents are built on first use; most requests need only a few
+        self._agent_factories: Dict[ResearchType, Type[BaseResearchAgent]] = {
+            ResearchType.COMPETITOR: CompetitorAgent,
+            ResearchType.MARKET: MarketAgent,
+            ResearchType.VIDEO_AD: VideoAdAgent,
+            ResearchType.SOCIAL_MEDIA: SocialMediaAgent,
+            ResearchType.AUDIENCE: AudienceAgent,
+            ResearchType.TREND: TrendAgent,
         }
+        self._agents: Dict[ResearchType, BaseResearchAgent] = {}
+
+    def get_agent(self, research_type: ResearchType) -> Optional[BaseResearchAgent]:
+        """
+        Get the agent for a research type, creating it on first use.
+
+        Args:
+            research_type: The research type
+
+        Returns:
+            The agent, or None for an unknown type
+        """
+        agent = self._agents.get(research_type)
+        if agent is None:
+            factory = self._agent_factories.get(research_type)
+            if factory is None:
+                return None
+            agent = self._agents[research_type] = factory()
+        return agent
+
+    @property
+    def agents(self) -> Dict[ResearchType, BaseResearchAgent]:
+        """All agents by research type (instantiates any not yet created)."""
+        return {rt: self.get_agent(rt) for rt in self._agent_factories}
 
     def get_available_agents(self) -> List[Dict[str, Any]]:
         """Get information about all available agents."""
@@ -82,13 +144,13 @@ class ResearchOrchestrator:
         query = query.strip().lower()
 
         # Check for URLs
-        if query.startswith(('http://', 'https://', 'www.')):
-            if 'youtube.com' in query or 'youtu.be' in query:
+        if _URL_RE.match(query):
+            if _YOUTUBE_RE.search(query):
                 return InputType.VIDEO_URL
             return InputType.URL
 
         # Check for topic patterns
-        if any(word in query for word in ['trend', 'trends', 'market for', 'industry']):
+        if _TOPIC_RE.search(query):
             return InputType.TOPIC
 
         # Default to text/brand name
@@ -188,7 +250,7 @@ class ResearchOrchestrator:
             context=context,
         )
 
-        agent = self.agents.get(research_type)
+        agent = self.get_agent(research_type)
         if not agent:
             return self._create_error_result(
                 research_type,
@@ -215,50 +277,53 @@ class ResearchOrchestrator:
         """
         Execute multiple research types in parallel with concurrency limit.
         """
-        results: Dict[ResearchType, ResearchResult] = {}
-        semaphore = asyncio.Semaphore(MAX_CONCURRENT_AGENTS)
-
-        async def run_with_semaphore(research_type: ResearchType):
-            async with semaphore:
-                agent = self.agents.get(research_type)
-                if not agent:
-                    return research_type, self._create_error_result(
-                        research_type,
-                        f"Unknown research type: {research_type}"
-                    )
-
-                try:
-                    result = await asyncio.wait_for(
-                        agent.research(input_data),
-                        timeout=timeout,
-                    )
-                    return research_type, result
-                except asyncio.TimeoutError:
-                    return research_type, self._create_error_result(
-                        research_type,
-                        "Research timed out"
-                    )
-                except Exception as e:
-                    return research_type, self._create_error_result(
-                        research_type,
-                        str(e)
-                    )
-
-        # Create tasks for all research types
-        tasks = [run_with_semaphore(rt) for rt in research_types]
-
-        # Execute all tasks
-        completed = await asyncio.gather(*tasks, return_exceptions=True)
-
-        # Process results
-        for item in completed:
-            if isinstance(item, Exception):
-                # This shouldn't happen due to our error handling, but just in case
-                continue
-            research_type, result = item
-            results[research_type] = result
+        async def run_agent(
+            research_type: ResearchType,
+            agent: BaseResearchAgent,
+        ) -> ResearchResult:
+            try:
+                return await asyncio.wait_for(
+                    agent.research(input_data),
+                    timeout=timeout,
+                )
+            except asyncio.TimeoutError:
+                return self._create_error_result(
+                    research_type,
+                    "Research timed out"
+                )
+            except Exception as e:
+                return self._create_error_result(
+                    research_type,
+                    str(e)
+                )
 
-        return results
+        # Unknown types get their error result up front; only real agent
+        # runs are handed to the workers
+        completed: List[Optional[ResearchResult]] = [None] * len(research_types)
+        runnable = []
+        for i, research_type in enumerate(research_types):
+            agent = self.get_agent(research_type)
+            if agent is None:
+                completed[i] = self._create_error_result(
+                    research_type,
+                    f"Unknown research type: {research_type}"
+                )
+            else:
+                runnable.append((i, research_type, agent))
+
+        # Fixed pool of workers pulling from a shared iterator, so at most
+        # MAX_CONCURRENT_AGENTS agents run at once without semaphore churn
+        pending = iter(runnable)
+
+        async def worker():
+            for i, research_type, agent in pending:
+                completed[i] = await run_agent(research_type, agent)
+
+        num_workers = min(MAX_CONCURRENT_AGENTS, len(runnable))
+        await asyncio.gather(*(worker() for _ in range(num_workers)))
+
+        # Keep results in request order regardless of completion order
+        return dict(zip(research_types, completed))
 
     async def _save_results(
         self,
@@ -267,22 +332,31 @@ class ResearchOrchestrator:
         input_data: ResearchInput,
         results: Dict[ResearchType, ResearchResult],
     ):
-        """Save research results to storage."""
+        """Save research results to storage in a single batched write."""
+        entries = []
         for research_type, result in results.items():
             try:
                 title = self._generate_title(input_data.query, research_type, result)
 
-                await self.repository.create(
+                entries.append(ResearchEntry.create(
                     project_id=project_id,
                     user_id=user_id,
                     research_type=research_type,
                     input=input_data,
                     result=result,
                     title=title,
-                )
-            except Exception as e:
+                ))
+            except Exception:
                 # Log error but don't fail the entire operation
-                print(f"Failed to save {research_type.value} result: {e}")
+                logger.exception("Failed to save %s result", research_type.value)
+
+        if not entries:
+            return
+
+        try:
+            await self.repository.create_many(entries)
+        except Exception:
+            logger.exception("Failed to save %d research results", len(entries))
 
     def _generate_title(
         self,
@@ -291,31 +365,9 @@ class ResearchOrchestrator:
         result: ResearchResult,
     ) -> str:
         """Generate a title for the research entry."""
-        type_labels = {
-            ResearchType.COMPETITOR: "Competitor Analysis",
-            ResearchType.MARKET: "Market Analysis",
-            ResearchType.VIDEO_AD: "Video/Ad Analysis",
-            ResearchType.SOCIAL_MEDIA: "Social Media Intel",
-            ResearchType.AUDIENCE: "Audience Research",
-            ResearchType.TREND: "Trend Analysis",
-        }
-
-        type_label = type_labels.get(research_type, "Research")
-
-        # Try to extract a name from the analysis
-        analysis = result.analysis_data
-        name = None
-
-        if "competitors" in analysis and analysis["competitors"]:
-            first_comp = analysis["competitors"][0]
-            if isinstance(first_comp, dict):
-                name = first_comp.get("name")
-
-        if not name and "market_overview" in analysis:
-            overview = analysis["market_overview"]
-            if isinstance(overview, dict):
-                name = overview.get("definition", "")[:50]
+        type_label = _TYPE_LABELS.get(research_type, "Research")
 
+        name = _extract_entity_name(result.analysis_data)
         if not name:
             # Use the query, truncated
             name = query[:50] + "..." if len(query) > 50 else query
@@ -353,47 +405,59 @@ class ResearchOrchestrator:
         Returns:
             Synthesized summary
         """
-        synthesis = {
-            "total_research_types": len(results),
-            "successful": 0,
-            "failed": 0,
-            "total_sources": 0,
-            "average_confidence": 0.0,
-            "total_processing_time_ms": 0,
-            "key_findings": [],
-            "by_type": {},
-        }
-
-        confidence_sum = 0
+        completed = ResearchStatus.COMPLETED
+        successful = failed = total_sources = total_time_ms = 0
+        confidence_sum = 0.0
+        key_findings = []
+        by_type = {}
 
         for research_type, result in results.items():
-            if result.status == ResearchStatus.COMPLETED:
-                synthesis["successful"] += 1
+            ok = result.status == completed
+            if ok:
+                successful += 1
                 confidence_sum += result.confidence_score
             else:
-                synthesis["failed"] += 1
+                failed += 1
 
-            synthesis["total_sources"] += len(result.sources)
-            synthesis["total_processing_time_ms"] += result.processing_time_ms
+            sources_count = len(result.sources)
+            total_sources += sources_count
+            total_time_ms += result.processing_time_ms
 
-            synthesis["by_type"][research_type.value] = {
+            by_type[research_type.value] = {
                 "status": result.status.value,
                 "summary": result.summary,
                 "confidence": result.confidence_score,
-                "sources_count": len(result.sources),
+                "sources_count": sources_count,
             }
 
             # Extract key findings
-            if result.summary and result.status == ResearchStatus.COMPLETED:
-                synthesis["key_findings"].append({
+            if ok and result.summary:
+                key_findings.append({
                     "type": research_type.value,
                     "finding": result.summary,
                 })
 
-        if synthesis["successful"] > 0:
-            synthesis["average_confidence"] = confidence_sum / synthesis["successful"]
+        return {
+            "total_research_types": len(results),
+            "successful": successful,
+            "failed": failed,
+            "total_sources": total_sources,
+            "average_confidence": confidence_sum / successful if successful else 0.0,
+            "total_processing_time_ms": total_time_ms,
+            "key_findings": key_findings,
+            "by_type": by_type,
+        }
+
+
+_default_orchestrator: Optional[ResearchOrchestrator] = None
+
 
-        return synthesis
+def _get_default_orchestrator() -> ResearchOrchestrator:
+    """Get the shared storage-less orchestrator used by run_research."""
+    global _default_orchestrator
+    if _default_orchestrator is None:
+        _default_orchestrator = ResearchOrchestrator()
+    return _default_orchestrator
 
 
 # Convenience function
@@ -417,7 +481,7 @@ async def run_research(
     Returns:
         Research results
     """
-    orchestrator = ResearchOrchestrator()
+    orchestrator = _get_default_orchestrator()
     return await orchestrator.execute_research(
         project_id=project_id,
         user_id=user_id,
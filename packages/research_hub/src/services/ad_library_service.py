@@ -6,20 +6,313 @@ Handles both image and video ads.
 """
 
 import asyncio
+import atexit
+import os
+import queue
+import re
+import threading
 import time
 import json
 from datetime import datetime
-from typing import Dict, Any, List, Optional
+from concurrent.futures import Future
+from typing import Callable, Dict, Any, Iterator, List, Optional, Tuple
 from urllib.parse import urlencode
 import hashlib
 
 
+# Max Ad Library pages scraped concurrently by scrape_many()
+MAX_PARALLEL_PAGES = 3
+
+_LAUNCH_ARGS = ["--disable-blink-features=AutomationControlled", "--no-sandbox", "--disable-dev-shm-usage"]
+
+_CONTEXT_OPTIONS = {
+    "viewport": {"width": 1400, "height": 900},
+    "user_agent": "Mozilla/5.0 (Macintosh; Intel Mac OS X 10_15_7) AppleWebKit/537.36",
+}
+
+_INIT_SCRIPT = """
+    Object.defineProperty(navigator, 'webdriver', {get: () => undefined});
+    // Count inserted elements so the scroll loop can tell when the
+    // results feed has stopped growing
+    window.__addedNodes = 0;
+    new MutationObserver(muts => {
+        for (const m of muts) window.__addedNodes += m.addedNodes.length;
+    }).observe(document, {childList: true, subtree: true});
+"""
+
+# Scrolls one step; returns the inserted-node count so far
+_SCROLL_JS = "() => { window.scrollBy(0, 1200); return window.__addedNodes || 0; }"
+
+# Stop scrolling after this many steps without new DOM nodes
+_MAX_IDLE_SCROLLS = 3
+
+# Runs in the page; returns a list of ad dicts
+_EXTRACT_ADS_JS = """
+    () => {
+        const results = [];
+        const seen = new Set();
+        // Patterns built once per evaluate, not per element
+        const FILTER_RE = /Started running|\\d+ Jan \\d{4}|\\d+ Dec \\d{4}/;
+        const DATE_RE = /(\\d{1,2} (?:Jan|Feb|Mar|Apr|May|Jun|Jul|Aug|Sep|Oct|Nov|Dec) \\d{4})/i;
+        const LEADING_DIGIT_RE = /^\\d/;
+        // Ad cards are div containers; skipping spans, links,
+        // images etc. avoids an innerText layout per leaf node
+        const candidates = document.querySelectorAll('div');
+
+        for (const el of candidates) {
+            const text = el.innerText || '';
+            if (text.length < 50 || text.length > 5000) continue;
+            if (!FILTER_RE.test(text)) continue;
+
+            const sig = text.slice(0, 150);
+            if (seen.has(sig)) continue;
+            seen.add(sig);
+
+            const lines = text.split('\\n').map(l => l.trim()).filter(l => l.length > 0);
+
+            // One query per card, bucketed by tag (document order kept)
+            const libraryLinks = [];
+            const allLinks = [];
+            const imgElements = [];
+            const videoElements = [];
+            let videoLabel = false;
+            for (const node of el.querySelectorAll('a, img, video, [aria-label*="video"]')) {
+                const tag = node.tagName;
+                if (tag === 'A') {
+                    allLinks.push(node);
+                    if ((node.getAttribute('href') || '').includes('/ads/library/')) libraryLinks.push(node);
+                } else if (tag === 'IMG') {
+                    imgElements.push(node);
+                } else if (tag === 'VIDEO') {
+                    videoElements.push(node);
+                }
+                if (!videoLabel && (node.getAttribute('aria-label') || '').includes('video')) videoLabel = true;
+            }
+
+            // Page name
+            let pageName = '';
+            for (const link of libraryLinks) {
+                const lt = link.innerText.trim();
+                if (lt && lt.length > 2 && lt.length < 80 && !lt.includes('See ad details')) {
+                    pageName = lt;
+                    break;
+                }
+            }
+            if (!pageName) {
+                for (const line of lines.slice(0, 5)) {
+                    if (line.length > 2 && line.length < 60 &&
+                        !line.includes('Active') && !line.includes('Started') && !LEADING_DIGIT_RE.test(line)) {
+                        pageName = line;
+                        break;
+                    }
+                }
+            }
+
+            // Date
+            let startDate = '';
+            const dateMatch = DATE_RE.exec(text);
+            if (dateMatch) startDate = dateMatch[1];
+
+            // Platforms
+            const platforms = [];
+            const tl = text.toLowerCase();
+            if (tl.includes('facebook')) platforms.push('facebook');
+            if (tl.includes('instagram')) platforms.push('instagram');
+            if (tl.includes('messenger')) platforms.push('messenger');
+
+            // Ad body
+            let body = '';
+            for (const line of lines) {
+                if (line.length > body.length && line.length > 30 &&
+                    !line.includes('Started running') && !line.includes('Active') &&
+                    !line.includes('See ad details')) {
+                    body = line;
+                }
+            }
+
+            // Check for video
+            const hasVideo = videoElements.length > 0 ||
+                           tl.includes('video') ||
+                           videoLabel;
+
+            // Snapshot URL
+            let snapshotUrl = '';
+            for (const link of allLinks) {
+                if (link.href && link.href.includes('render_ad')) {
+                    snapshotUrl = link.href;
+                    break;
+                }
+            }
+
+            // Image URLs
+            const images = [];
+            for (const img of imgElements) {
+                if (img.src && img.src.includes('facebook') && img.width > 100) {
+                    images.push(img.src);
+                }
+            }
+
+            // Video URLs
+            const videos = [];
+            for (const vid of videoElements) {
+                if (vid.src) videos.push(vid.src);
+                const source = vid.querySelector('source');
+                if (source && source.src) videos.push(source.src);
+            }
+
+            if (startDate || pageName) {
+                results.push({
+                    page_name: pageName || 'Unknown',
+                    start_date: startDate,
+                    platforms: platforms,
+                    body: body.slice(0, 500),
+                    status: text.includes('Active') ? 'active' : 'inactive',
+                    has_video: hasVideo || videos.length > 0,
+                    snapshot_url: snapshotUrl,
+                    image_urls: images.slice(0, 3),
+                    video_urls: videos.slice(0, 2),
+                });
+            }
+
+            if (results.length >= 50) break;
+        }
+
+        return results;
+    }
+"""
+
+
+# Word tokenizer for the `_tokens` search field on stored ads
+_TOKEN_RE = re.compile(r"\w+")
+_MAX_TOKENS = 100
+
+
+def _search_tokens(*texts: Optional[str]) -> List[str]:
+    """Lowercase word tokens (deduped, first-seen order) for array_contains search."""
+    words = _TOKEN_RE.findall(" ".join(t or "" for t in texts).lower())
+    return list(dict.fromkeys(words))[:_MAX_TOKENS]
+
+
+def _json_default(value: Any) -> str:
+    # Datetimes keep ISO format ("T" separator) so stored created_at
+    # values still sort as strings; str(datetime) would use a space
+    if hasattr(value, "isoformat"):
+        return value.isoformat()
+    return str(value)
+
+
+def _headless() -> bool:
+    # Use headless=False for better success with Meta's bot detection
+    # Set HEADLESS=1 env var to run headless (may have lower success rate)
+    return os.environ.get("HEADLESS", "0") == "1"
+
+
+def _scroll_count(limit: int) -> int:
+    # Scroll to load more ads (aggressive scrolling for large collections)
+    return min(limit // 2 + 5, 30)
+
+
+class _BrowserPool:
+    """
+    A fixed set of browser threads for the sync Playwright API.
+
+    Sync Playwright objects are bound to the thread that created them, so
+    each worker thread owns one Chromium, launched on its first job.
+    Jobs from any thread (e.g. FastAPI's threadpool) queue here; there is
+    one pool per process (see _get_browser_pool), so the sync scrape path
+    never runs more than `size` browsers.
+    """
+
+    def __init__(self, size: int):
+        self.size = size
+        self._jobs: "queue.Queue" = queue.Queue()
+        self._threads: List[threading.Thread] = []
+        self._lock = threading.Lock()
+
+    def run(self, fn: Callable[[Any], Any]) -> Any:
+        """Run fn(browser) on a pool thread and return its result."""
+        with self._lock:
+            if not self._threads:
+                self._threads = [
+                    threading.Thread(target=self._worker, name=f"playwright-{i}", daemon=True)
+                    for i in range(self.size)
+                ]
+                for thread in self._threads:
+                    thread.start()
+
+        future: Future = Future()
+        self._jobs.put((fn, future))
+        return future.result()
+
+    def _worker(self):
+        playwright = browser = None
+        try:
+            while True:
+                job = self._jobs.get()
+                if job is None:
+                    break
+
+                fn, future = job
+                if not future.set_running_or_notify_cancel():
+                    continue
+                try:
+                    if browser is None or not browser.is_connected():
+                        if playwright is None:
+                            from playwright.sync_api import sync_playwright
+                            playwright = sync_playwright().start()
+                        browser = playwright.chromium.launch(
+                            headless=_headless(), args=_LAUNCH_ARGS
+                        )
+                    future.set_result(fn(browser))
+                except BaseException as e:
+                    future.set_exception(e)
+        finally:
+            try:
+                if browser is not None:
+                    browser.close()
+                if playwright is not None:
+                    playwright.stop()
+            except Exception:
+                pass
+
+    def close(self, timeout: float = 10.0):
+        """Stop every pool thread, closing its browser and driver."""
+        with self._lock:
+            threads, self._threads = self._threads, []
+        for _ in threads:
+            self._jobs.put(None)
+        for thread in threads:
+            thread.join(timeout)
+
+
+# Warm browsers kept by the sync scrape() path, shared by every scraper
+_MAX_BROWSERS = int(os.environ.get("SCRAPER_MAX_BROWSERS", "2"))
+_browser_pool: Optional[_BrowserPool] = None
+_browser_pool_lock = threading.Lock()
+
+
+def _get_browser_pool() -> _BrowserPool:
+    """Get or create the process-wide browser pool, closed at exit."""
+    global _browser_pool
+    with _browser_pool_lock:
+        if _browser_pool is None:
+            _browser_pool = _BrowserPool(_MAX_BROWSERS)
+            atexit.register(_browser_pool.close)
+        return _browser_pool
+
+
 class AdLibraryScraper:
     """Scrapes Meta Ad Library using Playwright."""
 
-    def __init__(self):
-        self.playwright = None
-        self.browser = None
+    def close(self):
+        """
+        Close every warm browser and its Playwright driver.
+
+        The pool is shared by all scrapers; it relaunches browsers on the
+        next scrape.
+        """
+        if _browser_pool is not None:
+            _browser_pool.close()
 
     def _get_url(self, query: str, country: str = "US", media_type: str = "all") -> str:
         """Generate Ad Library URL."""
@@ -52,176 +345,220 @@ class AdLibraryScraper:
             Dict with ads and metadata
         """
         try:
-            from playwright.sync_api import sync_playwright
+            import playwright.sync_api  # noqa: F401
         except ImportError:
             return {"error": "Playwright not installed"}
 
         url = self._get_url(query, country, media_type)
 
-        with sync_playwright() as p:
-            # Use headless=False for better success with Meta's bot detection
-            # Set HEADLESS=1 env var to run headless (may have lower success rate)
-            import os
-            headless = os.environ.get("HEADLESS", "0") == "1"
-
-            browser = p.chromium.launch(
-                headless=headless,
-                args=["--disable-blink-features=AutomationControlled", "--no-sandbox", "--disable-dev-shm-usage"]
-            )
-
-            context = browser.new_context(
-                viewport={"width": 1400, "height": 900},
-                user_agent="Mozilla/5.0 (Macintosh; Intel Mac OS X 10_15_7) AppleWebKit/537.36",
+        try:
+            return _get_browser_pool().run(
+                lambda browser: self._scrape_page(browser, url, query, country, limit, media_type)
             )
+        except Exception as e:
+            return {"error": str(e), "url": url}
 
-            context.add_init_script("""
-                Object.defineProperty(navigator, 'webdriver', {get: () => undefined});
-            """)
+    def _scrape_page(
+        self,
+        browser,
+        url: str,
+        query: str,
+        country: str,
+        limit: int,
+        media_type: str,
+    ) -> Dict[str, Any]:
+        """Scrape one results page with a pool browser (runs on its thread)."""
+        # Reuse the warm browser; a fresh context per scrape keeps cookies
+        # and storage isolated between queries
+        try:
+            context = browser.new_context(**_CONTEXT_OPTIONS)
+        except Exception as e:
+            return {"error": str(e), "url": url}
 
+        try:
+            context.add_init_script(_INIT_SCRIPT)
             page = context.new_page()
 
+            page.goto(url, wait_until="networkidle", timeout=45000)
+            time.sleep(5)
+
+            last_added, idle = -1, 0
+            for i in range(_scroll_count(limit)):
+                added = page.evaluate(_SCROLL_JS)
+                idle = idle + 1 if added == last_added else 0
+                if idle >= _MAX_IDLE_SCROLLS:
+                    break  # end of results
+                last_added = added
+                time.sleep(1.5)
+                # Extra wait every 5 scrolls for content to load
+                if i % 5 == 4:
+                    time.sleep(2)
+
+            # Extract ads
+            ads = page.evaluate(_EXTRACT_ADS_JS)
+
+            return self._build_result(query, country, media_type, url, ads, limit)
+
+        except Exception as e:
+            return {"error": str(e), "url": url}
+        finally:
+            context.close()
+
+    async def scrape_async(
+        self,
+        query: str,
+        country: str = "US",
+        limit: int = 50,
+        media_type: str = "all",
+    ) -> Dict[str, Any]:
+        """
+        Async variant of scrape() for use inside an event loop.
+
+        Args:
+            query: Brand/keyword to search
+            country: Country code
+            limit: Max ads to fetch
+            media_type: "all", "image", or "video"
+
+        Returns:
+            Dict with ads and metadata
+        """
+        results = await self.scrape_many([query], country, limit, media_type)
+        return results[0]
+
+    async def scrape_many(
+        self,
+        queries: List[str],
+        country: str = "US",
+        limit: int = 50,
+        media_type: str = "all",
+        max_parallel: int = MAX_PARALLEL_PAGES,
+    ) -> List[Dict[str, Any]]:
+        """
+        Scrape several queries with one browser and bounded parallel pages.
+
+        Wall time is roughly the slowest page per wave of `max_parallel`
+        queries instead of the sum over all queries.
+
+        Args:
+            queries: Brands/keywords to search
+            country: Country code
+            limit: Max ads to fetch per query
+            media_type: "all", "image", or "video"
+            max_parallel: Max pages open at once
+
+        Returns:
+            One scrape() style result dict per query, in input order
+        """
+        return await self.scrape_pairs(
+            [(query, country) for query in queries],
+            limit=limit,
+            media_type=media_type,
+            max_parallel=max_parallel,
+        )
+
+    async def scrape_pairs(
+        self,
+        pairs: List[Tuple[str, str]],
+        limit: int = 50,
+        media_type: str = "all",
+        max_parallel: int = MAX_PARALLEL_PAGES,
+    ) -> List[Dict[str, Any]]:
+        """
+        Scrape (query, country) pairs with one browser and bounded pages.
+
+        Like scrape_many, but across countries too, so a multi-country
+        collection still runs a single browser with at most
+        `max_parallel` pages.
+
+        Args:
+            pairs: (brand/keyword, country code) pairs
+            limit: Max ads to fetch per pair
+            media_type: "all", "image", or "video"
+            max_parallel: Max pages open at once
+
+        Returns:
+            One scrape() style result dict per pair, in input order
+        """
+        try:
+            from playwright.async_api import async_playwright
+        except ImportError:
+            return [{"error": "Playwright not installed"} for _ in pairs]
+
+        semaphore = asyncio.Semaphore(max_parallel)
+
+        async with async_playwright() as p:
+            browser = await p.chromium.launch(headless=_headless(), args=_LAUNCH_ARGS)
+
+            async def run(query: str, country: str) -> Dict[str, Any]:
+                async with semaphore:
+                    return await self._scrape_page_async(
+                        browser, query, country, limit, media_type
+                    )
+
             try:
-                page.goto(url, wait_until="networkidle", timeout=45000)
-                time.sleep(5)
-
-                # Scroll to load more ads (aggressive scrolling for large collections)
-                scroll_count = min(limit // 2 + 5, 30)  # More scrolling
-                for i in range(scroll_count):
-                    page.evaluate("window.scrollBy(0, 1200)")
-                    time.sleep(1.5)
-                    # Extra wait every 5 scrolls for content to load
-                    if i % 5 == 4:
-                        time.sleep(2)
-
-                # Extract ads
-                ads = page.evaluate("""
-                    () => {
-                        const results = [];
-                        const seen = new Set();
-                        const allElements = document.querySelectorAll('*');
-
-                        for (const el of allElements) {
-                            const text = el.innerText || '';
-                            if (!text.match(/Started running|\\d+ Jan \\d{4}|\\d+ Dec \\d{4}/)) continue;
-                            if (text.length < 50 || text.length > 5000) continue;
-
-                            const sig = text.slice(0, 150);
-                            if (seen.has(sig)) continue;
-                            seen.add(sig);
-
-                            const lines = text.split('\\n').map(l => l.trim()).filter(l => l.length > 0);
-
-                            // Page name
-                            let pageName = '';
-                            const links = el.querySelectorAll('a[href*="/ads/library/"]');
-                            for (const link of links) {
-                                const lt = link.innerText.trim();
-                                if (lt && lt.length > 2 && lt.length < 80 && !lt.includes('See ad details')) {
-                                    pageName = lt;
-                                    break;
-                                }
-                            }
-                            if (!pageName) {
-                                for (const line of lines.slice(0, 5)) {
-                                    if (line.length > 2 && line.length < 60 &&
-                                        !line.includes('Active') && !line.includes('Started') && !line.match(/^\\d/)) {
-                                        pageName = line;
-                                        break;
-                                    }
-                                }
-                            }
-
-                            // Date
-                            let startDate = '';
-                            const dateMatch = text.match(/(\\d{1,2} (?:Jan|Feb|Mar|Apr|May|Jun|Jul|Aug|Sep|Oct|Nov|Dec) \\d{4})/i);
-                            if (dateMatch) startDate = dateMatch[1];
-
-                            // Platforms
-                            const platforms = [];
-                            const tl = text.toLowerCase();
-                            if (tl.includes('facebook')) platforms.push('facebook');
-                            if (tl.includes('instagram')) platforms.push('instagram');
-                            if (tl.includes('messenger')) platforms.push('messenger');
-
-                            // Ad body
-                            let body = '';
-                            for (const line of lines) {
-                                if (line.length > body.length && line.length > 30 &&
-                                    !line.includes('Started running') && !line.includes('Active') &&
-                                    !line.includes('See ad details')) {
-                                    body = line;
-                                }
-                            }
-
-                            // Check for video
-                            const hasVideo = el.querySelector('video') !== null ||
-                                           text.toLowerCase().includes('video') ||
-                                           el.querySelector('[aria-label*="video"]') !== null;
-
-                            // Snapshot URL
-                            let snapshotUrl = '';
-                            const allLinks = el.querySelectorAll('a');
-                            for (const link of allLinks) {
-                                if (link.href && link.href.includes('render_ad')) {
-                                    snapshotUrl = link.href;
-                                    break;
-                                }
-                            }
-
-                            // Image URLs
-                            const images = [];
-                            const imgElements = el.querySelectorAll('img');
-                            for (const img of imgElements) {
-                                if (img.src && img.src.includes('facebook') && img.width > 100) {
-                                    images.push(img.src);
-                                }
-                            }
-
-                            // Video URLs
-                            const videos = [];
-                            const videoElements = el.querySelectorAll('video');
-                            for (const vid of videoElements) {
-                                if (vid.src) videos.push(vid.src);
-                                const source = vid.querySelector('source');
-                                if (source && source.src) videos.push(source.src);
-                            }
-
-                            if (startDate || pageName) {
-                                results.push({
-                                    page_name: pageName || 'Unknown',
-                                    start_date: startDate,
-                                    platforms: platforms,
-                                    body: body.slice(0, 500),
-                                    status: text.includes('Active') ? 'active' : 'inactive',
-                                    has_video: hasVideo || videos.length > 0,
-                                    snapshot_url: snapshotUrl,
-                                    image_urls: images.slice(0, 3),
-                                    video_urls: videos.slice(0, 2),
-                                });
-                            }
-
-                            if (results.length >= 50) break;
-                        }
-
-                        return results;
-                    }
-                """)
-
-                browser.close()
-
-                return {
-                    "query": query,
-                    "country": country,
-                    "media_type": media_type,
-                    "url": url,
-                    "total": len(ads),
-                    "ads": ads[:limit],
-                    "scraped_at": datetime.utcnow().isoformat(),
-                }
+                return list(await asyncio.gather(*(run(q, c) for q, c in pairs)))
+            finally:
+                await browser.close()
 
-            except Exception as e:
-                browser.close()
-                return {"error": str(e), "url": url}
+    async def _scrape_page_async(
+        self,
+        browser,
+        query: str,
+        country: str,
+        limit: int,
+        media_type: str,
+    ) -> Dict[str, Any]:
+        """Scrape one query in its own context on a shared async browser."""
+        url = self._get_url(query, country, media_type)
+        context = await browser.new_context(**_CONTEXT_OPTIONS)
+
+        try:
+            await context.add_init_script(_INIT_SCRIPT)
+            page = await context.new_page()
+
+            await page.goto(url, wait_until="networkidle", timeout=45000)
+            await asyncio.sleep(5)
+
+            last_added, idle = -1, 0
+            for i in range(_scroll_count(limit)):
+                added = await page.evaluate(_SCROLL_JS)
+                idle = idle + 1 if added == last_added else 0
+                if idle >= _MAX_IDLE_SCROLLS:
+                    break  # end of results
+                last_added = added
+                await asyncio.sleep(1.5)
+                # Extra wait every 5 scrolls for content to load
+                if i % 5 == 4:
+                    await asyncio.sleep(2)
+
+            ads = await page.evaluate(_EXTRACT_ADS_JS)
+            return self._build_result(query, country, media_type, url, ads, limit)
+
+        except Exception as e:
+            return {"error": str(e), "url": url}
+        finally:
+            await context.close()
+
+    def _build_result(
+        self,
+        query: str,
+        country: str,
+        media_type: str,
+        url: str,
+        ads: List[Dict],
+        limit: int,
+    ) -> Dict[str, Any]:
+        """Wrap extracted ads in the scrape() result shape."""
+        return {
+            "query": query,
+            "country": country,
+            "media_type": media_type,
+            "url": url,
+            "total": len(ads),
+            "ads": ads[:limit],
+            "scraped_at": datetime.utcnow().isoformat(),
+        }
 
 
 class AdLibraryService:
@@ -229,6 +566,9 @@ class AdLibraryService:
     Service for scraping and storing Meta Ad Library data.
     """
 
+    # Projection for list views: skips media URL arrays and search tokens
+    LIST_VIEW_FIELDS = ["id", "page_name", "body", "media_type", "status", "start_date", "created_at"]
+
     def __init__(self, firestore_client=None):
         self.scraper = AdLibraryScraper()
         self.firestore = firestore_client
@@ -242,54 +582,74 @@ class AdLibraryService:
                 self.firestore = firestore.Client()
                 print("✓ Connected to Firestore")
             except Exception as e:
-                print(f"⚠ Firestore not available ({e}), using local JSON storage")
+                print(f"⚠ Firestore not available ({e}), using local JSONL storage")
                 self.firestore = None
-                self.local_storage_path = "data/ad_library.json"
+                self.local_storage_path = "data/ad_library.jsonl"
+                self._migrate_legacy_local("data/ad_library.json")
+                # Read the file once; later writes are appends checked here
+                self._seen_ids = {d.get("id") for d in self._load_local()}
 
     def _generate_ad_id(self, ad: Dict) -> str:
         """Generate unique ID for an ad."""
         unique_str = f"{ad.get('page_name', '')}{ad.get('start_date', '')}{ad.get('body', '')[:100]}"
-        return hashlib.md5(unique_str.encode()).hexdigest()
+        # Stored documents are keyed by this digest, so the algorithm must
+        # stay MD5; it is a dedupe key, not a security boundary
+        return hashlib.md5(unique_str.encode(), usedforsecurity=False).hexdigest()
 
-    def _store_local(self, doc: Dict):
-        """Store ad in local JSON file."""
-        import os
-        os.makedirs("data", exist_ok=True)
+    def _store_firestore_batch(self, docs: List[Dict]) -> List[str]:
+        """Write ad docs with batched commits; returns the stored IDs."""
+        collection = self.firestore.collection("ad_library")
+        stored_ids = []
 
-        # Load existing data
-        data = []
-        if os.path.exists(self.local_storage_path):
+        # Firestore caps a batch at 500 writes
+        for start in range(0, len(docs), 500):
+            chunk = docs[start:start + 500]
+            batch = self.firestore.batch()
+            for doc in chunk:
+                batch.set(collection.document(doc["id"]), doc)
             try:
-                with open(self.local_storage_path, "r") as f:
-                    data = json.load(f)
-            except:
-                data = []
-
-        # Convert datetime to string
-        doc_copy = doc.copy()
-        for key in ["created_at", "updated_at"]:
-            if key in doc_copy and hasattr(doc_copy[key], "isoformat"):
-                doc_copy[key] = doc_copy[key].isoformat()
-
-        # Check if already exists
-        existing_ids = {d.get("id") for d in data}
-        if doc_copy.get("id") not in existing_ids:
-            data.append(doc_copy)
-
-        # Save
-        with open(self.local_storage_path, "w") as f:
-            json.dump(data, f, indent=2)
+                batch.commit()
+                stored_ids.extend(doc["id"] for doc in chunk)
+            except Exception as e:
+                print(f"Failed to store {len(chunk)} ads: {e}")
+
+        return stored_ids
+
+    def _store_local(self, doc: Dict):
+        """Append ad to the local JSONL file unless already stored."""
+        if doc.get("id") in self._seen_ids:
+            return
 
-    def _load_local(self) -> List[Dict]:
-        """Load ads from local JSON file."""
-        import os
+        os.makedirs("data", exist_ok=True)
+        with open(self.local_storage_path, "a") as f:
+            f.write(json.dumps(doc, default=_json_default) + "\n")
+        self._seen_ids.add(doc.get("id"))
+
+    def _load_local(self) -> Iterator[Dict]:
+        """Stream ads from the local JSONL file."""
         if not os.path.exists(self.local_storage_path):
-            return []
+            return
+        with open(self.local_storage_path, "r") as f:
+            for line in f:
+                if not line.strip():
+                    continue
+                try:
+                    yield json.loads(line)
+                except json.JSONDecodeError:
+                    continue
+
+    def _migrate_legacy_local(self, legacy_path: str):
+        """Convert a pre-JSONL ad_library.json array file, once."""
+        if os.path.exists(self.local_storage_path) or not os.path.exists(legacy_path):
+            return
         try:
-            with open(self.local_storage_path, "r") as f:
-                return json.load(f)
+            with open(legacy_path, "r") as f:
+                data = json.load(f)
         except:
-            return []
+            return
+        with open(self.local_storage_path, "w") as f:
+            for doc in data:
+                f.write(json.dumps(doc) + "\n")
 
     def search_and_store(
         self,
@@ -329,6 +689,7 @@ class AdLibraryService:
 
         # Store in Firestore
         stored_ids = []
+        pending_docs = []
         video_ads = []
         image_ads = []
 
@@ -351,17 +712,14 @@ class AdLibraryService:
                 "video_urls": ad.get("video_urls", []),
                 "country": country,
                 "media_type": "video" if ad.get("has_video") else "image",
+                "_tokens": _search_tokens(ad.get("page_name"), ad.get("body")),
                 "created_at": datetime.utcnow(),
                 "updated_at": datetime.utcnow(),
             }
 
-            # Store in Firestore or local JSON
+            # Store in Firestore (batched below) or local JSON
             if self.firestore:
-                try:
-                    self.firestore.collection("ad_library").document(ad_id).set(doc)
-                    stored_ids.append(ad_id)
-                except Exception as e:
-                    print(f"Failed to store ad {ad_id}: {e}")
+                pending_docs.append(doc)
             else:
                 # Local JSON storage fallback
                 stored_ids.append(ad_id)
@@ -373,6 +731,9 @@ class AdLibraryService:
             else:
                 image_ads.append(doc)
 
+        if pending_docs:
+            stored_ids = self._store_firestore_batch(pending_docs)
+
         return {
             "query": query,
             "project_id": project_id,
@@ -389,14 +750,30 @@ class AdLibraryService:
         project_id: str,
         media_type: Optional[str] = None,
         limit: int = 100,
+        fields: Optional[List[str]] = None,
     ) -> List[Dict]:
-        """Get stored ads for a project."""
+        """
+        Get stored ads for a project.
+
+        Args:
+            project_id: Project ID
+            media_type: Optional "video" or "image" filter
+            limit: Max ads
+            fields: Optional projection (e.g. LIST_VIEW_FIELDS); Firestore
+                then only sends those fields. Defaults to full documents.
+
+        Returns:
+            List of ad documents, newest first
+        """
         if self.firestore:
             query = self.firestore.collection("ad_library").where("project_id", "==", project_id)
 
             if media_type:
                 query = query.where("media_type", "==", media_type)
 
+            if fields:
+                query = query.select(fields)
+
             query = query.order_by("created_at", direction="DESCENDING").limit(limit)
 
             docs = query.stream()
@@ -411,7 +788,11 @@ class AdLibraryService:
 
             # Sort by created_at descending
             results.sort(key=lambda x: x.get("created_at", ""), reverse=True)
-            return results[:limit]
+            results = results[:limit]
+
+            if fields:
+                results = [{k: d[k] for k in fields if k in d} for d in results]
+            return results
 
     def get_video_ads(self, project_id: str, limit: int = 50) -> List[Dict]:
         """Get only video ads for a project."""
@@ -425,30 +806,61 @@ class AdLibraryService:
         self,
         query: str,
         project_id: Optional[str] = None,
+        fields: Optional[List[str]] = None,
+        whole_words: bool = False,
     ) -> List[Dict]:
-        """Search stored ads by text."""
+        """
+        Search stored ads by text.
+
+        By default the query is a substring of the page name or body
+        ("nik" matches "Nike"), found by scanning the project's ads (or
+        500 ads without a project).
+
+        With whole_words=True, an ad matches when every word of the query
+        appears as a whole word ("shoe" does not match "shoes"). Firestore
+        then narrows candidates on the `_tokens` array written at store
+        time, so ads stored before `_tokens` existed are only found once
+        scripts/backfill_search_tokens.py has indexed them.
+
+        Args:
+            query: Text to match against page name and body
+            project_id: Optional project filter
+            fields: Optional projection for the returned ads; page_name and
+                body are always fetched for matching. Defaults to full documents.
+            whole_words: Match whole words via the `_tokens` index
+
+        Returns:
+            Matching ad documents
+        """
         if not self.firestore:
             return []
 
-        # Firestore doesn't support full-text search, so we fetch and filter
-        collection = self.firestore.collection("ad_library")
+        docs = self.firestore.collection("ad_library")
+        query_lower = query.lower()
+        tokens = set(_TOKEN_RE.findall(query_lower))
 
-        if project_id:
-            docs = collection.where("project_id", "==", project_id).stream()
-        else:
-            docs = collection.limit(500).stream()
+        if whole_words:
+            if not tokens:
+                return []
+            # Narrow on the most selective (longest) word
+            docs = docs.where("_tokens", "array_contains", max(tokens, key=len))
 
-        results = []
-        query_lower = query.lower()
+            def matches(data: Dict) -> bool:
+                text = f"{data.get('page_name') or ''} {data.get('body') or ''}".lower()
+                return tokens <= set(_TOKEN_RE.findall(text))
+        else:
+            def matches(data: Dict) -> bool:
+                return query_lower in (data.get("page_name", "") or "").lower() or \
+                    query_lower in (data.get("body", "") or "").lower()
 
-        for doc in docs:
-            data = doc.to_dict()
-            # Search in page_name and body
-            if query_lower in (data.get("page_name", "") or "").lower() or \
-               query_lower in (data.get("body", "") or "").lower():
-                results.append(data)
+        if project_id:
+            docs = docs.where("project_id", "==", project_id)
+        else:
+            docs = docs.limit(500)
+        if fields:
+            docs = docs.select(list({*fields, "page_name", "body"}))
 
-        return results
+        return [data for data in (doc.to_dict() for doc in docs.stream()) if matches(data)]
 
 
 # CLI for testing
@@ -19,11 +19,54 @@ Usage:
     video = service.download(results["ads"][0]["video_urls"][0])
 """
 
-from typing import Dict, Any, List, Optional
+import asyncio
+import re
+from functools import lru_cache
+from itertools import islice
+from typing import Dict, Any, Iterator, List, Optional
 from dataclasses import dataclass, asdict
 from datetime import datetime
 
 
+# Ad Library start dates look like "27 Jan 2024"
+_START_DATE_RE = re.compile(r"(\d{1,2}) ([A-Za-z]{3}) (\d{4})")
+_MONTHS = {
+    m: i for i, m in enumerate(
+        ["jan", "feb", "mar", "apr", "may", "jun", "jul", "aug", "sep", "oct", "nov", "dec"],
+        start=1,
+    )
+}
+
+
+def _start_date_key(ad: Dict) -> tuple:
+    """Chronological sort key (year, month, day); unparseable dates sort as (0, 0, 0)."""
+    match = _START_DATE_RE.search(ad.get("start_date") or "")
+    if not match:
+        return (0, 0, 0)
+    day, month, year = match.groups()
+    return (int(year), _MONTHS.get(month.lower(), 0), int(day))
+
+
+@lru_cache(maxsize=256)
+def _compiled_filter(
+    platform: Optional[str],
+    advertiser: Optional[str],
+    language: Optional[str],
+) -> tuple:
+    """
+    Prepare text filter values once per distinct filter set.
+
+    Returns:
+        (platform_lower, advertiser_lower, language_re); each is None when
+        the filter is unset
+    """
+    return (
+        platform.lower() if platform else None,
+        advertiser.lower() if advertiser else None,
+        re.compile(re.escape(language), re.IGNORECASE) if language else None,
+    )
+
+
 @dataclass
 class SearchFilters:
     """Search filter options matching Meta Ad Library UI."""
@@ -92,6 +135,65 @@ class AdSearchService:
         Returns:
             Dict with ads and metadata
         """
+        try:
+            ads = list(self.search_iter(
+                query=query,
+                country=country,
+                limit=limit,
+                language=language,
+                advertiser=advertiser,
+                platform=platform,
+                media_type=media_type,
+                active_status=active_status,
+                sort_by=sort_by,
+            ))
+        except RuntimeError as e:
+            return {"error": str(e), "ads": []}
+
+        return {
+            "query": query,
+            "country": country,
+            "filters": {
+                "language": language,
+                "advertiser": advertiser,
+                "platform": platform,
+                "media_type": media_type,
+                "active_status": active_status,
+                "sort_by": sort_by,
+            },
+            "total": len(ads),
+            "ads": ads,
+            "scraped_at": datetime.utcnow().isoformat(),
+        }
+
+    def search_iter(
+        self,
+        query: str,
+        country: str = "IN",
+        limit: int = 30,
+        language: Optional[str] = None,
+        advertiser: Optional[str] = None,
+        platform: Optional[str] = None,
+        media_type: Optional[str] = None,
+        active_status: str = "active",
+        sort_by: str = "newest",
+    ) -> Iterator[Dict]:
+        """
+        Search Meta Ad Library and return an iterator over matching ads.
+
+        Scraping happens before this returns, so failures surface to the
+        caller immediately; ads are then yielded one at a time, which lets
+        the API stream them without building the full response body.
+
+        Args:
+            Same as search()
+
+        Returns:
+            Iterator over filtered, sorted ads (at most `limit`)
+
+        Raises:
+            RuntimeError: If the scrape fails
+        """
         # Determine scraper media type
         scraper_media = "all"
         if media_type == "video":
@@ -108,7 +210,7 @@ class AdSearchService:
         )
 
         if "error" in result:
-            return {"error": result["error"], "ads": []}
+            raise RuntimeError(result["error"])
 
         ads = result.get("ads", [])
 
@@ -126,23 +228,7 @@ class AdSearchService:
         ads = self._sort_ads(ads, sort_by)
 
         # Apply limit
-        ads = ads[:limit]
-
-        return {
-            "query": query,
-            "country": country,
-            "filters": {
-                "language": language,
-                "advertiser": advertiser,
-                "platform": platform,
-                "media_type": media_type,
-                "active_status": active_status,
-                "sort_by": sort_by,
-            },
-            "total": len(ads),
-            "ads": ads,
-            "scraped_at": datetime.utcnow().isoformat(),
-        }
+        return islice(ads, limit)
 
     def _apply_filters(
         self,
@@ -153,44 +239,52 @@ class AdSearchService:
         advertiser: Optional[str],
         language: Optional[str],
     ) -> List[Dict]:
-        """Apply all filters to ads list."""
+        """Apply all filters to ads list in a single pass."""
+        platform_lower, advertiser_lower, language_re = _compiled_filter(
+            platform, advertiser, language
+        )
 
-        # Media type filter
-        if media_type == "video":
-            ads = [a for a in ads if a.get("has_video") or a.get("video_urls")]
-        elif media_type == "image":
-            ads = [a for a in ads if not a.get("has_video") and a.get("image_urls")]
-
-        # Active status filter
-        if active_status == "active":
-            ads = [a for a in ads if a.get("status") == "active"]
-        elif active_status == "inactive":
-            ads = [a for a in ads if a.get("status") != "active"]
-
-        # Platform filter
-        if platform:
-            platform_lower = platform.lower()
-            ads = [a for a in ads if any(
+        def keep(a: Dict) -> bool:
+            # Media type filter
+            if media_type == "video":
+                if not (a.get("has_video") or a.get("video_urls")):
+                    return False
+            elif media_type == "image":
+                if a.get("has_video") or not a.get("image_urls"):
+                    return False
+
+            # Active status filter
+            if active_status == "active":
+                if a.get("status") != "active":
+                    return False
+            elif active_status == "inactive":
+                if a.get("status") == "active":
+                    return False
+
+            # Platform filter
+            if platform_lower and not any(
                 platform_lower in p.lower() for p in a.get("platforms", [])
-            )]
+            ):
+                return False
 
-        # Advertiser filter
-        if advertiser:
-            advertiser_lower = advertiser.lower()
-            ads = [a for a in ads if advertiser_lower in (a.get("page_name") or "").lower()]
+            # Advertiser filter
+            if advertiser_lower and advertiser_lower not in (a.get("page_name") or "").lower():
+                return False
 
-        # Language filter (if we have language data)
-        if language:
-            ads = [a for a in ads if language.lower() in str(a.get("languages", [])).lower()]
+            # Language filter (if we have language data)
+            if language_re and not language_re.search(str(a.get("languages", []))):
+                return False
 
-        return ads
+            return True
+
+        return [a for a in ads if keep(a)]
 
     def _sort_ads(self, ads: List[Dict], sort_by: str) -> List[Dict]:
         """Sort ads list."""
         if sort_by == "newest":
-            return sorted(ads, key=lambda x: x.get("start_date", ""), reverse=True)
+            return sorted(ads, key=_start_date_key, reverse=True)
         elif sort_by == "oldest":
-            return sorted(ads, key=lambda x: x.get("start_date", ""))
+            return sorted(ads, key=_start_date_key)
         return ads
 
     def download(
@@ -220,20 +314,24 @@ class AdSearchService:
 
         # Save to Firestore
         if save_to_db and self.firestore and result["status"] == "downloaded":
-            doc = {
-                "id": result["video_id"],
-                "project_id": project_id,
-                "video_url_original": video_url,
-                "stored_url": result.get("stored_url"),
-                "local_path": result.get("local_path"),
-                "file_size": result.get("file_size"),
-                "status": result["status"],
-                "created_at": datetime.utcnow(),
-            }
+            doc = self._video_doc(result, video_url, project_id)
             self.firestore.collection("videos").document(result["video_id"]).set(doc)
 
         return result
 
+    def _video_doc(self, result: Dict, video_url: str, project_id: str) -> Dict[str, Any]:
+        """Build the Firestore `videos` document for a finished download."""
+        return {
+            "id": result["video_id"],
+            "project_id": project_id,
+            "video_url_original": video_url,
+            "stored_url": result.get("stored_url"),
+            "local_path": result.get("local_path"),
+            "file_size": result.get("file_size"),
+            "status": result["status"],
+            "created_at": datetime.utcnow(),
+        }
+
     def search_and_download(
         self,
         query: str,
@@ -245,6 +343,41 @@ class AdSearchService:
         """
         Search and download videos in one call.
 
+        Sync wrapper around search_and_download_async(); call the async
+        version directly from code already running an event loop.
+
+        Args:
+            query: Search term
+            project_id: Project ID
+            country: Country code
+            limit: Max videos to download
+            **filters: Additional search filters
+
+        Returns:
+            Dict with search results and download status
+        """
+        return asyncio.run(self.search_and_download_async(
+            query=query,
+            project_id=project_id,
+            country=country,
+            limit=limit,
+            **filters,
+        ))
+
+    async def search_and_download_async(
+        self,
+        query: str,
+        project_id: str = "default",
+        country: str = "IN",
+        limit: int = 10,
+        **filters,
+    ) -> Dict[str, Any]:
+        """
+        Search, then download the found videos concurrently.
+
+        Downloads run through VideoDownloader.download_batch_async, bounded
+        by its max_concurrent.
+
         Args:
             query: Search term
             project_id: Project ID
@@ -255,8 +388,10 @@ class AdSearchService:
         Returns:
             Dict with search results and download status
         """
-        # Search
-        search_result = self.search(
+        # Search; the scraper drives Playwright's sync API, which refuses to
+        # run on a thread with a running event loop, so scrape off-loop
+        search_result = await asyncio.to_thread(
+            self.search,
             query=query,
             country=country,
             limit=limit,
@@ -268,22 +403,21 @@ class AdSearchService:
             return search_result
 
         ads = search_result.get("ads", [])
-        downloaded = []
-        failed = []
+        jobs = [(ad, ad["video_urls"][0]) for ad in ads if ad.get("video_urls")]
 
-        # Download each video
-        for ad in ads:
-            video_urls = ad.get("video_urls", [])
-            if not video_urls:
-                continue
+        # Metadata is written in one batch after all downloads finish
+        batch = await self.downloader.download_batch_async(
+            [{"url": url} for _, url in jobs],
+            project_id=project_id,
+        )
 
-            result = self.download(
-                video_url=video_urls[0],
-                project_id=project_id,
-                save_to_db=True,
-            )
+        downloaded = []
+        failed = []
+        video_docs = []
 
-            if result["status"] == "downloaded":
+        for (ad, url), result in zip(jobs, batch["videos"]):
+            if result.get("status") == "downloaded":
+                video_docs.append(self._video_doc(result, url, project_id))
                 downloaded.append({
                     "video_id": result["video_id"],
                     "page_name": ad.get("page_name"),
@@ -295,6 +429,13 @@ class AdSearchService:
                     "error": result.get("error"),
                 })
 
+        if self.firestore and video_docs:
+            batch = self.firestore.batch()
+            videos = self.firestore.collection("videos")
+            for doc in video_docs:
+                batch.set(videos.document(doc["id"]), doc)
+            batch.commit()
+
         return {
             "query": query,
             "country": country,
@@ -333,36 +474,44 @@ class AdSearchService:
 
     def delete_video(self, video_id: str) -> bool:
         """Delete video from database and disk."""
-        import os
-
         if not self.firestore:
             return False
 
-        doc = self.firestore.collection("videos").document(video_id).get()
+        # Only local_path is needed, so fetch just that field
+        doc_ref = self.firestore.collection("videos").document(video_id)
+        doc = doc_ref.get(field_paths=["local_path"])
         if not doc.exists:
             return False
 
-        data = doc.to_dict()
-
-        # Delete file
-        local_path = data.get("local_path", "").replace("file://", "")
-        if local_path and os.path.exists(local_path):
-            os.remove(local_path)
+        # Delete file, unless a reused download still points at it
+        from .video_downloader import _delete_local_file
+        _delete_local_file(self.firestore, video_id, (doc.to_dict() or {}).get("local_path"))
 
         # Delete from Firestore
-        self.firestore.collection("videos").document(video_id).delete()
+        doc_ref.delete()
 
         return True
 
 
+# Shared service for the convenience functions; building one per call
+# repeats Firestore/GCS credential discovery and browser setup
+_default_service: Optional[AdSearchService] = None
+
+
+def _get_service() -> AdSearchService:
+    """Get or create the shared AdSearchService."""
+    global _default_service
+    if _default_service is None:
+        _default_service = AdSearchService()
+    return _default_service
+
+
 # Convenience function for quick internal calls
 def search_ads(query: str, country: str = "IN", **kwargs) -> Dict[str, Any]:
     """Quick search function for internal use."""
-    service = AdSearchService()
-    return service.search(query=query, country=country, **kwargs)
+    return _get_service().search(query=query, country=country, **kwargs)
 
 
 def download_video(video_url: str, project_id: str = "default") -> Dict[str, Any]:
     """Quick download function for internal use."""
-    service = AdSearchService()
-    return service.download(video_url=video_url, project_id=project_id)
+    return _get_service().download(video_url=video_url, project_id=project_id)
@@ -4,21 +4,275 @@ Video Downloader Service.
 Downloads video ads and stores them in Google Cloud Storage.
 """
 
+import io
 import os
+import time
+import queue
 import uuid
+import socket
 import asyncio
 import hashlib
-import tempfile
-import subprocess
-from datetime import datetime
-from typing import Dict, Any, List, Optional
-from concurrent.futures import ThreadPoolExecutor
+import threading
+from datetime import datetime, timezone
+from pathlib import Path
+from typing import Dict, Any, Iterable, List, Optional
+from urllib.parse import urlsplit
+from concurrent.futures import FIRST_COMPLETED, ThreadPoolExecutor, wait
 import requests
+from requests.adapters import HTTPAdapter
+from urllib3.connection import HTTPConnection
+from urllib3.util.retry import Retry
+
+
+# Storage client and bucket handles shared by every VideoDownloader; the
+# bucket lookup is an RPC, so it runs once per bucket name per process
+_storage_client = None
+_storage_error: Optional[str] = None
+_bucket_cache: Dict[str, Any] = {}
+_storage_lock = threading.Lock()
+
+
+def _get_bucket(bucket_name: str):
+    """
+    Get the shared storage client and bucket handle.
+
+    Returns:
+        (client, bucket); bucket is None if it doesn't exist or isn't
+        accessible
+
+    Raises:
+        RuntimeError: If Cloud Storage isn't available (cached after the
+            first failure)
+    """
+    global _storage_client, _storage_error
+
+    with _storage_lock:
+        if _storage_error is not None:
+            raise RuntimeError(_storage_error)
+
+        if _storage_client is None:
+            try:
+                from google.cloud import storage
+                _storage_client = storage.Client()
+            except Exception as e:
+                _storage_error = str(e)
+                raise RuntimeError(_storage_error)
+
+        if bucket_name not in _bucket_cache:
+            bucket = _storage_client.bucket(bucket_name)
+            try:
+                exists = bucket.exists()
+            except Exception:
+                exists = False
+            if not exists:
+                print(f"⚠ GCS bucket '{bucket_name}' not found, using local storage")
+            _bucket_cache[bucket_name] = bucket if exists else None
+
+        return _storage_client, _bucket_cache[bucket_name]
+
+
+def _download_socket_options() -> List[tuple]:
+    """
+    urllib3 defaults plus keepalive for long video transfers.
+
+    Buffer sizes are left to the kernel: setting SO_RCVBUF/SO_SNDBUF
+    turns off TCP autotuning, which already grows them as needed.
+    """
+    options = list(HTTPConnection.default_socket_options)
+    options.append((socket.SOL_SOCKET, socket.SO_KEEPALIVE, 1))
+    if hasattr(socket, "TCP_KEEPIDLE"):  # Linux only
+        options.append((socket.IPPROTO_TCP, socket.TCP_KEEPIDLE, 60))
+    return options
+
+
+class _DownloadAdapter(HTTPAdapter):
+    """HTTPAdapter whose pooled connections use _download_socket_options()."""
+
+    def init_poolmanager(self, *args, **kwargs):
+        kwargs["socket_options"] = _download_socket_options()
+        super().init_poolmanager(*args, **kwargs)
+
+
+def _url_hash(video_url: str) -> str:
+    """
+    Short stable hash identifying a video by URL.
+
+    The query string is dropped: Meta CDN URLs carry per-request signing
+    params, while the path identifies the asset.
+    """
+    base = urlsplit(video_url)._replace(query="", fragment="").geturl()
+    return hashlib.sha256(base.encode()).hexdigest()[:16]
+
+
+class _PrefetchReader:
+    """
+    Read-only file object that downloads ahead on a background thread.
+
+    Lets an upload send one chunk while the next is still arriving; at
+    most `depth` chunks are buffered. Errors from the source stream are
+    re-raised from read().
+
+    The last `keep` bytes handed out stay buffered, so a resumable upload
+    retrying its current chunk can seek() back within them.
+    """
+
+    def __init__(self, stream, chunk_size: int, depth: int = 8, keep: int = 0):
+        self._queue: "queue.Queue[Optional[bytes]]" = queue.Queue(maxsize=depth)
+        self._buffer = bytearray()
+        self._position = 0
+        self._keep = keep
+        self._history = bytearray()
+        self._eof = False
+        self._error: Optional[BaseException] = None
+        self._closed = threading.Event()
+        self._thread = threading.Thread(target=self._fill, args=(stream, chunk_size), daemon=True)
+        self._thread.start()
+
+    def _fill(self, stream, chunk_size: int):
+        try:
+            while not self._closed.is_set():
+                chunk = stream.read(chunk_size)
+                if not chunk:
+                    break
+                self._put(chunk)
+        except BaseException as e:
+            self._error = e
+        finally:
+            self._put(None)
+
+    def _put(self, item: Optional[bytes]):
+        # Give up once the reader is closed so the thread can't block forever
+        while not self._closed.is_set():
+            try:
+                self._queue.put(item, timeout=0.5)
+                return
+            except queue.Full:
+                continue
+
+    def read(self, size: int = -1) -> bytes:
+        while not self._eof and (size < 0 or len(self._buffer) < size):
+            chunk = self._queue.get()
+            if chunk is None:
+                self._eof = True
+                if self._error is not None:
+                    raise self._error
+                break
+            self._buffer += chunk
+
+        if size < 0 or size > len(self._buffer):
+            size = len(self._buffer)
+        data = bytes(self._buffer[:size])
+        del self._buffer[:size]
+        self._position += size
+
+        if self._keep:
+            self._history += data
+            if len(self._history) > self._keep:
+                del self._history[:len(self._history) - self._keep]
+        return data
+
+    def tell(self) -> int:
+        return self._position
+
+    def seekable(self) -> bool:
+        return bool(self._keep)
+
+    def seek(self, offset: int, whence: int = io.SEEK_SET) -> int:
+        if whence == io.SEEK_CUR:
+            offset += self._position
+        elif whence != io.SEEK_SET:
+            raise io.UnsupportedOperation("can only seek relative to start or current position")
+
+        back = self._position - offset
+        if back > len(self._history) or offset < 0:
+            raise io.UnsupportedOperation(f"cannot seek back past the last {self._keep} bytes")
+
+        if back > 0:
+            # Replay retained bytes: move them from history to the read buffer
+            self._buffer[:0] = self._history[-back:]
+            del self._history[-back:]
+            self._position = offset
+        elif back < 0:
+            self.read(-back)
+        return self._position
+
+    def close(self):
+        self._closed.set()
+
+
+def _shape_video(
+    ad: Dict,
+    keyword: str,
+    country: str,
+    project_id: str,
+    created_at: datetime,
+) -> Optional[Dict[str, Any]]:
+    """Build the `videos` doc for a scraped ad, or None if it has no video."""
+    get = ad.get
+    video_urls = get("video_urls")
+    if not (video_urls and get("has_video")):
+        return None
+
+    video_url = video_urls[0]
+    return {
+        "id": str(uuid.uuid4()),
+        "project_id": project_id,
+        "keyword": keyword,
+        "country": country,
+        "page_name": get("page_name"),
+        "body": get("body"),
+        "start_date": get("start_date"),
+        "platforms": get("platforms", []),
+        "video_url_original": video_url,
+        "url_hash": _url_hash(video_url),
+        "status": "pending",
+        "created_at": created_at,
+    }
+
+
+def _delete_local_file(firestore_client, video_id: str, local_path: Optional[str]):
+    """
+    Delete a video's local file unless another `videos` doc still uses it.
+
+    Collections reuse a stored download for repeated creatives, so several
+    docs can point at the same file.
+    """
+    if not local_path:
+        return
+
+    others = (
+        firestore_client.collection("videos")
+        .where("local_path", "==", local_path)
+        .select([])
+        .limit(2)
+        .stream()
+    )
+    if any(doc.id != video_id for doc in others):
+        return
+
+    Path(local_path.removeprefix("file://")).unlink(missing_ok=True)
 
 
 class VideoDownloader:
     """Downloads videos from URLs and uploads to Cloud Storage."""
 
+    # Read/write size for local downloads (override with RESEARCH_HUB_DL_CHUNK)
+    DOWNLOAD_CHUNK_SIZE = int(os.environ.get("RESEARCH_HUB_DL_CHUNK", 1 << 20))
+
+    # Videos above the threshold are uploaded as parallel parts, then composed
+    COMPOSITE_THRESHOLD = 64 << 20
+    COMPOSITE_PART_SIZE = 32 << 20
+    UPLOAD_CONCURRENCY = int(os.environ.get("GCS_UPLOAD_CONCURRENCY", 4))
+    MAX_COMPOSE_SOURCES = 32  # GCS limit per compose request
+    # Validate uploads with CRC32C (C-accelerated via google-crc32c), not MD5
+    UPLOAD_CHECKSUM = "crc32c"
+    # Resumable uploads send this much per request (multiple of 256 KiB);
+    # the client default of 100 MiB would buffer most videos whole
+    UPLOAD_CHUNK_SIZE = 8 << 20
+    # google-cloud-storage sends bodies up to this size as one multipart
+    # request; anything larger (or of unknown size) is a resumable upload
+    MULTIPART_MAX_SIZE = 8 << 20
+
     def __init__(
         self,
         bucket_name: str = None,
@@ -31,24 +285,53 @@ class VideoDownloader:
         self.storage_client = None
         self.bucket = None
         self._init_storage()
+        self.session = self._build_session()
+
+    def _build_session(self) -> requests.Session:
+        """Pooled keep-alive session shared by all downloads (incl. batch threads)."""
+        session = requests.Session()
+        adapter = _DownloadAdapter(
+            pool_connections=self.max_concurrent,
+            pool_maxsize=self.max_concurrent * 2,
+            max_retries=Retry(total=3, backoff_factor=0.3, status_forcelist=[502, 503, 504]),
+        )
+        session.mount("https://", adapter)
+        session.mount("http://", adapter)
+        return session
+
+    def close(self):
+        """Close pooled HTTP connections."""
+        self.session.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
 
     def _init_storage(self):
-        """Initialize Google Cloud Storage client."""
+        """Initialize Google Cloud Storage client (shared across instances)."""
         try:
-            from google.cloud import storage
-            self.storage_client = storage.Client()
-            # Try to get or create bucket
-            try:
-                self.bucket = self.storage_client.get_bucket(self.bucket_name)
-            except Exception:
-                # Bucket doesn't exist, will use local storage
-                self.bucket = None
-                print(f"⚠ GCS bucket '{self.bucket_name}' not found, using local storage")
+            # A missing bucket means local storage is used
+            self.storage_client, self.bucket = _get_bucket(self.bucket_name)
         except Exception as e:
             print(f"⚠ Cloud Storage not available: {e}")
             self.storage_client = None
             self.bucket = None
 
+    @staticmethod
+    def _new_result(video_id: str, video_url: str) -> Dict[str, Any]:
+        """Initial per-video result dict."""
+        return {
+            "video_id": video_id,
+            "status": "pending",
+            "original_url": video_url,
+            "stored_url": None,
+            "local_path": None,
+            "file_size": 0,
+            "error": None,
+        }
+
     def download_video(
         self,
         video_url: str,
@@ -69,48 +352,78 @@ class VideoDownloader:
             Dict with download result
         """
         video_id = video_id or str(uuid.uuid4())
-        result = {
-            "video_id": video_id,
-            "status": "pending",
-            "original_url": video_url,
-            "stored_url": None,
-            "local_path": None,
-            "file_size": 0,
-            "error": None,
-        }
+        result = self._new_result(video_id, video_url)
+        part_path = None
 
         try:
-            # Create temp file
-            with tempfile.NamedTemporaryFile(suffix=".mp4", delete=False) as tmp:
-                tmp_path = tmp.name
-
-            # Download video
             print(f"Downloading {video_id}...")
-            response = requests.get(video_url, stream=True, timeout=120)
-            response.raise_for_status()
-
-            with open(tmp_path, "wb") as f:
-                for chunk in response.iter_content(chunk_size=8192):
-                    f.write(chunk)
-
-            file_size = os.path.getsize(tmp_path)
-            result["file_size"] = file_size
-            print(f"Downloaded {file_size / 1024 / 1024:.1f} MB")
 
-            # Upload to Cloud Storage or save locally
             if self.bucket:
+                # Stream the response body straight into the upload; no
+                # temp file on disk
                 blob_path = f"videos/{project_id}/{video_id}.mp4"
                 blob = self.bucket.blob(blob_path)
-                blob.upload_from_filename(tmp_path)
+
+                with self.session.get(video_url, stream=True, timeout=120) as response:
+                    response.raise_for_status()
+                    response.raw.decode_content = True
+
+                    # Content-Length is only the body size when the
+                    # transfer isn't compressed
+                    size = None
+                    if "Content-Encoding" not in response.headers:
+                        size = int(response.headers.get("Content-Length", 0)) or None
+
+                    if size and size > self.COMPOSITE_THRESHOLD:
+                        self._upload_parallel_composite(response.raw, blob)
+                    else:
+                        # Small known sizes go up in one multipart request.
+                        # Anything else is resumable: send it in chunks so
+                        # the upload starts before the download finishes
+                        keep = 0
+                        if size is None or size > self.MULTIPART_MAX_SIZE:
+                            blob.chunk_size = keep = self.UPLOAD_CHUNK_SIZE
+                        # Keep downloading while the upload reads; a chunk
+                        # retry seeks back within the retained bytes
+                        reader = _PrefetchReader(response.raw, self.DOWNLOAD_CHUNK_SIZE, keep=keep)
+                        try:
+                            blob.upload_from_file(
+                                reader, size=size, content_type="video/mp4", checksum=self.UPLOAD_CHECKSUM
+                            )
+                        finally:
+                            reader.close()
+
+                file_size = blob.size or size or 0
+                result["file_size"] = file_size
+                print(f"Uploaded {file_size / 1024 / 1024:.1f} MB")
+
                 result["stored_url"] = f"gs://{self.bucket_name}/{blob_path}"
                 result["public_url"] = blob.public_url
-                os.unlink(tmp_path)  # Clean up temp file
             else:
-                # Local storage fallback
+                # Local storage fallback: write a .part file next to the
+                # destination (same filesystem), then rename it into place
                 local_dir = f"data/videos/{project_id}"
                 os.makedirs(local_dir, exist_ok=True)
                 local_path = f"{local_dir}/{video_id}.mp4"
-                os.rename(tmp_path, local_path)
+                part_path = f"{local_path}.part"
+
+                response = self.session.get(video_url, stream=True, timeout=120)
+                response.raise_for_status()
+                response.raw.decode_content = True
+
+                # Same loop as shutil.copyfileobj, but counts bytes so no
+                # stat is needed afterwards
+                file_size = 0
+                read = response.raw.read
+                with open(part_path, "wb", buffering=self.DOWNLOAD_CHUNK_SIZE) as f:
+                    while chunk := read(self.DOWNLOAD_CHUNK_SIZE):
+                        f.write(chunk)
+                        file_size += len(chunk)
+
+                result["file_size"] = file_size
+                print(f"Downloaded {file_size / 1024 / 1024:.1f} MB")
+
+                os.replace(part_path, local_path)
                 result["local_path"] = local_path
                 result["stored_url"] = f"file://{os.path.abspath(local_path)}"
 
@@ -119,12 +432,81 @@ class VideoDownloader:
         except Exception as e:
             result["status"] = "failed"
             result["error"] = str(e)
-            # Clean up temp file if exists
-            if 'tmp_path' in locals() and os.path.exists(tmp_path):
-                os.unlink(tmp_path)
+            # Clean up partial file if exists
+            if part_path:
+                try:
+                    os.unlink(part_path)
+                except FileNotFoundError:
+                    pass
 
         return result
 
+    def _upload_parallel_composite(self, stream, blob) -> None:
+        """
+        Upload a large stream as parallel part blobs, then compose into blob.
+
+        Parts are read from the stream in order and uploaded while the next
+        part downloads; at most UPLOAD_CONCURRENCY parts are buffered at
+        once. Part and intermediate blobs are always deleted.
+
+        Args:
+            stream: Readable binary stream (e.g. response.raw)
+            blob: Destination blob
+        """
+        part_prefix = f"{blob.name}.parts/"
+        temp_blobs = []
+
+        with ThreadPoolExecutor(max_workers=self.UPLOAD_CONCURRENCY) as executor:
+            try:
+                parts = []
+                pending = set()
+
+                while True:
+                    data = stream.read(self.COMPOSITE_PART_SIZE)
+                    if not data:
+                        break
+
+                    part = self.bucket.blob(f"{part_prefix}{len(parts):04d}")
+                    parts.append(part)
+                    temp_blobs.append(part)
+                    pending.add(executor.submit(
+                        part.upload_from_string, data, content_type="video/mp4", checksum=self.UPLOAD_CHECKSUM
+                    ))
+
+                    if len(pending) >= self.UPLOAD_CONCURRENCY:
+                        done, pending = wait(pending, return_when=FIRST_COMPLETED)
+                        for future in done:
+                            future.result()
+
+                for future in pending:
+                    future.result()
+
+                # Compose is capped at 32 sources, so nest for longer videos
+                level = 0
+                while len(parts) > self.MAX_COMPOSE_SOURCES:
+                    merged = []
+                    for i in range(0, len(parts), self.MAX_COMPOSE_SOURCES):
+                        inter = self.bucket.blob(f"{part_prefix}c{level}-{i:04d}")
+                        inter.content_type = "video/mp4"
+                        inter.compose(parts[i:i + self.MAX_COMPOSE_SOURCES])
+                        merged.append(inter)
+                        temp_blobs.append(inter)
+                    parts = merged
+                    level += 1
+
+                blob.content_type = "video/mp4"
+                blob.compose(parts)
+            finally:
+                list(executor.map(self._delete_quietly, temp_blobs))
+
+    @staticmethod
+    def _delete_quietly(blob) -> None:
+        """Delete a temporary blob, ignoring failures."""
+        try:
+            blob.delete()
+        except Exception:
+            pass
+
     def download_batch(
         self,
         videos: List[Dict],
@@ -180,29 +562,25 @@ class VideoDownloader:
         videos: List[Dict],
         project_id: str = "default",
     ) -> Dict[str, Any]:
-        """Download videos concurrently."""
-        loop = asyncio.get_event_loop()
-
-        with ThreadPoolExecutor(max_workers=self.max_concurrent) as executor:
-            tasks = []
-            for video in videos:
-                url = video.get("url") or video.get("video_url")
-                if not url:
-                    continue
-
-                video_id = video.get("id") or str(uuid.uuid4())
+        """
+        Download videos concurrently, at most max_concurrent at a time.
 
-                task = loop.run_in_executor(
-                    executor,
-                    self.download_video,
-                    url,
-                    video_id,
-                    project_id,
-                    video.get("metadata"),
-                )
-                tasks.append(task)
+        Local-storage downloads run as aiohttp coroutines on the event loop.
+        With a bucket, downloads run on a thread pool instead: the GCS
+        client is synchronous and each thread streams its response
+        straight into the upload.
+        """
+        jobs = []
+        for video in videos:
+            url = video.get("url") or video.get("video_url")
+            if not url:
+                continue
+            jobs.append((url, video.get("id") or str(uuid.uuid4()), video.get("metadata")))
 
-            results_list = await asyncio.gather(*tasks, return_exceptions=True)
+        if self.bucket:
+            results_list = await self._download_threaded(jobs, project_id)
+        else:
+            results_list = await self._download_aiohttp(jobs, project_id)
 
         results = {
             "total": len(videos),
@@ -224,19 +602,106 @@ class VideoDownloader:
 
         return results
 
+    async def _download_threaded(self, jobs: List[tuple], project_id: str) -> List[Any]:
+        """Run download_video for each (url, id, metadata) job on a thread pool."""
+        loop = asyncio.get_running_loop()
+
+        with ThreadPoolExecutor(max_workers=self.max_concurrent) as executor:
+            tasks = [
+                loop.run_in_executor(executor, self.download_video, url, video_id, project_id, metadata)
+                for url, video_id, metadata in jobs
+            ]
+            return await asyncio.gather(*tasks, return_exceptions=True)
+
+    async def _download_aiohttp(self, jobs: List[tuple], project_id: str) -> List[Any]:
+        """Download each (url, id, metadata) job to local storage with aiohttp."""
+        import aiohttp
+
+        semaphore = asyncio.Semaphore(self.max_concurrent)
+        connector = aiohttp.TCPConnector(limit=self.max_concurrent, limit_per_host=self.max_concurrent)
+        # Same per-socket limits as the requests timeout=120
+        timeout = aiohttp.ClientTimeout(sock_connect=120, sock_read=120)
+
+        async with aiohttp.ClientSession(connector=connector, timeout=timeout) as session:
+            async def run(url: str, video_id: str) -> Dict[str, Any]:
+                async with semaphore:
+                    return await self._download_local_async(session, url, video_id, project_id)
+
+            return await asyncio.gather(
+                *(run(url, video_id) for url, video_id, _ in jobs),
+                return_exceptions=True,
+            )
+
+    async def _download_local_async(
+        self,
+        session,
+        video_url: str,
+        video_id: str,
+        project_id: str,
+    ) -> Dict[str, Any]:
+        """Async counterpart of download_video's local-storage path."""
+        result = self._new_result(video_id, video_url)
+
+        local_dir = f"data/videos/{project_id}"
+        os.makedirs(local_dir, exist_ok=True)
+        local_path = f"{local_dir}/{video_id}.mp4"
+        part_path = f"{local_path}.part"
+
+        try:
+            print(f"Downloading {video_id}...")
+            file_size = 0
+
+            async with session.get(video_url) as response:
+                response.raise_for_status()
+                # Chunks go to the page cache, so plain writes don't stall the loop
+                with open(part_path, "wb") as f:
+                    async for chunk in response.content.iter_chunked(self.DOWNLOAD_CHUNK_SIZE):
+                        f.write(chunk)
+                        file_size += len(chunk)
+
+            os.replace(part_path, local_path)
+            result["file_size"] = file_size
+            print(f"Downloaded {file_size / 1024 / 1024:.1f} MB")
+
+            result["local_path"] = local_path
+            result["stored_url"] = f"file://{os.path.abspath(local_path)}"
+            result["status"] = "downloaded"
+
+        except Exception as e:
+            result["status"] = "failed"
+            result["error"] = str(e)
+            try:
+                os.unlink(part_path)
+            except FileNotFoundError:
+                pass
+
+        return result
+
 
 class VideoCollectionService:
     """
     High-level service for collecting and downloading video ads.
     """
 
+    # Flush downloaded video docs every N videos or every N seconds,
+    # whichever comes first (Firestore batches cap at 500 writes)
+    WRITE_BATCH_SIZE = 100
+    JOB_UPDATE_INTERVAL = 5.0
+
     def __init__(self, firestore_client=None):
-        from .ad_library_service import AdLibraryScraper
-        self.scraper = AdLibraryScraper()
+        self._scraper = None
         self.downloader = VideoDownloader()
         self.firestore = firestore_client
         self._init_firestore()
 
+    @property
+    def scraper(self):
+        """Ad Library scraper, imported and built on first use."""
+        if self._scraper is None:
+            from .ad_library_service import AdLibraryScraper
+            self._scraper = AdLibraryScraper()
+        return self._scraper
+
     def _init_firestore(self):
         """Initialize Firestore."""
         if self.firestore is None:
@@ -246,6 +711,87 @@ class VideoCollectionService:
             except:
                 self.firestore = None
 
+    @staticmethod
+    def _progress_update(job: Dict, *keys: str) -> Dict[str, Any]:
+        """Field-path update for just the given progress counters."""
+        progress = job["progress"]
+        return {f"progress.{key}": progress[key] for key in keys}
+
+    def _flush_videos(self, videos: List[Dict], job_id: str, job: Dict):
+        """Write video docs plus the current download counters in one batch."""
+        batch = self.firestore.batch()
+        collection = self.firestore.collection("videos")
+        for video in videos:
+            batch.set(collection.document(video["id"]), video)
+        batch.update(
+            self.firestore.collection("collection_jobs").document(job_id),
+            self._progress_update(job, "videos_downloaded", "videos_failed"),
+        )
+        batch.commit()
+
+    # Firestore caps `in` filters at 30 values
+    LOOKUP_BATCH_SIZE = 30
+
+    def _find_downloaded(self, url_hashes: Iterable[str]) -> Dict[str, Dict[str, Any]]:
+        """
+        Look up previously downloaded videos by URL hash, 30 hashes per query.
+
+        Returns:
+            {url_hash: download_video() style result to reuse}
+        """
+        found: Dict[str, Dict[str, Any]] = {}
+        if not self.firestore:
+            return found
+
+        url_hashes = list(dict.fromkeys(url_hashes))
+        collection = self.firestore.collection("videos")
+
+        for start in range(0, len(url_hashes), self.LOOKUP_BATCH_SIZE):
+            docs = (
+                collection
+                .where("url_hash", "in", url_hashes[start:start + self.LOOKUP_BATCH_SIZE])
+                .where("status", "==", "downloaded")
+                .select(["url_hash", "stored_url", "local_path", "file_size"])
+                .stream()
+            )
+            for doc in docs:
+                data = doc.to_dict()
+                url_hash = data.get("url_hash")
+                local_path = data.get("local_path")
+                # Local files from another machine or a cleaned data dir can't be reused
+                if url_hash in found or (local_path and not os.path.exists(local_path)):
+                    continue
+                found[url_hash] = {
+                    "status": "downloaded",
+                    "stored_url": data.get("stored_url"),
+                    "local_path": local_path,
+                    "file_size": data.get("file_size", 0),
+                    "error": None,
+                }
+        return found
+
+    async def _scrape_all(
+        self,
+        keywords: List[str],
+        countries: List[str],
+        limit: int,
+    ) -> Dict[str, List[Dict[str, Any]]]:
+        """
+        Scrape every keyword/country pair concurrently.
+
+        All pairs go through one scraper.scrape_pairs call, so the whole
+        collection shares one browser and a bounded number of open pages.
+
+        Returns:
+            {country: [scrape result per keyword, in keyword order]}
+        """
+        pairs = [(keyword, country) for country in countries for keyword in keywords]
+        results = await self.scraper.scrape_pairs(pairs, limit=limit, media_type="video")
+        return {
+            country: results[i * len(keywords):(i + 1) * len(keywords)]
+            for i, country in enumerate(countries)
+        }
+
     def collect_videos(
         self,
         keywords: List[str],
@@ -258,6 +804,10 @@ class VideoCollectionService:
         """
         Collect video ads for multiple keywords.
 
+        Runs collect_videos_async to completion with asyncio.run, so it
+        must not be called from a running event loop; await
+        collect_videos_async there instead.
+
         Args:
             keywords: List of search terms
             project_id: Project ID
@@ -269,8 +819,53 @@ class VideoCollectionService:
         Returns:
             Collection results
         """
+        return asyncio.run(self.collect_videos_async(
+            keywords,
+            project_id,
+            countries=countries,
+            max_per_keyword=max_per_keyword,
+            download=download,
+            on_progress=on_progress,
+        ))
+
+    async def collect_videos_async(
+        self,
+        keywords: List[str],
+        project_id: str,
+        countries: List[str] = None,
+        max_per_keyword: int = 50,
+        download: bool = True,
+        on_progress: callable = None,
+    ) -> Dict[str, Any]:
+        """
+        Async version of collect_videos.
+
+        Scraping runs on the event loop; Firestore writes and downloads are
+        blocking, so they run on a worker thread (on_progress is called
+        from that thread).
+        """
         countries = countries or ["US"]
 
+        job = await asyncio.to_thread(
+            self._start_job, keywords, project_id, countries, max_per_keyword, download
+        )
+
+        print(f"\nScraping {len(keywords)} keyword(s) in {len(countries)} country(ies)...")
+        scraped = await self._scrape_all(keywords, countries, max_per_keyword)
+
+        return await asyncio.to_thread(
+            self._collect_scraped, job, scraped, download, on_progress
+        )
+
+    def _start_job(
+        self,
+        keywords: List[str],
+        project_id: str,
+        countries: List[str],
+        max_per_keyword: int,
+        download: bool,
+    ) -> Dict[str, Any]:
+        """Create the collection job and save it to Firestore."""
         job_id = str(uuid.uuid4())
         job = {
             "id": job_id,
@@ -289,63 +884,60 @@ class VideoCollectionService:
                 "videos_downloaded": 0,
                 "videos_failed": 0,
             },
-            "started_at": datetime.utcnow(),
+            "started_at": datetime.now(timezone.utc),
         }
 
         # Save job to Firestore
         if self.firestore:
             self.firestore.collection("collection_jobs").document(job_id).set(job)
 
+        return job
+
+    def _collect_scraped(
+        self,
+        job: Dict[str, Any],
+        scraped: Dict[str, List[Dict[str, Any]]],
+        download: bool,
+        on_progress: callable,
+    ) -> Dict[str, Any]:
+        """Shape scraped ads into video docs, download them and finish the job."""
+        job_id = job["id"]
+        project_id = job["project_id"]
+        keywords = job["config"]["keywords"]
+        countries = job["config"]["countries"]
+
         all_videos = []
 
         for i, keyword in enumerate(keywords):
             print(f"\n[{i+1}/{len(keywords)}] Collecting videos for '{keyword}'...")
 
+            # One timestamp per keyword; created_at doesn't need finer precision
+            now = datetime.now(timezone.utc)
+
             for country in countries:
-                # Scrape video ads
-                result = self.scraper.scrape(
-                    query=keyword,
-                    country=country,
-                    limit=max_per_keyword,
-                    media_type="video",
-                )
+                result = scraped[country][i]
 
                 if "error" in result:
                     print(f"  Error scraping {keyword}/{country}: {result['error']}")
                     continue
 
-                ads = result.get("ads", [])
-                video_ads = [a for a in ads if a.get("has_video") and a.get("video_urls")]
-
-                print(f"  Found {len(video_ads)} video ads in {country}")
-
-                for ad in video_ads:
-                    video_urls = ad.get("video_urls", [])
-                    if not video_urls:
-                        continue
-
-                    video_data = {
-                        "id": str(uuid.uuid4()),
-                        "project_id": project_id,
-                        "keyword": keyword,
-                        "country": country,
-                        "page_name": ad.get("page_name"),
-                        "body": ad.get("body"),
-                        "start_date": ad.get("start_date"),
-                        "platforms": ad.get("platforms", []),
-                        "video_url_original": video_urls[0],
-                        "status": "pending",
-                        "created_at": datetime.utcnow(),
-                    }
-
-                    all_videos.append(video_data)
-                    job["progress"]["videos_found"] += 1
+                found_before = len(all_videos)
+                all_videos.extend(filter(None, (
+                    _shape_video(ad, keyword, country, project_id, now)
+                    for ad in result.get("ads", [])
+                )))
+                found = len(all_videos) - found_before
+
+                print(f"  Found {found} video ads in {country}")
+                job["progress"]["videos_found"] += found
 
             job["progress"]["completed_keywords"] += 1
 
             # Update job progress
             if self.firestore:
-                self.firestore.collection("collection_jobs").document(job_id).update(job)
+                self.firestore.collection("collection_jobs").document(job_id).update(
+                    self._progress_update(job, "completed_keywords", "videos_found")
+                )
 
             if on_progress:
                 on_progress(job["progress"])
@@ -355,15 +947,27 @@ class VideoCollectionService:
         # Download videos
         if download and all_videos:
             print(f"\nDownloading {len(all_videos)} videos...")
+            pending_videos = []
+            last_flush = time.monotonic()
+            # The same creative often shows up under several keywords/countries
+            # and across collections; seed with what's already stored
+            downloaded_by_hash = self._find_downloaded(v["url_hash"] for v in all_videos)
 
             for j, video in enumerate(all_videos):
                 print(f"[{j+1}/{len(all_videos)}] {video.get('page_name', 'Unknown')}...")
 
-                download_result = self.downloader.download_video(
-                    video_url=video["video_url_original"],
-                    video_id=video["id"],
-                    project_id=project_id,
-                )
+                url_hash = video["url_hash"]
+                download_result = downloaded_by_hash.get(url_hash)
+                if download_result:
+                    print(f"  Already stored, reusing {download_result.get('stored_url')}")
+                else:
+                    download_result = self.downloader.download_video(
+                        video_url=video["video_url_original"],
+                        video_id=video["id"],
+                        project_id=project_id,
+                    )
+                    if download_result["status"] == "downloaded":
+                        downloaded_by_hash[url_hash] = download_result
 
                 video["status"] = download_result["status"]
                 video["stored_url"] = download_result.get("stored_url")
@@ -376,20 +980,29 @@ class VideoCollectionService:
                 else:
                     job["progress"]["videos_failed"] += 1
 
-                # Save video to Firestore
-                if self.firestore:
-                    self.firestore.collection("videos").document(video["id"]).set(video)
-
-                # Update job
+                # Save videos and job progress to Firestore in batches
                 if self.firestore:
-                    self.firestore.collection("collection_jobs").document(job_id).update(job)
+                    pending_videos.append(video)
+                    if (
+                        len(pending_videos) >= self.WRITE_BATCH_SIZE
+                        or time.monotonic() - last_flush >= self.JOB_UPDATE_INTERVAL
+                    ):
+                        self._flush_videos(pending_videos, job_id, job)
+                        pending_videos = []
+                        last_flush = time.monotonic()
+
+            if self.firestore and pending_videos:
+                self._flush_videos(pending_videos, job_id, job)
 
         # Complete job
         job["status"] = "completed"
-        job["completed_at"] = datetime.utcnow()
+        job["completed_at"] = datetime.now(timezone.utc)
 
         if self.firestore:
-            self.firestore.collection("collection_jobs").document(job_id).update(job)
+            self.firestore.collection("collection_jobs").document(job_id).update({
+                "status": job["status"],
+                "completed_at": job["completed_at"],
+            })
 
         return {
             "job_id": job_id,
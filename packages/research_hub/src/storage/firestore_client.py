@@ -1,11 +1,13 @@
 """
 Firestore Client for Research Hub.
 
-Provides async operations for Google Cloud Firestore.
+Provides async operations for Google Cloud Firestore via the native
+AsyncClient, so awaiting a query releases the event loop.
 """
 
-from typing import Dict, Any, Optional, List
-from datetime import datetime
+import re
+from typing import Dict, Any, Optional, List, AsyncIterator
+from datetime import datetime, timezone
 
 from google.cloud import firestore
 from google.cloud.firestore_v1.base_query import FieldFilter
@@ -13,6 +15,28 @@ from google.cloud.firestore_v1.base_query import FieldFilter
 from ..config import GOOGLE_CLOUD_PROJECT
 
 
+# Fields covered by search(); their words are indexed in `_tokens`
+_SEARCH_FIELDS = ("title", "input_query", "summary")
+_TOKEN_RE = re.compile(r"\w+")
+_MAX_TOKENS = 200
+
+
+def _now_iso() -> str:
+    """
+    Current UTC time as a naive ISO string (utcnow is deprecated).
+
+    ResearchEntry writes naive UTC created_at values; dropping the offset
+    keeps updated_at comparable with them once loaded through from_dict.
+    """
+    return datetime.now(timezone.utc).replace(tzinfo=None).isoformat()
+
+
+def _search_tokens(data: Dict[str, Any]) -> List[str]:
+    """Lowercase word tokens (deduped, first-seen order) for array_contains search."""
+    text = " ".join(str(data.get(f) or "") for f in _SEARCH_FIELDS).lower()
+    return list(dict.fromkeys(_TOKEN_RE.findall(text)))[:_MAX_TOKENS]
+
+
 class FirestoreClient:
     """
     Google Cloud Firestore client for research data.
@@ -24,17 +48,17 @@ class FirestoreClient:
 
     def __init__(self, project_id: str = None):
         self.project_id = project_id or GOOGLE_CLOUD_PROJECT
-        self._client: Optional[firestore.Client] = None
+        self._client: Optional[firestore.AsyncClient] = None
 
     @property
     def is_configured(self) -> bool:
         """Check if Firestore is properly configured."""
         return bool(self.project_id)
 
-    def _get_client(self) -> firestore.Client:
+    def _get_client(self) -> firestore.AsyncClient:
         """Get or create Firestore client."""
         if self._client is None:
-            self._client = firestore.Client(project=self.project_id)
+            self._client = firestore.AsyncClient(project=self.project_id)
         return self._client
 
     @property
@@ -60,15 +84,49 @@ class FirestoreClient:
             raise ValueError("Document must have an 'id' field")
 
         # Add timestamps
-        data["created_at"] = data.get("created_at", datetime.utcnow().isoformat())
-        data["updated_at"] = datetime.utcnow().isoformat()
+        now = _now_iso()
+        data["created_at"] = data.get("created_at", now)
+        data["updated_at"] = now
+        data["_tokens"] = _search_tokens(data)
 
         # Use set() with document ID
         doc_ref = self.collection.document(doc_id)
-        doc_ref.set(data)
+        await doc_ref.set(data)
 
         return data
 
+    async def insert_many(self, docs: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
+        """
+        Insert several documents with batched writes.
+
+        Args:
+            docs: Document data list (each must include an 'id' field)
+
+        Returns:
+            Inserted document data
+        """
+        if not self.is_configured:
+            raise Exception("Firestore not configured")
+
+        now = _now_iso()
+        collection = self.collection
+
+        # Firestore caps a batch at 500 writes
+        for start in range(0, len(docs), 500):
+            batch = self._get_client().batch()
+            for data in docs[start:start + 500]:
+                doc_id = data.get("id")
+                if not doc_id:
+                    raise ValueError("Document must have an 'id' field")
+
+                data["created_at"] = data.get("created_at", now)
+                data["updated_at"] = now
+                data["_tokens"] = _search_tokens(data)
+                batch.set(collection.document(doc_id), data)
+            await batch.commit()
+
+        return docs
+
     async def select(
         self,
         filters: Optional[Dict[str, Any]] = None,
@@ -76,16 +134,28 @@ class FirestoreClient:
         order_desc: bool = True,
         limit: int = 50,
         offset: int = 0,
+        start_after: Optional[Dict[str, Any]] = None,
+        in_filters: Optional[Dict[str, List[Any]]] = None,
+        array_contains_any: Optional[Dict[str, List[Any]]] = None,
     ) -> List[Dict[str, Any]]:
         """
         Query documents from the collection.
 
+        Prefer `start_after` for paging: it resumes from a cursor, so each
+        page costs `limit` reads however deep it is. `offset` still works
+        but Firestore bills the skipped documents.
+
         Args:
             filters: Field filters as {field: value}
+            in_filters: Membership filters as {field: [values]}
+            array_contains_any: Array filters as {field: [values]}; matches
+                documents whose array field holds any of the values
             order_by: Field to order by
             order_desc: Whether to order descending
             limit: Maximum documents to return
             offset: Number of documents to skip
+            start_after: Last document of the previous page (at least its
+                `order_by` value and `id`); the next page starts after it
 
         Returns:
             List of matching documents
@@ -93,30 +163,58 @@ class FirestoreClient:
         if not self.is_configured:
             raise Exception("Firestore not configured")
 
-        query = self.collection
+        query = self._filtered(filters)
+
+        for field, values in (in_filters or {}).items():
+            if values:
+                query = query.where(filter=FieldFilter(field, "in", values))
 
-        # Apply filters
-        if filters:
-            for field, value in filters.items():
-                if value is not None:
-                    query = query.where(filter=FieldFilter(field, "==", value))
+        for field, values in (array_contains_any or {}).items():
+            if values:
+                query = query.where(filter=FieldFilter(field, "array_contains_any", values))
 
-        # Apply ordering
+        # Apply ordering; the document ID breaks ties (insert_many stamps
+        # one created_at on a whole batch) so a cursor never skips entries
         direction = firestore.Query.DESCENDING if order_desc else firestore.Query.ASCENDING
         query = query.order_by(order_by, direction=direction)
+        query = query.order_by("__name__", direction=direction)
 
         # Apply pagination
-        if offset > 0:
-            # Firestore doesn't have native offset, so we need to fetch and skip
-            # For production, use cursor-based pagination instead
-            query = query.limit(limit + offset)
-            docs = list(query.stream())
-            docs = docs[offset:offset + limit]
-        else:
-            query = query.limit(limit)
-            docs = list(query.stream())
-
-        return [doc.to_dict() for doc in docs]
+        if start_after is not None:
+            query = query.start_after({
+                order_by: start_after[order_by],
+                "__name__": start_after["id"],
+            })
+        elif offset > 0:
+            # Skipped server-side, so skipped docs aren't transferred
+            query = query.offset(offset)
+
+        query = query.limit(limit)
+        return [doc.to_dict() async for doc in query.stream()]
+
+    def _filtered(self, filters: Optional[Dict[str, Any]]):
+        """Collection query with {field: value} equality filters applied."""
+        query = self.collection
+        for field, value in (filters or {}).items():
+            if value is not None:
+                query = query.where(filter=FieldFilter(field, "==", value))
+        return query
+
+    async def count(self, filters: Optional[Dict[str, Any]] = None) -> int:
+        """
+        Count matching documents with a server-side aggregation.
+
+        Args:
+            filters: Field filters as {field: value}
+
+        Returns:
+            Number of matching documents
+        """
+        if not self.is_configured:
+            raise Exception("Firestore not configured")
+
+        results = await self._filtered(filters).count(alias="total").get()
+        return int(results[0][0].value)
 
     async def select_one(self, doc_id: str) -> Optional[Dict[str, Any]]:
         """
@@ -132,7 +230,7 @@ class FirestoreClient:
             raise Exception("Firestore not configured")
 
         doc_ref = self.collection.document(doc_id)
-        doc = doc_ref.get()
+        doc = await doc_ref.get()
 
         if doc.exists:
             return doc.to_dict()
@@ -159,26 +257,72 @@ class FirestoreClient:
             raise Exception("Firestore not configured")
 
         doc_ref = self.collection.document(doc_id)
-        doc = doc_ref.get()
+        doc = await doc_ref.get()
 
         if not doc.exists:
             return None
 
+        doc_data = doc.to_dict()
+
         # Check ownership if user_id provided
-        if user_id:
-            doc_data = doc.to_dict()
-            if doc_data.get("user_id") != user_id:
-                return None
+        if user_id and doc_data.get("user_id") != user_id:
+            return None
 
         # Add updated timestamp
-        data["updated_at"] = datetime.utcnow().isoformat()
+        data["updated_at"] = _now_iso()
+
+        # Re-index when a searchable field changes
+        if any(f in data for f in _SEARCH_FIELDS):
+            data["_tokens"] = _search_tokens({**doc_data, **data})
 
         # Update document
-        doc_ref.update(data)
+        await doc_ref.update(data)
 
         # Return updated document
         return (await self.select_one(doc_id))
 
+    async def update_array(
+        self,
+        doc_id: str,
+        field: str,
+        values: List[Any],
+        user_id: Optional[str] = None,
+        remove: bool = False,
+    ) -> Optional[Dict[str, Any]]:
+        """
+        Add or remove array values server-side (ArrayUnion / ArrayRemove).
+
+        The array isn't read first, so concurrent calls can't drop each
+        other's values.
+
+        Args:
+            doc_id: Document ID
+            field: Array field name
+            values: Values to add (or remove)
+            user_id: Optional user ID for ownership check
+            remove: Remove the values instead of adding them
+
+        Returns:
+            Updated document or None
+        """
+        if not self.is_configured:
+            raise Exception("Firestore not configured")
+
+        doc_ref = self.collection.document(doc_id)
+        # Only the owner is needed for the existence/ownership check
+        doc = await doc_ref.get(field_paths=["user_id"])
+
+        if not doc.exists:
+            return None
+
+        if user_id and (doc.to_dict() or {}).get("user_id") != user_id:
+            return None
+
+        transform = firestore.ArrayRemove(values) if remove else firestore.ArrayUnion(values)
+        await doc_ref.update({field: transform, "updated_at": _now_iso()})
+
+        return (await self.select_one(doc_id))
+
     async def delete(
         self,
         doc_id: str,
@@ -198,7 +342,7 @@ class FirestoreClient:
             raise Exception("Firestore not configured")
 
         doc_ref = self.collection.document(doc_id)
-        doc = doc_ref.get()
+        doc = await doc_ref.get()
 
         if not doc.exists:
             return False
@@ -209,7 +353,7 @@ class FirestoreClient:
             if doc_data.get("user_id") != user_id:
                 return False
 
-        doc_ref.delete()
+        await doc_ref.delete()
         return True
 
     async def search(
@@ -218,24 +362,58 @@ class FirestoreClient:
         project_id: Optional[str] = None,
         research_types: Optional[List[str]] = None,
         limit: int = 20,
+        whole_words: bool = False,
     ) -> List[Dict[str, Any]]:
         """
         Search documents by text fields.
 
-        Note: Firestore doesn't support full-text search natively.
-        For production, consider using Firestore + Algolia or
-        Cloud Search integration.
+        Collects search_stream into a list; see it for matching rules.
 
-        This implementation does a basic filter and client-side search.
+        Returns:
+            Matching documents
+        """
+        return [
+            data async for data in self.search_stream(
+                query,
+                project_id=project_id,
+                research_types=research_types,
+                limit=limit,
+                whole_words=whole_words,
+            )
+        ]
+
+    async def search_stream(
+        self,
+        query: str,
+        project_id: Optional[str] = None,
+        research_types: Optional[List[str]] = None,
+        limit: int = 20,
+        whole_words: bool = False,
+    ) -> AsyncIterator[Dict[str, Any]]:
+        """
+        Search documents by text fields, yielding matches as they stream in.
+
+        By default the query is a substring of the title, input query or
+        summary, checked over the first 500 documents (of the project, if
+        given).
+
+        Firestore has no full-text search, so documents also carry a
+        `_tokens` array of the words in those fields. With
+        whole_words=True, a document matches when every word of the query
+        appears as a whole word, and the query's longest word narrows
+        candidates server-side with array_contains. Documents written
+        before `_tokens` existed are only found that way once
+        scripts/backfill_search_tokens.py --research has indexed them.
 
         Args:
             query: Search query
             project_id: Optional project filter
             research_types: Optional research type filter
             limit: Maximum results
+            whole_words: Match whole words via the `_tokens` index
 
-        Returns:
-            Matching documents
+        Yields:
+            Matching documents, up to `limit`
         """
         if not self.is_configured:
             raise Exception("Firestore not configured")
@@ -248,14 +426,19 @@ class FirestoreClient:
                 filter=FieldFilter("project_id", "==", project_id)
             )
 
-        # Fetch documents and filter client-side
-        # Note: For production, use a proper search service
-        docs = list(base_query.limit(500).stream())
-
         query_lower = query.lower()
-        results = []
+        tokens = set(_TOKEN_RE.findall(query_lower))
 
-        for doc in docs:
+        if whole_words:
+            if not tokens:
+                return
+            base_query = base_query.where(
+                filter=FieldFilter("_tokens", "array_contains", max(tokens, key=len))
+            )
+
+        found = 0
+
+        async for doc in base_query.limit(500).stream():
             data = doc.to_dict()
 
             # Filter by research_types if provided
@@ -270,27 +453,36 @@ class FirestoreClient:
                 str(data.get("input_query", "")),
             ]).lower()
 
-            if query_lower in searchable:
-                results.append(data)
+            if whole_words:
+                matched = tokens <= set(_TOKEN_RE.findall(searchable))
+            else:
+                matched = query_lower in searchable
 
-            if len(results) >= limit:
-                break
+            if matched:
+                yield data
+                found += 1
 
-        return results
+            if found >= limit:
+                break
 
     async def list_by_project(
         self,
         project_id: str,
         research_type: Optional[str] = None,
         limit: int = 50,
+        start_after: Optional[Dict[str, Any]] = None,
     ) -> List[Dict[str, Any]]:
         """
-        List all documents for a project.
+        List all documents for a project, newest first.
+
+        To page, pass the last document of the previous page as
+        `start_after` (replaces offset-based paging).
 
         Args:
             project_id: Project ID
             research_type: Optional filter by research type
             limit: Maximum documents
+            start_after: Last document of the previous page
 
         Returns:
             List of documents
@@ -304,6 +496,7 @@ class FirestoreClient:
             order_by="created_at",
             order_desc=True,
             limit=limit,
+            start_after=start_after,
         )
 
 
@@ -4,8 +4,8 @@ Research Repository - High-level data access layer.
 Provides domain-specific operations for research entries using Firestore.
 """
 
-from typing import Optional, List, Dict, Any
-from datetime import datetime
+import asyncio
+from typing import Optional, List, Dict, Any, Tuple, AsyncIterator
 
 from .firestore_client import get_firestore_client, FirestoreClient
 from ..models import (
@@ -18,6 +18,24 @@ from ..models import (
 )
 
 
+# Firestore allows 30 disjunctions per query; research_type `in` has at
+# most len(ResearchType) values, so tags are queried in groups of 5
+_MAX_TAGS_PER_QUERY = 5
+
+
+def _encode_cursor(entry: ResearchEntry) -> str:
+    """Opaque page cursor for the entry: its (created_at, id), '|'-joined."""
+    return f"{entry.created_at.isoformat()}|{entry.id}"
+
+
+def _decode_cursor(cursor: str) -> Dict[str, Any]:
+    """Turn a cursor from _encode_cursor back into a start_after document."""
+    created_at, sep, entry_id = cursor.rpartition("|")
+    if not (sep and created_at and entry_id):
+        raise ValueError(f"Invalid cursor: {cursor!r}")
+    return {"created_at": created_at, "id": entry_id}
+
+
 class ResearchRepository:
     """
     Repository for research entry CRUD operations.
@@ -73,6 +91,19 @@ class ResearchRepository:
 
         return entry
 
+    async def create_many(self, entries: List[ResearchEntry]) -> List[ResearchEntry]:
+        """
+        Persist several research entries in one batched write.
+
+        Args:
+            entries: Entries built with ResearchEntry.create
+
+        Returns:
+            The persisted entries
+        """
+        await self._client.insert_many([entry.to_dict() for entry in entries])
+        return entries
+
     async def get_by_id(self, research_id: str) -> Optional[ResearchEntry]:
         """
         Get a research entry by ID.
@@ -96,9 +127,13 @@ class ResearchRepository:
         status: Optional[ResearchStatus] = None,
         limit: int = 50,
         offset: int = 0,
+        cursor: Optional[str] = None,
     ) -> List[ResearchEntry]:
         """
-        List research entries for a project.
+        List research entries for a project, newest first.
+
+        For deep paging prefer `cursor` (see list_page): Firestore bills
+        every document skipped by `offset`.
 
         Args:
             project_id: Project UUID
@@ -107,33 +142,93 @@ class ResearchRepository:
             status: Optional filter by status
             limit: Maximum entries to return
             offset: Number of entries to skip
+            cursor: next_cursor from list_page; resumes after that entry
+                (ignores offset)
 
         Returns:
             List of ResearchEntry objects
         """
         filters = {"project_id": project_id}
+        start_after = _decode_cursor(cursor) if cursor else None
+        if start_after:
+            offset = 0
 
         if status:
             filters["status"] = status.value
 
-        records = await self._client.select(
-            filters=filters,
-            limit=limit,
-            offset=offset,
-        )
+        # Type and tag filters run in Firestore so `limit` counts matches
+        in_filters = None
+        if research_types:
+            in_filters = {"research_type": [t.value for t in research_types]}
+
+        tag_groups = [
+            tags[i:i + _MAX_TAGS_PER_QUERY]
+            for i in range(0, len(tags), _MAX_TAGS_PER_QUERY)
+        ] if tags else [None]
+
+        if len(tag_groups) == 1:
+            records = await self._client.select(
+                filters=filters,
+                limit=limit,
+                offset=offset,
+                start_after=start_after,
+                in_filters=in_filters,
+                array_contains_any={"tags": tag_groups[0]} if tag_groups[0] else None,
+            )
+        else:
+            # Fan out one query per tag group, then merge newest-first
+            pages = await asyncio.gather(*(
+                self._client.select(
+                    filters=filters,
+                    limit=limit + offset,
+                    start_after=start_after,
+                    in_filters=in_filters,
+                    array_contains_any={"tags": group},
+                )
+                for group in tag_groups
+            ))
+            merged = {r["id"]: r for page in pages for r in page}
+            records = sorted(
+                merged.values(),
+                key=lambda r: (r.get("created_at") or "", r["id"]),
+                reverse=True,
+            )[offset:offset + limit]
 
-        entries = [ResearchEntry.from_dict(r) for r in records]
+        return [ResearchEntry.from_dict(r) for r in records]
 
-        # Filter by research_types in Python
-        if research_types:
-            type_values = [t.value for t in research_types]
-            entries = [e for e in entries if e.research_type.value in type_values]
+    async def list_page(
+        self,
+        project_id: str,
+        research_types: Optional[List[ResearchType]] = None,
+        tags: Optional[List[str]] = None,
+        status: Optional[ResearchStatus] = None,
+        limit: int = 50,
+        offset: int = 0,
+        cursor: Optional[str] = None,
+    ) -> Tuple[List[ResearchEntry], Optional[str]]:
+        """
+        Get one page of research entries using cursor pagination.
 
-        # Filter by tags in Python
-        if tags:
-            entries = [e for e in entries if any(t in e.tags for t in tags)]
+        Each page costs `limit` reads regardless of depth. Pass the
+        returned cursor back to get the next page.
 
-        return entries
+        Args:
+            Same as list_by_project; cursor is None for the first page
+
+        Returns:
+            (entries, next_cursor); next_cursor is None on the last page
+        """
+        entries = await self.list_by_project(
+            project_id,
+            research_types=research_types,
+            tags=tags,
+            status=status,
+            limit=limit,
+            offset=offset,
+            cursor=cursor,
+        )
+        next_cursor = _encode_cursor(entries[-1]) if len(entries) == limit else None
+        return entries, next_cursor
 
     async def update(
         self,
@@ -152,8 +247,7 @@ class ResearchRepository:
         Returns:
             Updated ResearchEntry or None
         """
-        updates["updated_at"] = datetime.utcnow().isoformat()
-
+        # FirestoreClient.update stamps updated_at
         data = await self._client.update(research_id, updates, user_id)
         if data:
             return ResearchEntry.from_dict(data)
@@ -182,6 +276,7 @@ class ResearchRepository:
         project_id: Optional[str] = None,
         research_types: Optional[List[ResearchType]] = None,
         limit: int = 20,
+        whole_words: bool = False,
     ) -> List[ResearchEntry]:
         """
         Search across research entries.
@@ -191,22 +286,54 @@ class ResearchRepository:
             project_id: Optional project filter
             research_types: Optional research type filter
             limit: Maximum results
+            whole_words: Match whole words instead of substrings (see
+                FirestoreClient.search_stream)
 
         Returns:
             List of matching ResearchEntry objects
         """
+        return [
+            entry async for entry in self.search_stream(
+                query,
+                project_id=project_id,
+                research_types=research_types,
+                limit=limit,
+                whole_words=whole_words,
+            )
+        ]
+
+    async def search_stream(
+        self,
+        query: str,
+        project_id: Optional[str] = None,
+        research_types: Optional[List[ResearchType]] = None,
+        limit: int = 20,
+        whole_words: bool = False,
+    ) -> AsyncIterator[ResearchEntry]:
+        """
+        Search across research entries, yielding each match as it arrives.
+
+        Callers that only need the first few hits can stop iterating early
+        and skip deserializing the rest.
+
+        Args:
+            Same as search
+
+        Yields:
+            Matching ResearchEntry objects
+        """
         type_values = None
         if research_types:
             type_values = [t.value for t in research_types]
 
-        records = await self._client.search(
+        async for record in self._client.search_stream(
             query=query,
             project_id=project_id,
             research_types=type_values,
             limit=limit,
-        )
-
-        return [ResearchEntry.from_dict(r) for r in records]
+            whole_words=whole_words,
+        ):
+            yield ResearchEntry.from_dict(record)
 
     async def get_project_summary(
         self,
@@ -221,24 +348,28 @@ class ResearchRepository:
         Returns:
             Summary with counts by type and status
         """
-        entries = await self.list_by_project(project_id, limit=1000)
-
-        by_type = {}
-        by_status = {}
-
-        for entry in entries:
-            type_key = entry.research_type.value
-            status_key = entry.status.value
+        # Server-side count aggregations: one per type and per status,
+        # instead of fetching every entry
+        types = [t.value for t in ResearchType]
+        statuses = [s.value for s in ResearchStatus]
+        count = self._client.count
+
+        total, latest, *counts = await asyncio.gather(
+            count({"project_id": project_id}),
+            self._client.select(filters={"project_id": project_id}, limit=1),
+            *(count({"project_id": project_id, "research_type": t}) for t in types),
+            *(count({"project_id": project_id, "status": s}) for s in statuses),
+        )
 
-            by_type[type_key] = by_type.get(type_key, 0) + 1
-            by_status[status_key] = by_status.get(status_key, 0) + 1
+        type_counts = counts[:len(types)]
+        status_counts = counts[len(types):]
 
         return {
             "project_id": project_id,
-            "total_entries": len(entries),
-            "by_type": by_type,
-            "by_status": by_status,
-            "latest_entry": entries[0].created_at.isoformat() if entries else None,
+            "total_entries": total,
+            "by_type": {t: n for t, n in zip(types, type_counts) if n},
+            "by_status": {s: n for s, n in zip(statuses, status_counts) if n},
+            "latest_entry": latest[0].get("created_at") if latest else None,
         }
 
     async def pin(self, research_id: str, user_id: str) -> Optional[ResearchEntry]:
@@ -256,12 +387,22 @@ class ResearchRepository:
         tags: List[str],
     ) -> Optional[ResearchEntry]:
         """Add tags to a research entry."""
-        entry = await self.get_by_id(research_id)
-        if not entry:
-            return None
+        data = await self._client.update_array(research_id, "tags", tags, user_id)
+        if data:
+            return ResearchEntry.from_dict(data)
+        return None
 
-        new_tags = list(set(entry.tags + tags))
-        return await self.update(research_id, user_id, {"tags": new_tags})
+    async def remove_tags(
+        self,
+        research_id: str,
+        user_id: str,
+        tags: List[str],
+    ) -> Optional[ResearchEntry]:
+        """Remove tags from a research entry."""
+        data = await self._client.update_array(research_id, "tags", tags, user_id, remove=True)
+        if data:
+            return ResearchEntry.from_dict(data)
+        return None
 
     async def get_recent(
         self,
@@ -283,3 +424,34 @@ class ResearchRepository:
             research_types=[research_type],
             limit=limit,
         )
+
+    async def get_dashboard(
+        self,
+        project_id: str,
+        recent_limit: int = 10,
+        per_type_limit: int = 50,
+    ) -> Dict[str, Any]:
+        """
+        Get recent entries plus entries grouped by type in one round trip.
+
+        The get_recent and per-type get_by_type queries run concurrently,
+        so wall time is one Firestore round trip, not one per query.
+
+        Args:
+            project_id: Project UUID
+            recent_limit: Maximum recent entries
+            per_type_limit: Maximum entries per research type
+
+        Returns:
+            {"recent": [...], "by_type": {type value: [...]}}
+        """
+        types = list(ResearchType)
+        recent, *by_type = await asyncio.gather(
+            self.get_recent(project_id, limit=recent_limit),
+            *(self.get_by_type(project_id, t, limit=per_type_limit) for t in types),
+        )
+
+        return {
+            "recent": recent,
+            "by_type": {t.value: entries for t, entries in zip(types, by_type)},
+        }
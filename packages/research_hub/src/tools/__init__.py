@@ -3,7 +3,14 @@
 from .google_search import GoogleSearchTool, create_google_search_tool
 from .youtube_tool import YouTubeTool, create_youtube_tool
 from .rag_tool import RAGTool, create_rag_tool
-from .meta_ads_tool import MetaAdsLibraryTool, create_meta_ads_tool
+from .meta_ads_tool import (
+    MetaAdsLibraryTool,
+    AsyncMetaAdsLibraryTool,
+    create_meta_ads_tool,
+    competitor_analysis,
+    creative_analysis,
+    spend_analysis,
+)
 
 __all__ = [
     "GoogleSearchTool",
@@ -13,5 +20,9 @@ __all__ = [
     "RAGTool",
     "create_rag_tool",
     "MetaAdsLibraryTool",
+    "AsyncMetaAdsLibraryTool",
     "create_meta_ads_tool",
+    "competitor_analysis",
+    "creative_analysis",
+    "spend_analysis",
 ]
@@ -6,16 +6,100 @@ Provides Google Search grounding capability using Vertex AI.
 
 import os
 import json
+import asyncio
+import hashlib
+import threading
+from functools import lru_cache
 from typing import Dict, Any, Optional, List
 from datetime import datetime
 
-import vertexai
-from vertexai.generative_models import GenerativeModel, Tool
-from vertexai.preview.generative_models import grounding
+import orjson
 
 from ..config import GOOGLE_CLOUD_PROJECT, VERTEX_AI_LOCATION, DEFAULT_MODEL
 
 
+# Bound once for the result timestamps on every search return path
+_utcnow = datetime.utcnow
+
+
+def _utcnow_iso() -> str:
+    """Current UTC time as a naive ISO string (the searched_at format)."""
+    return _utcnow().isoformat()
+
+
+# (project, location) pairs vertexai.init has already run for
+_initialized_locations: Dict[tuple, bool] = {}
+_init_lock = threading.Lock()
+
+
+def _init_vertex_ai(project_id: str, location: str) -> None:
+    """Run vertexai.init once per (project, location)."""
+    key = (project_id, location)
+    if key in _initialized_locations:
+        return
+    with _init_lock:
+        if key not in _initialized_locations:
+            import vertexai
+
+            vertexai.init(project=project_id, location=location)
+            _initialized_locations[key] = True
+
+
+@lru_cache(maxsize=8)
+def _get_cached_model(model_name: str, project_id: str, location: str) -> "GenerativeModel":
+    """
+    Get a search-grounded GenerativeModel shared by every tool instance
+    with the same configuration, so they reuse one Tool and one channel.
+    """
+    # Imported here: the Vertex SDK is slow to load and many importers
+    # of this package never search
+    from vertexai.generative_models import GenerativeModel, Tool
+    from vertexai.preview.generative_models import grounding
+
+    _init_vertex_ai(project_id, location)
+
+    google_search_tool = Tool.from_google_search_retrieval(
+        grounding.GoogleSearchRetrieval()
+    )
+
+    return GenerativeModel(
+        model_name,
+        tools=[google_search_tool],
+    )
+
+
+def _schema_key(schema: Dict[str, Any]) -> bytes:
+    """Compact JSON form of a schema, used as the prompt cache key."""
+    try:
+        return orjson.dumps(schema)
+    except TypeError:
+        # orjson rejects non-str keys and some exotic types
+        return json.dumps(schema, default=str).encode()
+
+
+@lru_cache(maxsize=64)
+def _schema_block(schema_json: bytes) -> str:
+    """Pretty-print a schema for prompts, keyed by its compact JSON form."""
+    return orjson.dumps(orjson.loads(schema_json), option=orjson.OPT_INDENT_2).decode()
+
+
+@lru_cache(maxsize=64)
+def _research_prompt_tail(schema_json: bytes) -> str:
+    """Build the schema instructions that close every `research` prompt."""
+    return f"""
+Return your findings as a JSON object with this exact structure:
+{_schema_block(schema_json)}
+
+Only return the JSON object, no additional text or markdown code blocks.
+Be thorough, accurate, and include real, verifiable information.
+"""
+
+
+def _strip_code_fence(text: str) -> str:
+    """Remove a markdown code fence wrapped around stripped model output."""
+    return text.removeprefix("```json").removeprefix("```").removesuffix("```").strip()
+
+
 class GoogleSearchTool:
     """
     Google Search grounding tool using Vertex AI.
@@ -32,37 +116,43 @@ class GoogleSearchTool:
         self.model_name = model_name or DEFAULT_MODEL
         self.project_id = project_id or GOOGLE_CLOUD_PROJECT
         self.location = location or VERTEX_AI_LOCATION
-        self._model: Optional[GenerativeModel] = None
-        self._initialized = False
+        self._model: Optional["GenerativeModel"] = None
+        # prompt digest -> in-flight generate task, shared by identical calls
+        self._inflight: Dict[str, asyncio.Task] = {}
 
     @property
     def is_configured(self) -> bool:
         """Check if the tool is properly configured."""
         return bool(self.project_id)
 
-    def _init_vertex_ai(self):
-        """Initialize Vertex AI SDK."""
-        if not self._initialized and self.project_id:
-            vertexai.init(project=self.project_id, location=self.location)
-            self._initialized = True
-
-    def _get_model(self) -> GenerativeModel:
-        """Get or create the GenerativeModel with Google Search tool."""
+    def _get_model(self) -> "GenerativeModel":
+        """Get the shared GenerativeModel with Google Search tool."""
         if self._model is None:
-            self._init_vertex_ai()
-
-            google_search_tool = Tool.from_google_search_retrieval(
-                grounding.GoogleSearchRetrieval()
-            )
-
-            self._model = GenerativeModel(
-                self.model_name,
-                tools=[google_search_tool],
+            self._model = _get_cached_model(
+                self.model_name, self.project_id, self.location
             )
 
         return self._model
 
-    def search(
+    async def _generate(self, prompt: str):
+        """
+        Generate a response, coalescing concurrent calls with the same prompt.
+
+        Callers that arrive while an identical prompt is in flight await
+        the same task, so the model is called once. The entry is dropped
+        when the task finishes; nothing is cached afterwards.
+        """
+        key = hashlib.blake2b(prompt.encode(), digest_size=16).hexdigest()
+        task = self._inflight.get(key)
+        if task is None:
+            task = asyncio.ensure_future(self._get_model().generate_content_async(prompt))
+            self._inflight[key] = task
+            task.add_done_callback(lambda _: self._inflight.pop(key, None))
+
+        # Shielded so one cancelled caller does not cancel the others
+        return await asyncio.shield(task)
+
+    async def search(
         self,
         query: str,
         context: Optional[str] = None,
@@ -82,13 +172,11 @@ class GoogleSearchTool:
         if not self.is_configured:
             return {"error": "Google Search tool not configured", "results": []}
 
-        model = self._get_model()
-
         # Build prompt
         prompt = self._build_search_prompt(query, context, output_schema)
 
         try:
-            response = model.generate_content(prompt)
+            response = await self._generate(prompt)
             result = self._parse_response(response)
 
             # Extract grounding metadata for sources
@@ -98,7 +186,7 @@ class GoogleSearchTool:
                 "query": query,
                 "results": result,
                 "sources": sources,
-                "searched_at": datetime.utcnow().isoformat(),
+                "searched_at": _utcnow_iso(),
             }
 
         except Exception as e:
@@ -109,7 +197,7 @@ class GoogleSearchTool:
                 "sources": [],
             }
 
-    def research(
+    async def research(
         self,
         query: str,
         research_prompt: str,
@@ -129,24 +217,16 @@ class GoogleSearchTool:
         if not self.is_configured:
             return {"error": "Google Search tool not configured"}
 
-        model = self._get_model()
-
-        # Build the full prompt with schema
-        schema_str = json.dumps(output_schema, indent=2)
+        # Build the full prompt; the schema part is cached per schema
+        tail = _research_prompt_tail(_schema_key(output_schema))
         full_prompt = f"""
 {research_prompt}
 
 Subject: {query}
-
-Return your findings as a JSON object with this exact structure:
-{schema_str}
-
-Only return the JSON object, no additional text or markdown code blocks.
-Be thorough, accurate, and include real, verifiable information.
-"""
+{tail}"""
 
         try:
-            response = model.generate_content(full_prompt)
+            response = await self._generate(full_prompt)
             result = self._parse_json_response(response.text)
             sources = self._extract_sources(response)
 
@@ -154,7 +234,7 @@ Be thorough, accurate, and include real, verifiable information.
                 "query": query,
                 "analysis": result,
                 "sources": sources,
-                "searched_at": datetime.utcnow().isoformat(),
+                "searched_at": _utcnow_iso(),
             }
 
         except Exception as e:
@@ -178,7 +258,7 @@ Be thorough, accurate, and include real, verifiable information.
             prompt_parts.append(f"\nAdditional context: {context}")
 
         if output_schema:
-            schema_str = json.dumps(output_schema, indent=2)
+            schema_str = _schema_block(_schema_key(output_schema))
             prompt_parts.append(f"\nReturn results as JSON with this structure:\n{schema_str}")
         else:
             prompt_parts.append("\nProvide a comprehensive summary of the findings.")
@@ -195,43 +275,40 @@ Be thorough, accurate, and include real, verifiable information.
 
     def _parse_json_response(self, response_text: str) -> Dict[str, Any]:
         """Parse JSON from model response, handling markdown code blocks."""
-        try:
-            return json.loads(response_text)
-        except json.JSONDecodeError:
-            text = response_text.strip()
-
-            # Remove markdown code blocks
-            if text.startswith("```json"):
-                text = text[7:]
-            elif text.startswith("```"):
-                text = text[3:]
-            if text.endswith("```"):
-                text = text[:-3]
-
+        text = response_text.strip()
+        if text[:1] == "{":
+            # Common case: bare JSON, nothing to strip
             try:
-                return json.loads(text.strip())
+                return orjson.loads(text)
             except json.JSONDecodeError:
-                # Return as raw text if not JSON
-                return {"raw_response": response_text}
+                pass
+
+        # Also drops a stray closing fence after {...}
+        text = _strip_code_fence(text)
+
+        try:
+            return orjson.loads(text)
+        except json.JSONDecodeError:
+            # Return as raw text if not JSON
+            return {"raw_response": response_text}
 
     def _extract_sources(self, response) -> List[Dict[str, str]]:
         """Extract sources from grounding metadata."""
         sources = []
 
         try:
-            # Access grounding metadata from the response
-            if hasattr(response, 'candidates') and response.candidates:
-                candidate = response.candidates[0]
-                if hasattr(candidate, 'grounding_metadata'):
-                    metadata = candidate.grounding_metadata
-                    if hasattr(metadata, 'grounding_chunks'):
-                        for chunk in metadata.grounding_chunks:
-                            if hasattr(chunk, 'web'):
-                                sources.append({
-                                    "url": chunk.web.uri if hasattr(chunk.web, 'uri') else "",
-                                    "title": chunk.web.title if hasattr(chunk.web, 'title') else "",
-                                    "source_type": "web",
-                                })
+            # Direct access; a response without grounding metadata lands
+            # in the except once instead of paying a hasattr per level
+            chunks = response.candidates[0].grounding_metadata.grounding_chunks
+            append = sources.append
+            for chunk in chunks:
+                web = getattr(chunk, "web", None)
+                if web is not None:
+                    append({
+                        "url": web.uri or "",
+                        "title": web.title or "",
+                        "source_type": "web",
+                    })
         except Exception:
             # Grounding metadata extraction is best-effort
             pass
@@ -5,15 +5,381 @@ Provides access to Facebook/Instagram ad data via Meta's Ad Library API.
 """
 
 import os
+import asyncio
 import requests
+import threading
 import time
-from typing import Dict, Any, Optional, List, Iterator
+from collections import Counter
+from concurrent.futures import ThreadPoolExecutor
+from functools import partial
+from requests.adapters import HTTPAdapter
+from cachetools import TTLCache
+from typing import Dict, Any, Optional, List, Iterable, Iterator, AsyncIterator, Tuple
 from datetime import datetime, timedelta
 from urllib.parse import urlencode
 
 from ..config import META_ACCESS_TOKEN, META_APP_ID, META_APP_SECRET
 
 
+# Bound once for the result timestamps on every search return path
+_utcnow = datetime.utcnow
+
+
+def _utcnow_iso() -> str:
+    """Current UTC time as a naive ISO string (the searched_at format)."""
+    return _utcnow().isoformat()
+
+
+DEFAULT_AD_FIELDS = [
+    "id",
+    "page_id",
+    "page_name",
+    "ad_snapshot_url",
+    "ad_creative_bodies",
+    "ad_creative_link_captions",
+    "ad_creative_link_titles",
+    "ad_delivery_start_time",
+    "ad_delivery_stop_time",
+    "currency",
+    "spend",
+    "impressions",
+    "publisher_platforms",
+    "languages",
+    "target_locations",
+    "target_ages",
+    "target_gender",
+    "bylines",
+]
+
+SPEND_FIELDS = [
+    "page_name",
+    "spend",
+    "impressions",
+    "currency",
+    "ad_delivery_start_time",
+    "ad_delivery_stop_time",
+]
+
+
+def _ads_params(
+    search_terms: str = None,
+    page_ids: List[str] = None,
+    countries: List[str] = None,
+    ad_active_status: str = "ALL",
+    ad_type: str = "ALL",
+    publisher_platforms: List[str] = None,
+    fields: List[str] = None,
+    limit: int = 25,
+    after_cursor: str = None,
+) -> Dict[str, Any]:
+    """Build ads_archive query params (shared by the sync and async tools)."""
+    params = {
+        "ad_reached_countries": countries or ["US"],
+        "ad_active_status": ad_active_status,
+        "ad_type": ad_type,
+        "fields": ",".join(fields or DEFAULT_AD_FIELDS),
+        "limit": min(limit, 25),  # API max is 25
+    }
+
+    if search_terms:
+        params["search_terms"] = search_terms
+    if page_ids:
+        params["search_page_ids"] = ",".join(page_ids)
+    if publisher_platforms:
+        params["publisher_platforms"] = publisher_platforms
+    if after_cursor:
+        params["after"] = after_cursor
+
+    return params
+
+
+def _format_page(result: Dict[str, Any]) -> Dict[str, Any]:
+    """Reshape an ads_archive response into ads plus paging info."""
+    ads = result.get("data", [])
+    paging = result.get("paging", {})
+
+    return {
+        "ads": ads,
+        "count": len(ads),
+        "has_more": "next" in paging,
+        "next_cursor": paging.get("cursors", {}).get("after"),
+    }
+
+
+def _query_pairs(params: Dict[str, Any]) -> List[Tuple[str, str]]:
+    """Expand list values into repeated keys, as requests encodes them."""
+    pairs = []
+    for key, value in params.items():
+        if isinstance(value, (list, tuple)):
+            pairs.extend((key, str(v)) for v in value)
+        else:
+            pairs.append((key, str(value)))
+    return pairs
+
+
+# Successful Graph API responses, shared by every tool instance (sync and
+# async) so re-running the same research does not refetch; 15 minutes
+_response_cache: TTLCache = TTLCache(maxsize=512, ttl=900)
+_response_cache_lock = threading.Lock()
+
+
+def _cache_key(url: str, params: Dict[str, Any]) -> Tuple:
+    """Hashable key for a request; the access token is left out."""
+    return (url, tuple(sorted(
+        (k, tuple(v) if isinstance(v, list) else v)
+        for k, v in params.items()
+        if k != "access_token"
+    )))
+
+
+def _cache_get(key: Tuple) -> Optional[Dict[str, Any]]:
+    with _response_cache_lock:
+        return _response_cache.get(key)
+
+
+def _cache_put(key: Tuple, result: Dict[str, Any]):
+    with _response_cache_lock:
+        _response_cache[key] = result
+
+
+class _RateLimiter:
+    """
+    Adaptive token bucket for Graph API calls.
+
+    Each successful call raises the rate by 5% up to max_rate; a 429
+    halves it. Waits are reserved under a lock, so concurrent callers
+    (threads or coroutines) queue instead of bursting.
+    """
+
+    def __init__(self, rate: float, max_rate: float, min_rate: float = 0.2, capacity: float = 5):
+        self.rate = rate
+        self.max_rate = max_rate
+        self.min_rate = min_rate
+        self.capacity = capacity
+        self._tokens = capacity
+        self._last = time.monotonic()
+        self._lock = threading.Lock()
+
+    def _reserve(self) -> float:
+        """Take a token; return how long to wait before using it."""
+        with self._lock:
+            now = time.monotonic()
+            self._tokens = min(self.capacity, self._tokens + (now - self._last) * self.rate)
+            self._last = now
+            self._tokens -= 1
+            return -self._tokens / self.rate if self._tokens < 0 else 0.0
+
+    def acquire(self):
+        """Block until a request may be sent."""
+        wait = self._reserve()
+        if wait:
+            time.sleep(wait)
+
+    async def acquire_async(self):
+        """Wait, without blocking the event loop, until a request may be sent."""
+        wait = self._reserve()
+        if wait:
+            await asyncio.sleep(wait)
+
+    def succeeded(self):
+        """Open up after a successful call."""
+        with self._lock:
+            self.rate = min(self.max_rate, self.rate * 1.05)
+
+    def throttled(self, retry_after: Optional[str]) -> float:
+        """Back off after a 429; return the seconds to wait before retrying."""
+        with self._lock:
+            self.rate = max(self.min_rate, self.rate * 0.5)
+            self._tokens = min(self._tokens, 0)
+        try:
+            return max(0.0, float(retry_after))
+        except (TypeError, ValueError):
+            # Missing or HTTP-date Retry-After: wait one slot at the new rate
+            return 1 / self.rate
+
+
+# Graph API limits are per token, so every tool instance (sync and async)
+# using the same token shares one limiter, like the response cache
+_rate_limiters: Dict[Optional[str], _RateLimiter] = {}
+_rate_limiters_lock = threading.Lock()
+
+
+def _shared_limiter(key: Optional[str], rate: float, max_rate: float) -> _RateLimiter:
+    """Get or create the rate limiter for an access token (or app id)."""
+    with _rate_limiters_lock:
+        limiter = _rate_limiters.get(key)
+        if limiter is None:
+            limiter = _rate_limiters[key] = _RateLimiter(rate, max_rate)
+        return limiter
+
+
+def competitor_analysis(competitor_name: str, ads: Iterable[Dict[str, Any]]) -> Dict[str, Any]:
+    """Summarize a competitor's ads in one pass: platforms, samples, messaging."""
+    analysis = {
+        "competitor": competitor_name,
+        "total_ads_found": 0,
+        "active_ads": 0,
+        "platforms": {},
+        "ad_samples": [],
+        "messaging_themes": [],
+        "searched_at": _utcnow_iso(),
+    }
+
+    platforms = Counter()
+
+    for ad in ads:
+        analysis["total_ads_found"] += 1
+        if not ad.get("ad_delivery_stop_time"):
+            analysis["active_ads"] += 1
+
+        # Analyze platforms
+        platforms.update(ad.get("publisher_platforms", []))
+
+        # Get sample ads with creatives (first 10)
+        if analysis["total_ads_found"] > 10:
+            continue
+
+        sample = {
+            "page_name": ad.get("page_name"),
+            "snapshot_url": ad.get("ad_snapshot_url"),
+            "bodies": ad.get("ad_creative_bodies", []),
+            "titles": ad.get("ad_creative_link_titles", []),
+            "start_date": ad.get("ad_delivery_start_time"),
+            "spend": ad.get("spend"),
+            "impressions": ad.get("impressions"),
+        }
+        analysis["ad_samples"].append(sample)
+
+        # Extract messaging themes from bodies
+        for body in ad.get("ad_creative_bodies", []):
+            if body and len(body) > 20:
+                analysis["messaging_themes"].append(body[:200])
+
+    analysis["platforms"] = dict(platforms)
+    return analysis
+
+
+def creative_analysis(search_terms: str, ads: Iterable[Dict[str, Any]]) -> Dict[str, Any]:
+    """Aggregate creative, targeting and platform patterns in one pass over ads."""
+    analysis = {
+        "query": search_terms,
+        "ads_analyzed": 0,
+        "creative_patterns": {
+            "headline_styles": [],
+            "body_copy_themes": [],
+            "cta_patterns": [],
+            "link_captions": [],
+        },
+        "targeting_insights": {
+            "age_ranges": {},
+            "genders": {},
+            "locations": [],
+        },
+        "platform_distribution": {},
+        "ad_examples": [],
+    }
+
+    # Insertion-ordered dicts as sets: dedup while collecting, first seen
+    # first, and stop once a list has as many entries as are returned
+    headlines: Dict[str, None] = {}
+    bodies: Dict[str, None] = {}
+    ctas: Dict[str, None] = {}
+    platforms = Counter()
+    age_ranges = Counter()
+    genders = Counter()
+
+    for ad in ads:
+        analysis["ads_analyzed"] += 1
+
+        # Analyze headlines
+        if len(headlines) < 20:
+            for title in ad.get("ad_creative_link_titles", []):
+                if title:
+                    headlines[title] = None
+
+        # Analyze body copy
+        if len(bodies) < 10:
+            for body in ad.get("ad_creative_bodies", []):
+                if body:
+                    bodies[body[:300]] = None
+
+        # Analyze link captions (often contain CTAs)
+        if len(ctas) < 10:
+            for caption in ad.get("ad_creative_link_captions", []):
+                if caption:
+                    ctas[caption] = None
+
+        # Platform distribution
+        platforms.update(ad.get("publisher_platforms", []))
+
+        # Targeting insights
+        if ad.get("target_ages"):
+            age_range = ad["target_ages"]
+            age_ranges[f"{age_range.get('min', '?')}-{age_range.get('max', '?')}"] += 1
+
+        if ad.get("target_gender"):
+            genders[ad["target_gender"]] += 1
+
+        # Add example
+        if len(analysis["ad_examples"]) < 5:
+            analysis["ad_examples"].append({
+                "page_name": ad.get("page_name"),
+                "snapshot_url": ad.get("ad_snapshot_url"),
+                "headline": (ad.get("ad_creative_link_titles") or [None])[0],
+                "body": (ad.get("ad_creative_bodies") or [None])[0],
+            })
+
+    patterns = analysis["creative_patterns"]
+    patterns["headline_styles"] = list(headlines)[:20]
+    patterns["body_copy_themes"] = list(bodies)[:10]
+    patterns["cta_patterns"] = list(ctas)[:10]
+
+    # Plain dicts: these are rendered into prompts and JSON responses
+    analysis["platform_distribution"] = dict(platforms)
+    analysis["targeting_insights"]["age_ranges"] = dict(age_ranges)
+    analysis["targeting_insights"]["genders"] = dict(genders)
+
+    return analysis
+
+
+def spend_analysis(ads: Iterable[Dict[str, Any]]) -> Dict[str, Any]:
+    """Total spend bounds overall and per page in one pass over ads."""
+    # Analyze spend
+    spend_data = {
+        "ads_with_spend_data": 0,
+        "total_min_spend": 0,
+        "total_max_spend": 0,
+        "currency": None,
+        "by_page": {},
+        "active_campaigns": 0,
+    }
+
+    for ad in ads:
+        spend = ad.get("spend")
+        if spend:
+            spend_data["ads_with_spend_data"] += 1
+            spend_data["currency"] = spend.get("currency")
+
+            lower = spend.get("lower_bound", 0)
+            upper = spend.get("upper_bound", 0)
+
+            spend_data["total_min_spend"] += int(lower) if lower else 0
+            spend_data["total_max_spend"] += int(upper) if upper else 0
+
+            page = ad.get("page_name", "Unknown")
+            if page not in spend_data["by_page"]:
+                spend_data["by_page"][page] = {"min": 0, "max": 0, "ad_count": 0}
+
+            spend_data["by_page"][page]["min"] += int(lower) if lower else 0
+            spend_data["by_page"][page]["max"] += int(upper) if upper else 0
+            spend_data["by_page"][page]["ad_count"] += 1
+
+        if not ad.get("ad_delivery_stop_time"):
+            spend_data["active_campaigns"] += 1
+
+    return spend_data
+
+
 class MetaAdsLibraryTool:
     """
     Meta Ad Library API tool for researching competitor ads.
@@ -30,17 +396,54 @@ class MetaAdsLibraryTool:
 
     BASE_URL = "https://graph.facebook.com"
     API_VERSION = "v21.0"
+    # Adaptive pacing: start at the old fixed 0.5s spacing, open up to 10/s
+    RATE_LIMIT_START = 2.0
+    RATE_LIMIT_MAX = 10.0
+    MAX_THROTTLE_RETRIES = 3
 
     def __init__(
         self,
         access_token: str = None,
         app_id: str = None,
         app_secret: str = None,
+        use_cache: bool = True,
     ):
         self.access_token = access_token or META_ACCESS_TOKEN
         self.app_id = app_id or META_APP_ID
         self.app_secret = app_secret or META_APP_SECRET
+        self.use_cache = use_cache
         self._token_expiry: Optional[datetime] = None
+        self.session = self._build_session()
+        self._limiter = _shared_limiter(
+            self.access_token or self.app_id,
+            self.RATE_LIMIT_START,
+            self.RATE_LIMIT_MAX,
+        )
+
+    def _build_session(self) -> requests.Session:
+        """Keep-alive session so paginated calls reuse one TLS connection."""
+        session = requests.Session()
+        adapter = HTTPAdapter(pool_connections=4, pool_maxsize=16, max_retries=0)
+        session.mount("https://", adapter)
+        # requests already sends Accept-Encoding: gzip, deflate
+        session.headers.update({"User-Agent": "research-hub-meta-ads/1.0"})
+        return session
+
+    def close(self):
+        """Close pooled HTTP connections."""
+        self.session.close()
+
+    @staticmethod
+    def cache_clear():
+        """Drop all cached Graph API responses."""
+        with _response_cache_lock:
+            _response_cache.clear()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
 
     @property
     def is_configured(self) -> bool:
@@ -65,7 +468,7 @@ class MetaAdsLibraryTool:
                 "client_secret": self.app_secret,
                 "grant_type": "client_credentials",
             }
-            response = requests.get(url, params=params)
+            response = self.session.get(url, params=params, timeout=30)
             if response.status_code == 200:
                 data = response.json()
                 self.access_token = data.get("access_token")
@@ -78,16 +481,31 @@ class MetaAdsLibraryTool:
         endpoint: str,
         params: Dict[str, Any],
     ) -> Dict[str, Any]:
-        """Make a request to the Meta Graph API."""
+        """Make a request to the Meta Graph API (cached when use_cache)."""
+        url = f"{self.api_url}/{endpoint}"
+        key = _cache_key(url, params) if self.use_cache else None
+        if key is not None:
+            cached = _cache_get(key)
+            if cached is not None:
+                return cached
+
         token = self._get_access_token()
         params["access_token"] = token
 
-        url = f"{self.api_url}/{endpoint}"
-
         try:
-            response = requests.get(url, params=params, timeout=30)
+            for attempt in range(self.MAX_THROTTLE_RETRIES + 1):
+                self._limiter.acquire()
+                response = self.session.get(url, params=params, timeout=30)
+                if response.status_code != 429 or attempt == self.MAX_THROTTLE_RETRIES:
+                    break
+                time.sleep(self._limiter.throttled(response.headers.get("Retry-After")))
+
             response.raise_for_status()
-            return response.json()
+            self._limiter.succeeded()
+            result = response.json()
+            if key is not None:
+                _cache_put(key, result)
+            return result
         except requests.exceptions.HTTPError as e:
             error_data = {}
             try:
@@ -128,45 +546,16 @@ class MetaAdsLibraryTool:
         if not self.is_configured:
             return {"error": "Meta API not configured", "data": []}
 
-        # Default fields
-        if fields is None:
-            fields = [
-                "id",
-                "page_id",
-                "page_name",
-                "ad_snapshot_url",
-                "ad_creative_bodies",
-                "ad_creative_link_captions",
-                "ad_creative_link_titles",
-                "ad_delivery_start_time",
-                "ad_delivery_stop_time",
-                "currency",
-                "spend",
-                "impressions",
-                "publisher_platforms",
-                "languages",
-                "target_locations",
-                "target_ages",
-                "target_gender",
-                "bylines",
-            ]
-
-        params = {
-            "ad_reached_countries": countries or ["US"],
-            "ad_active_status": ad_active_status,
-            "ad_type": ad_type,
-            "fields": ",".join(fields),
-            "limit": min(limit, 25),  # API max is 25
-        }
-
-        if search_terms:
-            params["search_terms"] = search_terms
-
-        if page_ids:
-            params["search_page_ids"] = ",".join(page_ids)
-
-        if publisher_platforms:
-            params["publisher_platforms"] = publisher_platforms
+        params = _ads_params(
+            search_terms=search_terms,
+            page_ids=page_ids,
+            countries=countries,
+            ad_active_status=ad_active_status,
+            ad_type=ad_type,
+            publisher_platforms=publisher_platforms,
+            fields=fields,
+            limit=limit,
+        )
 
         result = self._make_request("ads_archive", params)
 
@@ -174,16 +563,9 @@ class MetaAdsLibraryTool:
         if "error" in result:
             return result
 
-        ads = result.get("data", [])
-        paging = result.get("paging", {})
-
-        return {
-            "ads": ads,
-            "count": len(ads),
-            "has_more": "next" in paging,
-            "next_cursor": paging.get("cursors", {}).get("after"),
-            "searched_at": datetime.utcnow().isoformat(),
-        }
+        page = _format_page(result)
+        page["searched_at"] = _utcnow_iso()
+        return page
 
     def search_ads_paginated(
         self,
@@ -209,7 +591,8 @@ class MetaAdsLibraryTool:
             publisher_platforms: ['facebook', 'instagram', 'messenger']
             fields: Specific fields to retrieve
             max_ads: Maximum total ads to fetch (default 100)
-            delay_between_requests: Seconds to wait between API calls (rate limiting)
+            delay_between_requests: Unused; kept for compatibility (calls are paced
+                by the tool's adaptive rate limiter)
 
         Yields:
             Individual ad dictionaries
@@ -217,50 +600,55 @@ class MetaAdsLibraryTool:
         if not self.is_configured:
             return
 
-        ads_fetched = 0
-        next_cursor = None
-
-        while ads_fetched < max_ads:
-            # Calculate how many to request (max 25 per API call)
-            remaining = max_ads - ads_fetched
-            limit = min(25, remaining)
+        if max_ads <= 0:
+            return
 
-            result = self._fetch_ads_page(
-                search_terms=search_terms,
-                page_ids=page_ids,
-                countries=countries,
-                ad_active_status=ad_active_status,
-                ad_type=ad_type,
-                publisher_platforms=publisher_platforms,
-                fields=fields,
-                limit=limit,
-                after_cursor=next_cursor,
-            )
+        fetch = partial(
+            self._fetch_ads_page,
+            search_terms=search_terms,
+            page_ids=page_ids,
+            countries=countries,
+            ad_active_status=ad_active_status,
+            ad_type=ad_type,
+            publisher_platforms=publisher_platforms,
+            fields=fields,
+        )
 
-            if "error" in result:
-                break
+        # One worker fetches page N+1 while the caller consumes page N
+        executor = ThreadPoolExecutor(max_workers=1)
+        future = executor.submit(fetch, limit=min(25, max_ads), after_cursor=None)
+        ads_fetched = 0
 
-            ads = result.get("ads", [])
-            if not ads:
-                break
+        try:
+            while future is not None:
+                result = future.result()
+                future = None
 
-            for ad in ads:
-                yield ad
-                ads_fetched += 1
-                if ads_fetched >= max_ads:
+                if "error" in result:
                     break
 
-            # Check for more pages
-            if not result.get("has_more"):
-                break
-
-            next_cursor = result.get("next_cursor")
-            if not next_cursor:
-                break
+                ads = result.get("ads", [])
+                if not ads:
+                    break
 
-            # Rate limiting delay
-            if delay_between_requests > 0:
-                time.sleep(delay_between_requests)
+                ads = ads[:max_ads - ads_fetched]
+                ads_fetched += len(ads)
+
+                # Check for more pages and request the next one before yielding
+                next_cursor = result.get("next_cursor")
+                if ads_fetched < max_ads and result.get("has_more") and next_cursor:
+                    future = executor.submit(
+                        fetch,
+                        limit=min(25, max_ads - ads_fetched),
+                        after_cursor=next_cursor,
+                    )
+
+                yield from ads
+        finally:
+            # Caller stopped early: drop the prefetch if it has not started
+            if future is not None:
+                future.cancel()
+            executor.shutdown(wait=False)
 
     def _fetch_ads_page(
         self,
@@ -275,47 +663,24 @@ class MetaAdsLibraryTool:
         after_cursor: str = None,
     ) -> Dict[str, Any]:
         """Fetch a single page of ads (internal helper)."""
-        if fields is None:
-            fields = [
-                "id", "page_id", "page_name", "ad_snapshot_url",
-                "ad_creative_bodies", "ad_creative_link_captions",
-                "ad_creative_link_titles", "ad_delivery_start_time",
-                "ad_delivery_stop_time", "currency", "spend", "impressions",
-                "publisher_platforms", "languages", "target_locations",
-                "target_ages", "target_gender", "bylines",
-            ]
-
-        params = {
-            "ad_reached_countries": countries or ["US"],
-            "ad_active_status": ad_active_status,
-            "ad_type": ad_type,
-            "fields": ",".join(fields),
-            "limit": min(limit, 25),
-        }
-
-        if search_terms:
-            params["search_terms"] = search_terms
-        if page_ids:
-            params["search_page_ids"] = ",".join(page_ids)
-        if publisher_platforms:
-            params["publisher_platforms"] = publisher_platforms
-        if after_cursor:
-            params["after"] = after_cursor
+        params = _ads_params(
+            search_terms=search_terms,
+            page_ids=page_ids,
+            countries=countries,
+            ad_active_status=ad_active_status,
+            ad_type=ad_type,
+            publisher_platforms=publisher_platforms,
+            fields=fields,
+            limit=limit,
+            after_cursor=after_cursor,
+        )
 
         result = self._make_request("ads_archive", params)
 
         if "error" in result:
             return result
 
-        ads = result.get("data", [])
-        paging = result.get("paging", {})
-
-        return {
-            "ads": ads,
-            "count": len(ads),
-            "has_more": "next" in paging,
-            "next_cursor": paging.get("cursors", {}).get("after"),
-        }
+        return _format_page(result)
 
     def search_ads_all(
         self,
@@ -344,7 +709,7 @@ class MetaAdsLibraryTool:
             publisher_platforms: ['facebook', 'instagram', 'messenger']
             fields: Specific fields to retrieve
             max_ads: Maximum total ads to fetch (default 100, max 500)
-            delay_between_requests: Seconds between API calls (default 0.5)
+            delay_between_requests: Unused; kept for compatibility
 
         Returns:
             Dict with all ads and metadata
@@ -371,7 +736,7 @@ class MetaAdsLibraryTool:
             "ads": all_ads,
             "count": len(all_ads),
             "max_requested": max_ads,
-            "searched_at": datetime.utcnow().isoformat(),
+            "searched_at": _utcnow_iso(),
         }
 
     def get_page_ads(
@@ -419,55 +784,18 @@ class MetaAdsLibraryTool:
         Returns:
             Competitor ad data
         """
-        result = self.search_ads_all(
+        if not self.is_configured:
+            return {"error": "Meta API not configured", "data": []}
+
+        # Analyze ads as pages arrive instead of collecting them first
+        ads = self.search_ads_paginated(
             search_terms=competitor_name,
             countries=countries or ["US"],
             publisher_platforms=platforms,
             ad_active_status="ALL",
-            max_ads=max_ads,
+            max_ads=min(max_ads, 500),
         )
-
-        if "error" in result:
-            return result
-
-        # Analyze the ads
-        ads = result.get("ads", [])
-
-        analysis = {
-            "competitor": competitor_name,
-            "total_ads_found": len(ads),
-            "active_ads": sum(1 for ad in ads if not ad.get("ad_delivery_stop_time")),
-            "platforms": {},
-            "ad_samples": [],
-            "messaging_themes": [],
-            "searched_at": datetime.utcnow().isoformat(),
-        }
-
-        # Analyze platforms
-        for ad in ads:
-            platforms = ad.get("publisher_platforms", [])
-            for platform in platforms:
-                analysis["platforms"][platform] = analysis["platforms"].get(platform, 0) + 1
-
-        # Get sample ads with creatives
-        for ad in ads[:10]:
-            sample = {
-                "page_name": ad.get("page_name"),
-                "snapshot_url": ad.get("ad_snapshot_url"),
-                "bodies": ad.get("ad_creative_bodies", []),
-                "titles": ad.get("ad_creative_link_titles", []),
-                "start_date": ad.get("ad_delivery_start_time"),
-                "spend": ad.get("spend"),
-                "impressions": ad.get("impressions"),
-            }
-            analysis["ad_samples"].append(sample)
-
-            # Extract messaging themes from bodies
-            for body in ad.get("ad_creative_bodies", []):
-                if body and len(body) > 20:
-                    analysis["messaging_themes"].append(body[:200])
-
-        return analysis
+        return competitor_analysis(competitor_name, ads)
 
     def analyze_ad_creative(
         self,
@@ -486,86 +814,15 @@ class MetaAdsLibraryTool:
         Returns:
             Creative analysis insights
         """
-        result = self.search_ads_all(
+        if not self.is_configured:
+            return {"error": "Meta API not configured", "data": []}
+
+        ads = self.search_ads_paginated(
             search_terms=search_terms,
             countries=countries or ["US"],
-            max_ads=max_ads,
+            max_ads=min(max_ads, 500),
         )
-
-        if "error" in result:
-            return result
-
-        ads = result.get("ads", [])
-
-        analysis = {
-            "query": search_terms,
-            "ads_analyzed": len(ads),
-            "creative_patterns": {
-                "headline_styles": [],
-                "body_copy_themes": [],
-                "cta_patterns": [],
-                "link_captions": [],
-            },
-            "targeting_insights": {
-                "age_ranges": {},
-                "genders": {},
-                "locations": [],
-            },
-            "platform_distribution": {},
-            "ad_examples": [],
-        }
-
-        for ad in ads:
-            # Analyze headlines
-            for title in ad.get("ad_creative_link_titles", []):
-                if title:
-                    analysis["creative_patterns"]["headline_styles"].append(title)
-
-            # Analyze body copy
-            for body in ad.get("ad_creative_bodies", []):
-                if body:
-                    analysis["creative_patterns"]["body_copy_themes"].append(body[:300])
-
-            # Analyze link captions (often contain CTAs)
-            for caption in ad.get("ad_creative_link_captions", []):
-                if caption:
-                    analysis["creative_patterns"]["cta_patterns"].append(caption)
-
-            # Platform distribution
-            for platform in ad.get("publisher_platforms", []):
-                analysis["platform_distribution"][platform] = \
-                    analysis["platform_distribution"].get(platform, 0) + 1
-
-            # Targeting insights
-            if ad.get("target_ages"):
-                age_range = ad["target_ages"]
-                key = f"{age_range.get('min', '?')}-{age_range.get('max', '?')}"
-                analysis["targeting_insights"]["age_ranges"][key] = \
-                    analysis["targeting_insights"]["age_ranges"].get(key, 0) + 1
-
-            if ad.get("target_gender"):
-                gender = ad["target_gender"]
-                analysis["targeting_insights"]["genders"][gender] = \
-                    analysis["targeting_insights"]["genders"].get(gender, 0) + 1
-
-            # Add example
-            if len(analysis["ad_examples"]) < 5:
-                analysis["ad_examples"].append({
-                    "page_name": ad.get("page_name"),
-                    "snapshot_url": ad.get("ad_snapshot_url"),
-                    "headline": (ad.get("ad_creative_link_titles") or [None])[0],
-                    "body": (ad.get("ad_creative_bodies") or [None])[0],
-                })
-
-        # Deduplicate themes
-        analysis["creative_patterns"]["headline_styles"] = \
-            list(set(analysis["creative_patterns"]["headline_styles"]))[:20]
-        analysis["creative_patterns"]["body_copy_themes"] = \
-            list(set(analysis["creative_patterns"]["body_copy_themes"]))[:10]
-        analysis["creative_patterns"]["cta_patterns"] = \
-            list(set(analysis["creative_patterns"]["cta_patterns"]))[:10]
-
-        return analysis
+        return creative_analysis(search_terms, ads)
 
     def get_ad_spend_insights(
         self,
@@ -589,60 +846,389 @@ class MetaAdsLibraryTool:
         Returns:
             Spend analysis
         """
-        result = self.search_ads_all(
+        if not self.is_configured:
+            return {"error": "Meta API not configured", "data": []}
+
+        ads = self.search_ads_paginated(
             page_ids=page_ids,
             search_terms=search_terms,
             countries=countries or ["US"],
-            fields=[
-                "page_name",
-                "spend",
-                "impressions",
-                "currency",
-                "ad_delivery_start_time",
-                "ad_delivery_stop_time",
-            ],
-            max_ads=max_ads,
+            fields=SPEND_FIELDS,
+            max_ads=min(max_ads, 500),
         )
+        return spend_analysis(ads)
+
+
+class AsyncMetaAdsLibraryTool(MetaAdsLibraryTool):
+    """
+    aiohttp version of MetaAdsLibraryTool for concurrent searches.
+
+    Every network method is a coroutine; one ClientSession is reused for
+    all of them. Use as an async context manager, or call close():
+
+        async with AsyncMetaAdsLibraryTool() as tool:
+            results = await tool.search_many_competitors(["Nike", "Adidas"])
+    """
+
+    REQUEST_TIMEOUT = 30
+    MAX_CONNECTIONS = 20
+
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        self._session = None
+
+    def _build_session(self):
+        # Requests go through the aiohttp session instead
+        return None
+
+    def _get_session(self):
+        """Get or create the shared aiohttp session."""
+        if self._session is None or self._session.closed:
+            import aiohttp
+
+            self._session = aiohttp.ClientSession(
+                connector=aiohttp.TCPConnector(
+                    limit=self.MAX_CONNECTIONS,
+                    keepalive_timeout=60,
+                ),
+                timeout=aiohttp.ClientTimeout(total=self.REQUEST_TIMEOUT),
+            )
+        return self._session
+
+    async def close(self):
+        """Close the shared session."""
+        if self._session is not None:
+            await self._session.close()
+            self._session = None
+
+    def __enter__(self):
+        # close() is a coroutine here; the inherited __exit__ would drop it
+        raise TypeError("Use 'async with' with AsyncMetaAdsLibraryTool")
+
+    def __exit__(self, *exc):
+        raise TypeError("Use 'async with' with AsyncMetaAdsLibraryTool")
+
+    async def __aenter__(self):
+        return self
+
+    async def __aexit__(self, *exc):
+        await self.close()
+
+    async def _get_access_token(self) -> str:
+        """Get or refresh access token."""
+        if self.access_token:
+            return self.access_token
+
+        if self.app_id and self.app_secret:
+            # Get app access token (limited permissions)
+            url = f"{self.BASE_URL}/oauth/access_token"
+            params = {
+                "client_id": self.app_id,
+                "client_secret": self.app_secret,
+                "grant_type": "client_credentials",
+            }
+            async with self._get_session().get(url, params=params) as response:
+                if response.status == 200:
+                    data = await response.json(content_type=None)
+                    self.access_token = data.get("access_token")
+                    return self.access_token
+
+        raise Exception("No valid access token available")
+
+    async def _make_request(
+        self,
+        endpoint: str,
+        params: Dict[str, Any],
+    ) -> Dict[str, Any]:
+        """Make a request to the Meta Graph API (cached when use_cache)."""
+        url = f"{self.api_url}/{endpoint}"
+        key = _cache_key(url, params) if self.use_cache else None
+        if key is not None:
+            cached = _cache_get(key)
+            if cached is not None:
+                return cached
+
+        token = await self._get_access_token()
+        params["access_token"] = token
+
+        query = _query_pairs(params)
+
+        try:
+            for attempt in range(self.MAX_THROTTLE_RETRIES + 1):
+                await self._limiter.acquire_async()
+                async with self._get_session().get(url, params=query) as response:
+                    if response.status == 429 and attempt < self.MAX_THROTTLE_RETRIES:
+                        wait = self._limiter.throttled(response.headers.get("Retry-After"))
+                    elif response.status >= 400:
+                        error_data = {}
+                        try:
+                            error_data = await response.json(content_type=None)
+                        except Exception:
+                            pass
+                        return {
+                            "error": f"{response.status} {response.reason} for url: {url}",
+                            "details": error_data,
+                        }
+                    else:
+                        self._limiter.succeeded()
+                        result = await response.json(content_type=None)
+                        if key is not None:
+                            _cache_put(key, result)
+                        return result
+                await asyncio.sleep(wait)
+        except Exception as e:
+            return {"error": str(e)}
+
+    async def _fetch_ads_page(self, **kwargs) -> Dict[str, Any]:
+        """Fetch a single page of ads (internal helper)."""
+        result = await self._make_request("ads_archive", _ads_params(**kwargs))
 
         if "error" in result:
             return result
 
-        ads = result.get("ads", [])
+        return _format_page(result)
+
+    async def search_ads(
+        self,
+        search_terms: str = None,
+        page_ids: List[str] = None,
+        countries: List[str] = None,
+        ad_active_status: str = "ALL",
+        ad_type: str = "ALL",
+        publisher_platforms: List[str] = None,
+        limit: int = 25,
+        fields: List[str] = None,
+    ) -> Dict[str, Any]:
+        """Search the Meta Ad Library (see MetaAdsLibraryTool.search_ads)."""
+        if not self.is_configured:
+            return {"error": "Meta API not configured", "data": []}
+
+        page = await self._fetch_ads_page(
+            search_terms=search_terms,
+            page_ids=page_ids,
+            countries=countries,
+            ad_active_status=ad_active_status,
+            ad_type=ad_type,
+            publisher_platforms=publisher_platforms,
+            fields=fields,
+            limit=limit,
+        )
+
+        if "error" not in page:
+            page["searched_at"] = _utcnow_iso()
+        return page
+
+    async def search_ads_paginated(
+        self,
+        search_terms: str = None,
+        page_ids: List[str] = None,
+        countries: List[str] = None,
+        ad_active_status: str = "ALL",
+        ad_type: str = "ALL",
+        publisher_platforms: List[str] = None,
+        fields: List[str] = None,
+        max_ads: int = 100,
+        delay_between_requests: float = 0.5,
+    ) -> AsyncIterator[Dict[str, Any]]:
+        """
+        Async generator that yields ads with automatic pagination.
+
+        Same arguments as MetaAdsLibraryTool.search_ads_paginated; rate
+        limiting waits yield to the event loop instead of blocking.
+        """
+        if not self.is_configured:
+            return
+
+        if max_ads <= 0:
+            return
+
+        fetch = partial(
+            self._fetch_ads_page,
+            search_terms=search_terms,
+            page_ids=page_ids,
+            countries=countries,
+            ad_active_status=ad_active_status,
+            ad_type=ad_type,
+            publisher_platforms=publisher_platforms,
+            fields=fields,
+        )
+
+        # Page N+1 is fetched in a task while the caller consumes page N
+        task = asyncio.ensure_future(fetch(limit=min(25, max_ads), after_cursor=None))
+        ads_fetched = 0
+
+        try:
+            while task is not None:
+                result = await task
+                task = None
+
+                if "error" in result:
+                    break
+
+                ads = result.get("ads", [])
+                if not ads:
+                    break
+
+                ads = ads[:max_ads - ads_fetched]
+                ads_fetched += len(ads)
+
+                next_cursor = result.get("next_cursor")
+                if ads_fetched < max_ads and result.get("has_more") and next_cursor:
+                    task = asyncio.ensure_future(fetch(
+                        limit=min(25, max_ads - ads_fetched),
+                        after_cursor=next_cursor,
+                    ))
+
+                for ad in ads:
+                    yield ad
+        finally:
+            if task is not None:
+                task.cancel()
+
+    async def search_ads_all(
+        self,
+        search_terms: str = None,
+        page_ids: List[str] = None,
+        countries: List[str] = None,
+        ad_active_status: str = "ALL",
+        ad_type: str = "ALL",
+        publisher_platforms: List[str] = None,
+        fields: List[str] = None,
+        max_ads: int = 100,
+        delay_between_requests: float = 0.5,
+    ) -> Dict[str, Any]:
+        """Fetch all ads up to max_ads (see MetaAdsLibraryTool.search_ads_all)."""
+        if not self.is_configured:
+            return {"error": "Meta API not configured", "data": []}
+
+        # Cap max_ads at 500 to prevent excessive API calls
+        max_ads = min(max_ads, 500)
+
+        all_ads = [
+            ad async for ad in self.search_ads_paginated(
+                search_terms=search_terms,
+                page_ids=page_ids,
+                countries=countries,
+                ad_active_status=ad_active_status,
+                ad_type=ad_type,
+                publisher_platforms=publisher_platforms,
+                fields=fields,
+                max_ads=max_ads,
+                delay_between_requests=delay_between_requests,
+            )
+        ]
 
-        # Analyze spend
-        spend_data = {
-            "ads_with_spend_data": 0,
-            "total_min_spend": 0,
-            "total_max_spend": 0,
-            "currency": None,
-            "by_page": {},
-            "active_campaigns": 0,
+        return {
+            "ads": all_ads,
+            "count": len(all_ads),
+            "max_requested": max_ads,
+            "searched_at": _utcnow_iso(),
         }
 
-        for ad in ads:
-            spend = ad.get("spend")
-            if spend:
-                spend_data["ads_with_spend_data"] += 1
-                spend_data["currency"] = spend.get("currency")
+    async def get_page_ads(
+        self,
+        page_id: str,
+        countries: List[str] = None,
+        active_only: bool = True,
+        limit: int = 25,
+    ) -> Dict[str, Any]:
+        """Get all ads for a specific Facebook Page."""
+        return await self.search_ads(
+            page_ids=[page_id],
+            countries=countries,
+            ad_active_status="ACTIVE" if active_only else "ALL",
+            limit=limit,
+        )
 
-                lower = spend.get("lower_bound", 0)
-                upper = spend.get("upper_bound", 0)
+    async def search_competitor_ads(
+        self,
+        competitor_name: str,
+        countries: List[str] = None,
+        platforms: List[str] = None,
+        max_ads: int = 100,
+    ) -> Dict[str, Any]:
+        """Search for a competitor's ads by name with automatic pagination."""
+        result = await self.search_ads_all(
+            search_terms=competitor_name,
+            countries=countries or ["US"],
+            publisher_platforms=platforms,
+            ad_active_status="ALL",
+            max_ads=max_ads,
+        )
 
-                spend_data["total_min_spend"] += int(lower) if lower else 0
-                spend_data["total_max_spend"] += int(upper) if upper else 0
+        if "error" in result:
+            return result
 
-                page = ad.get("page_name", "Unknown")
-                if page not in spend_data["by_page"]:
-                    spend_data["by_page"][page] = {"min": 0, "max": 0, "ad_count": 0}
+        return competitor_analysis(competitor_name, result.get("ads", []))
 
-                spend_data["by_page"][page]["min"] += int(lower) if lower else 0
-                spend_data["by_page"][page]["max"] += int(upper) if upper else 0
-                spend_data["by_page"][page]["ad_count"] += 1
+    async def search_many_competitors(
+        self,
+        competitor_names: List[str],
+        countries: List[str] = None,
+        platforms: List[str] = None,
+        max_ads: int = 100,
+    ) -> Dict[str, Dict[str, Any]]:
+        """
+        Search several competitors concurrently.
+
+        Args:
+            competitor_names: Competitor/brand names
+            countries: Countries to search in
+            platforms: Platforms to filter
+            max_ads: Maximum ads to fetch per competitor
+
+        Returns:
+            Competitor name -> search_competitor_ads result
+        """
+        results = await asyncio.gather(*(
+            self.search_competitor_ads(
+                name,
+                countries=countries,
+                platforms=platforms,
+                max_ads=max_ads,
+            )
+            for name in competitor_names
+        ))
+        return dict(zip(competitor_names, results))
 
-            if not ad.get("ad_delivery_stop_time"):
-                spend_data["active_campaigns"] += 1
+    async def analyze_ad_creative(
+        self,
+        search_terms: str,
+        countries: List[str] = None,
+        max_ads: int = 100,
+    ) -> Dict[str, Any]:
+        """Analyze ad creative patterns for a topic/brand."""
+        result = await self.search_ads_all(
+            search_terms=search_terms,
+            countries=countries or ["US"],
+            max_ads=max_ads,
+        )
+
+        if "error" in result:
+            return result
+
+        return creative_analysis(search_terms, result.get("ads", []))
+
+    async def get_ad_spend_insights(
+        self,
+        page_ids: List[str] = None,
+        search_terms: str = None,
+        countries: List[str] = None,
+        max_ads: int = 100,
+    ) -> Dict[str, Any]:
+        """Get ad spend insights for pages or search terms."""
+        result = await self.search_ads_all(
+            page_ids=page_ids,
+            search_terms=search_terms,
+            countries=countries or ["US"],
+            fields=SPEND_FIELDS,
+            max_ads=max_ads,
+        )
+
+        if "error" in result:
+            return result
 
-        return spend_data
+        return spend_analysis(result.get("ads", []))
 
 
 # Factory function
@@ -5,10 +5,14 @@ Provides video and channel research capabilities using YouTube Data API v3.
 """
 
 import os
-from typing import Dict, Any, Optional, List
+import time
+import asyncio
+import threading
+from collections import Counter, deque
+from typing import Deque, Dict, Any, Optional, List
 from datetime import datetime
 
-from ..config import YOUTUBE_API_KEY
+from ..config import YOUTUBE_API_KEY, YOUTUBE_TIMEOUT_SECONDS
 
 
 class YouTubeTool:
@@ -22,9 +26,22 @@ class YouTubeTool:
     - Analyze video metadata for patterns
     """
 
+    # Circuit breaker shared by all instances: once more than
+    # BREAKER_MAX_FAILURES failures land within BREAKER_WINDOW_SECONDS,
+    # guarded calls are skipped for BREAKER_COOLDOWN_SECONDS.
+    BREAKER_WINDOW_SECONDS = 60.0
+    BREAKER_MAX_FAILURES = 10
+    BREAKER_COOLDOWN_SECONDS = 30.0
+
+    _failure_times: Deque[float] = deque(maxlen=20)
+    _breaker_open_until: float = 0.0
+    _breaker_lock = threading.Lock()
+
     def __init__(self, api_key: str = None):
         self.api_key = api_key or YOUTUBE_API_KEY
-        self._youtube = None
+        # googleapiclient clients (httplib2) are not thread-safe, and calls
+        # run on worker threads, so each thread builds its own
+        self._local = threading.local()
 
     @property
     def is_configured(self) -> bool:
@@ -32,14 +49,15 @@ class YouTubeTool:
         return bool(self.api_key)
 
     def _get_client(self):
-        """Get or create YouTube API client."""
-        if self._youtube is None and self.is_configured:
+        """Get or create this thread's YouTube API client."""
+        youtube = getattr(self._local, "youtube", None)
+        if youtube is None and self.is_configured:
             try:
                 from googleapiclient.discovery import build
-                self._youtube = build('youtube', 'v3', developerKey=self.api_key)
+                youtube = self._local.youtube = build('youtube', 'v3', developerKey=self.api_key)
             except ImportError:
                 raise ImportError("google-api-python-client is required for YouTube tool")
-        return self._youtube
+        return youtube
 
     def search_videos(
         self,
@@ -285,30 +303,19 @@ class YouTubeTool:
         details = self.get_video_details(video_ids)
 
         # Analyze patterns
-        total_views = 0
-        total_likes = 0
-        total_comments = 0
-        all_tags = []
-        durations = []
-        titles = []
-
-        for video in details:
-            if "error" not in video:
-                total_views += video.get('view_count', 0)
-                total_likes += video.get('like_count', 0)
-                total_comments += video.get('comment_count', 0)
-                all_tags.extend(video.get('tags', []))
-                titles.append(video.get('title', ''))
+        ok = [video for video in details if "error" not in video]
+        total_views = sum(video.get('view_count', 0) for video in ok)
+        total_likes = sum(video.get('like_count', 0) for video in ok)
+        total_comments = sum(video.get('comment_count', 0) for video in ok)
+        titles = [video.get('title', '') for video in ok]
 
         # Count tag frequency
-        tag_counts = {}
-        for tag in all_tags:
-            tag_lower = tag.lower()
-            tag_counts[tag_lower] = tag_counts.get(tag_lower, 0) + 1
-
-        top_tags = sorted(tag_counts.items(), key=lambda x: x[1], reverse=True)[:20]
+        tag_counts = Counter(
+            tag.lower() for video in ok for tag in video.get('tags', [])
+        )
+        top_tags = tag_counts.most_common(20)
 
-        video_count = len([d for d in details if "error" not in d])
+        video_count = len(ok)
 
         return {
             "query": query,
@@ -323,6 +330,57 @@ class YouTubeTool:
             "analyzed_at": datetime.utcnow().isoformat(),
         }
 
+    async def analyze_video_trends_async(
+        self,
+        query: str,
+        max_videos: int = 20,
+        timeout: float = None,
+    ) -> Dict[str, Any]:
+        """
+        Run analyze_video_trends off the event loop with a timeout and
+        circuit breaker.
+
+        Used on the research request path so a slow or rate-limited
+        YouTube API cannot stall the request. Returns an error dict (like
+        analyze_video_trends does) on timeout or while the breaker is
+        open. Only timeouts and exceptions count towards the breaker; an
+        empty search is not a failure.
+
+        Args:
+            query: Topic to analyze
+            max_videos: Number of videos to analyze
+            timeout: Seconds to wait (default YOUTUBE_TIMEOUT_SECONDS)
+
+        Returns:
+            Trend analysis, or a dict with an "error" key
+        """
+        if time.monotonic() < type(self)._breaker_open_until:
+            return {"error": "YouTube circuit breaker open", "query": query}
+
+        try:
+            return await asyncio.wait_for(
+                asyncio.to_thread(self.analyze_video_trends, query, max_videos),
+                timeout=timeout or YOUTUBE_TIMEOUT_SECONDS,
+            )
+        except asyncio.TimeoutError:
+            self._record_failure()
+            return {"error": "YouTube request timed out", "query": query}
+        except Exception as e:
+            self._record_failure()
+            return {"error": str(e), "query": query}
+
+    @classmethod
+    def _record_failure(cls):
+        """Record a failed call and open the breaker if the threshold is hit."""
+        now = time.monotonic()
+        with cls._breaker_lock:
+            cls._failure_times.append(now)
+            window_start = now - cls.BREAKER_WINDOW_SECONDS
+            recent = sum(1 for t in cls._failure_times if t >= window_start)
+            if recent > cls.BREAKER_MAX_FAILURES:
+                cls._breaker_open_until = now + cls.BREAKER_COOLDOWN_SECONDS
+                cls._failure_times.clear()
+
     def extract_video_id_from_url(self, url: str) -> Optional[str]:
         """
         Extract video ID from various YouTube URL formats.
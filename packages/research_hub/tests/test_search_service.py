@@ -0,0 +1,94 @@
+"""Tests for AdSearchService."""
+
+import asyncio
+
+import pytest
+
+
+class FakeScraper:
+    """Stands in for AdLibraryScraper; fails like Playwright's sync API inside a loop."""
+
+    def __init__(self, ads):
+        self.ads = ads
+        self.calls = []
+
+    def scrape(self, query, country="US", limit=50, media_type="all"):
+        try:
+            asyncio.get_running_loop()
+        except RuntimeError:
+            pass
+        else:
+            return {"error": "sync scrape called inside the asyncio loop"}
+        self.calls.append((query, country, limit, media_type))
+        return {"ads": self.ads}
+
+
+class FakeDownloader:
+    """Stands in for VideoDownloader.download_batch_async."""
+
+    def __init__(self):
+        self.batches = []
+
+    async def download_batch_async(self, videos, project_id="default"):
+        self.batches.append((videos, project_id))
+        return {
+            "videos": [
+                {
+                    "status": "downloaded",
+                    "video_id": f"vid-{i}",
+                    "local_path": f"/tmp/vid-{i}.mp4",
+                }
+                for i, _ in enumerate(videos)
+            ],
+        }
+
+
+def _video_ad(name, url, start_date="27 Jan 2024"):
+    return {
+        "page_name": name,
+        "status": "active",
+        "has_video": True,
+        "video_urls": [url],
+        "start_date": start_date,
+    }
+
+
+@pytest.fixture
+def service():
+    from research_hub.src.services.search_service import AdSearchService
+
+    svc = AdSearchService.__new__(AdSearchService)
+    svc.scraper = FakeScraper([
+        _video_ad("Nike", "https://video.example/1.mp4", "2 Feb 2024"),
+        _video_ad("Adidas", "https://video.example/2.mp4", "1 Jan 2024"),
+        {"page_name": "Puma", "status": "active", "has_video": False, "image_urls": ["x"]},
+    ])
+    svc.downloader = FakeDownloader()
+    svc.firestore = None
+    return svc
+
+
+class TestSearchAndDownload:
+    """search_and_download must scrape outside the event loop it runs."""
+
+    def test_sync_wrapper_downloads_found_videos(self, service):
+        result = service.search_and_download("shoes", project_id="p1", country="US", limit=5)
+
+        assert "error" not in result
+        assert service.scraper.calls == [("shoes", "US", 10, "video")]
+        assert result["videos_found"] == 2
+        assert result["downloaded"] == 2
+        assert [v["page_name"] for v in result["videos"]] == ["Nike", "Adidas"]
+
+        videos, project_id = service.downloader.batches[0]
+        assert project_id == "p1"
+        assert [v["url"] for v in videos] == [
+            "https://video.example/1.mp4",
+            "https://video.example/2.mp4",
+        ]
+
+    def test_async_version_inside_running_loop(self, service):
+        result = asyncio.run(service.search_and_download_async("shoes", limit=1))
+
+        assert "error" not in result
+        assert result["downloaded"] == 1